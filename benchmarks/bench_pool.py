@@ -0,0 +1,62 @@
+"""
+Benchmark WeKanClient throughput at different connection pool sizes.
+
+Starts the fake WeKan server with five public boards and a simulated
+latency on every request, then fans GET /api/boards out over a thread pool
+and reports requests/sec for each pool size.
+
+Usage:
+    python benchmarks/bench_pool.py [--requests N] [--workers N] [--latency MS]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from wekan.client import WeKanClient
+from wekan.testing import FakeWeKanServer
+
+
+def run(server: FakeWeKanServer, pool_size: int, requests: int, workers: int) -> float:
+    client = WeKanClient(
+        server.url,
+        token=server.login_token(),
+        pool_maxsize=pool_size,
+        pool_block=True,
+    )
+    client.get_boards()  # warm up
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda _: client.get_boards(), range(requests)))
+    elapsed = time.perf_counter() - start
+    client.session.close()
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument(
+        "--latency", type=float, default=5.0, help="Server latency in ms"
+    )
+    args = parser.parse_args()
+
+    server = FakeWeKanServer().start()
+    for i in range(5):
+        server.store.add_board(f"Board {i}", server.admin["_id"], "public")
+    server.set_behavior(latency=args.latency / 1000)
+
+    print(
+        f"{args.requests} requests, {args.workers} worker threads, "
+        f"{args.latency:g}ms server latency"
+    )
+    for pool_size in (1, 10, 50):
+        rate = run(server, pool_size, args.requests, args.workers)
+        print(f"  pool_maxsize={pool_size:<3} {rate:8.0f} req/s")
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark wekancli startup time.
+
+Runs each command in a fresh interpreter and reports the median and best
+wall time. None of the commands contact a server: 'get card' stops at the
+missing WEKAN_URL, after imports, parser construction and argument parsing,
+which is the fixed cost every command pays. Also reports, within a fresh
+process, what building the parser and parsing 'get card' costs, and what
+generating the model field help costs (only paid when that help is shown).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = [
+    ["--version"],
+    ["get", "card", "CARD_ID"],
+    ["create", "card", "--help"],
+]
+
+PARSE = """\
+import time
+from wekan.cli import cli
+start = time.perf_counter()
+cli.build_parser().parse_args(["get", "card", "CARD_ID"])
+print(time.perf_counter() - start)
+"""
+
+FIELD_HELP = """\
+import time
+import wekan.client.types
+from wekan.cli import cli
+start = time.perf_counter()
+for name in dir(cli):
+    if name.endswith("_FIELDS_HELP") or name.endswith("_FIELDS_HELP_ALL"):
+        getattr(cli, name)()
+print(time.perf_counter() - start)
+"""
+
+
+def _env() -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("WEKAN_")}
+    env["COLUMNS"] = "80"
+    return env
+
+
+def time_command(argv: list[str], runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "wekan.cli", *argv],
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def time_snippet(code: str, runs: int) -> list[float]:
+    """Run code, which prints the seconds it measured, in fresh processes."""
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=_env(),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.runs} runs per command, {sys.executable}")
+    rows = [(" ".join(argv), time_command(argv, args.runs)) for argv in COMMANDS]
+    rows.append(("(parser, get card)", time_snippet(PARSE, args.runs)))
+    rows.append(("(field help generation)", time_snippet(FIELD_HELP, args.runs)))
+    for label, times in rows:
+        print(
+            f"  {label:<28} median {statistics.median(times) * 1000:7.1f}ms"
+            f"  best {min(times) * 1000:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark validating list responses into models.
+
+Compares the per-element path (parse the body with json.loads, then
+Model.model_validate each dict in a Python loop) with one compiled
+TypeAdapter(list[Model]).validate_json over the raw bytes, as the client's
+list methods now do. Reports records/sec (best of --repeat) and the peak
+memory allocated while validating one body.
+
+Usage:
+    python benchmarks/bench_validate.py [--records N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from wekan.client import CardDetails, CardInfo
+from wekan.client.client import _list_adapter
+
+T0 = "2024-01-01T00:00:00.000Z"
+
+
+def card_info(i: int) -> dict[str, Any]:
+    return {"_id": f"card{i:06d}", "title": f"Card {i}", "description": "x" * 40}
+
+
+def card_details(i: int) -> dict[str, Any]:
+    return {
+        **card_info(i),
+        "boardId": "board0001",
+        "listId": f"list{i % 8}",
+        "swimlaneId": "swimlane01",
+        "sort": i,
+        "labelIds": ["label1", "label2"],
+        "members": ["user1"],
+        "assignees": ["user2", "user3"],
+        "dueAt": T0,
+        "customFields": [{"_id": "cf1", "value": "v"}],
+        "archived": False,
+        "createdAt": T0,
+        "modifiedAt": T0,
+        "dateLastActivity": T0,
+        "cardNumber": i,
+        "userId": "user1",
+    }
+
+
+def per_element(model: type) -> Callable[[bytes], list]:
+    return lambda body: [model.model_validate(item) for item in json.loads(body)]
+
+
+def from_bytes(model: type) -> Callable[[bytes], list]:
+    adapter = _list_adapter(model)
+    return lambda body: adapter.validate_json(body)
+
+
+def measure(validate: Callable[[bytes], list], body: bytes, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate(body)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    validate(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for model, make in ((CardInfo, card_info), (CardDetails, card_details)):
+        body = json.dumps([make(i) for i in range(args.records)]).encode()
+        print(f"{model.__name__}: {args.records} records, {len(body) / 1e6:.1f} MB")
+        paths = (("per element", per_element), ("validate_json", from_bytes))
+        for label, path in paths:
+            seconds, peak = measure(path(model), body, args.repeat)
+            print(
+                f"  {label:<14} {args.records / seconds:10.0f} records/s"
+                f"  peak {peak / 1e6:6.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
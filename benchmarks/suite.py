@@ -0,0 +1,343 @@
+"""
+Benchmark suite for the client, validation, formatting and CLI hot paths.
+
+Runs every benchmark over the same seeded synthetic data (see
+wekan.testing.dataset) and reports the median and best wall time of
+--repeat runs, after one warm-up run. --json writes the results, so a later
+run can be compared with --baseline: any benchmark whose median got slower
+than --threshold allows is reported and the suite exits with status 1.
+
+The bench_*.py scripts next to this one explore single trade-offs (pool
+sizes, validation strategies, startup phases) in more depth.
+
+Usage:
+    python benchmarks/suite.py [--filter TEXT] [--repeat N] [--json FILE]
+        [--baseline FILE] [--threshold FRACTION]
+
+    python benchmarks/suite.py --json before.json
+    (make a change)
+    python benchmarks/suite.py --baseline before.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from argparse import Namespace
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable
+
+import wekan
+from wekan.cli.handlers._helpers import (
+    _resolve_field_info,
+    coerce_value,
+    merge_fields_with_stdin,
+)
+from wekan.cli.utils import OUTPUT_FORMATS, format_output
+from wekan.client import CardDetails, WeKanClient
+from wekan.client.client import _list_adapter
+from wekan.testing import DatasetSpec, FakeWeKanServer, generate
+
+# One board, big enough that per-item costs dominate fixed overheads
+SPEC = DatasetSpec(cards=5_000, lists=8, swimlanes=3, users=10, seed=1)
+REQUESTS = 200
+FORMAT_CARDS = 1_000
+FIELDS = 5_000
+
+# A setup function returns the function to time and how many items one call
+# processes (requests, records, fields...), for the items/s column
+Setup = Callable[[], tuple[Callable[[], Any], int]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    repeat: int | None = None
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, repeat: int | None = None) -> Callable[[Setup], Setup]:
+    """Register a setup function under name (repeat overrides --repeat)."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(name, setup, repeat))
+        return setup
+
+    return register
+
+
+# Shared data
+
+
+@cache
+def _server() -> FakeWeKanServer:
+    return FakeWeKanServer(generate(SPEC)).start()
+
+
+@cache
+def _client() -> WeKanClient:
+    server = _server()
+    return WeKanClient(server.url, token=server.login_token())
+
+
+@cache
+def _board_id() -> str:
+    (board_id,) = _server().store.collections["boards"]
+    return board_id
+
+
+@cache
+def _card_docs() -> list[dict[str, Any]]:
+    """Every card as GET /api/cards/{cardId} returns it (fresh dicts)."""
+    return json.loads(json.dumps(_server().store.find("cards")))
+
+
+@cache
+def _cards() -> list[CardDetails]:
+    return [CardDetails.model_validate(doc) for doc in _card_docs()[:FORMAT_CARDS]]
+
+
+# Client against the fake server, without simulated latency: the time is
+# the client's own per-request cost plus the local round trip
+
+
+@benchmark("client.get_lists")
+def _get_lists():
+    client, board_id = _client(), _board_id()
+    return lambda: [client.get_lists(board_id) for _ in range(REQUESTS)], REQUESTS
+
+
+@benchmark("client.get_card_by_id")
+def _get_card_by_id():
+    client = _client()
+    card_ids = [doc["_id"] for doc in _card_docs()[:REQUESTS]]
+    return lambda: [client.get_card_by_id(c) for c in card_ids], REQUESTS
+
+
+@benchmark("client.get_cards")
+def _get_cards():
+    client, board_id = _client(), _board_id()
+    # The fullest list, so the response is a long array
+    list_ids = [doc["listId"] for doc in _card_docs() if not doc["archived"]]
+    list_id = max(set(list_ids), key=list_ids.count)
+    return lambda: client.get_cards(board_id, list_id), list_ids.count(list_id)
+
+
+# Validation
+
+
+@benchmark("validate.card_details")
+def _validate_card_details():
+    docs = _card_docs()
+    return lambda: [CardDetails.model_validate(doc) for doc in docs], len(docs)
+
+
+@benchmark("validate.card_details_json")
+def _validate_card_details_json():
+    body = json.dumps(_card_docs()).encode()
+    adapter = _list_adapter(CardDetails)
+    return lambda: adapter.validate_json(body), len(_card_docs())
+
+
+# Output formatting
+
+
+def _format(fmt: str) -> Setup:
+    def setup():
+        cards = _cards()
+        return lambda: format_output(cards, fmt), len(cards)
+
+    return setup
+
+
+for _fmt in OUTPUT_FORMATS:
+    benchmark(f"format.{_fmt}")(_format(_fmt))
+
+
+# -f field handling
+
+
+@benchmark("fields.merge")
+def _merge_fields():
+    # Known fields plus unknown keys, which fall back to scanning every
+    # model field for a matching edit_key
+    names = list(CardDetails.model_fields)
+    fields = {
+        (names[i] if i < len(names) else f"field{i}"): str(i) for i in range(FIELDS)
+    }
+    args = Namespace(use_json=False, fields=fields)
+    return lambda: merge_fields_with_stdin(args, CardDetails), FIELDS
+
+
+@benchmark("fields.coerce_value")
+def _coerce_value():
+    samples = ["12", "true", "a,b,c", '["x", "y"]', "null", "2024-01-01", "text"]
+    infos = [_resolve_field_info(CardDetails, n) for n in CardDetails.model_fields]
+    pairs = [
+        (samples[i % len(samples)], infos[i % len(infos)]) for i in range(FIELDS)
+    ]
+    return lambda: [coerce_value(value, info) for value, info in pairs], FIELDS
+
+
+# CLI cold start, in a fresh interpreter without WEKAN_* settings ('get card'
+# stops at the missing WEKAN_URL, after imports and argument parsing)
+
+
+def _cold_start(*argv: str) -> Setup:
+    def setup():
+        env = {k: v for k, v in os.environ.items() if not k.startswith("WEKAN_")}
+        command = [sys.executable, "-m", "wekan.cli", *argv]
+
+        def run():
+            subprocess.run(
+                command,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+        return run, 1
+
+    return setup
+
+
+benchmark("cli.version", repeat=10)(_cold_start("--version"))
+benchmark("cli.get_card", repeat=10)(_cold_start("get", "card", "CARD_ID"))
+
+
+# Running and comparing
+
+
+def measure(bench: Benchmark, repeat: int) -> dict[str, Any]:
+    """
+    Time one benchmark
+
+    Args:
+        bench: Benchmark to run
+        repeat: Timed runs (after one warm-up run)
+
+    Returns:
+        Median and best seconds per run, items per run and every sample
+    """
+    run, items = bench.setup()
+    run()
+    samples = []
+    for _ in range(bench.repeat or repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(samples),
+        "best": min(samples),
+        "items": items,
+        "samples": samples,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any]
+) -> dict[str, float | None]:
+    """
+    Compare results with a baseline run
+
+    Args:
+        baseline: "results" of an earlier --json file
+        results: Results of this run
+
+    Returns:
+        Relative change of the median by benchmark name; None when the
+        baseline has no comparable result (missing, or a different size)
+    """
+    changes: dict[str, float | None] = {}
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None or before["items"] != result["items"]:
+            changes[name] = None
+        else:
+            changes[name] = result["median"] / before["median"] - 1
+    return changes
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "wekan": wekan.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains TEXT"
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--json", metavar="FILE", help="Write the results to FILE")
+    parser.add_argument(
+        "--baseline", metavar="FILE", help="Compare with results written by --json"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown of the median that fails --baseline (default: 0.2, 20%%)",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    selected = [b for b in BENCHMARKS if args.filter in b.name]
+    print(f"{len(selected)} benchmarks, {sys.executable}")
+    results = {}
+    try:
+        for bench in selected:
+            result = results[bench.name] = measure(bench, args.repeat)
+            print(
+                f"  {bench.name:<28} median {result['median'] * 1000:9.2f}ms"
+                f"  best {result['best'] * 1000:9.2f}ms"
+                f"  {result['items'] / result['median']:11.0f} items/s"
+            )
+    finally:
+        if _server.cache_info().currsize:
+            _server().stop()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"environment": _environment(), "results": results}, f, indent=2
+            )
+
+    if baseline is None:
+        return
+    print(f"Compared with {args.baseline} (threshold +{args.threshold:.0%}):")
+    regressions = []
+    for name, change in compare(baseline, results).items():
+        if change is None:
+            print(f"  {name:<28} no comparable baseline")
+            continue
+        slower = change > args.threshold
+        if slower:
+            regressions.append(name)
+        print(f"  {name:<28} {change:+7.1%}{'  REGRESSION' if slower else ''}")
+    if regressions:
+        print(f"{len(regressions)} regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
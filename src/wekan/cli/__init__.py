@@ -1,3 +1,23 @@
-from .cli import main
+import os
+import sys
+import time
+from typing import Sequence
+
+# When wekancli started loading, for the startup phase of --profile
+STARTED = time.perf_counter()
 
 __all__ = ["main"]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point; forwards to a running daemon when WEKAN_DAEMON is set."""
+    if os.environ.get("WEKAN_DAEMON", "").lower() not in ("", "0", "false", "no"):
+        from .thin import run_remote
+
+        status = run_remote(sys.argv[1:] if argv is None else argv)
+        if status is not None:
+            sys.exit(status)
+
+    from .cli import main as run_local
+
+    run_local(argv)
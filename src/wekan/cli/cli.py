@@ -3,65 +3,19 @@ WeKan CLI - Command line interface for WeKan REST API
 """
 
 import argparse
-import os
+import contextlib
+import functools
 import sys
-from typing import Any, Sequence
-
-from pydantic import ValidationError
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from .. import __version__
-from ..client import (
-    BoardDetails,
-    CardDetails,
-    ChecklistDetails,
-    ChecklistItemDetails,
-    Color,
-    CommentDetails,
-    ListDetails,
-    SwimlaneDetails,
-    WeKanAPIError,
-    WeKanClient,
-    WeKanModel,
-)
-from .handlers import (
-    handle_api,
-    handle_archive_card,
-    handle_create_board,
-    handle_create_card,
-    handle_create_checklist,
-    handle_create_checklist_item,
-    handle_create_comment,
-    handle_create_label,
-    handle_create_list,
-    handle_create_swimlane,
-    handle_delete_board,
-    handle_delete_card,
-    handle_delete_checklist,
-    handle_delete_checklist_item,
-    handle_delete_comment,
-    handle_delete_list,
-    handle_delete_swimlane,
-    handle_edit_card,
-    handle_edit_checklist_item,
-    handle_get_board,
-    handle_get_card,
-    handle_get_checklist,
-    handle_get_checklist_item,
-    handle_get_comment,
-    handle_get_list,
-    handle_get_swimlane,
-    handle_get_user,
-    handle_list_boards,
-    handle_list_cards,
-    handle_list_checklists,
-    handle_list_comments,
-    handle_list_labels,
-    handle_list_lists,
-    handle_list_swimlanes,
-    handle_list_users,
-    handle_login,
-)
-from .utils import resolve_env
+from ..client.paths import cache_dir
+from . import profile
+from .utils import OUTPUT_FORMATS, record_request_stats, request_stats, resolve_env
+
+if TYPE_CHECKING:
+    from ..client import WeKanClient
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -86,8 +40,28 @@ class KeyValueAction(argparse.Action):
         setattr(namespace, self.dest, fields)
 
 
-def create_client(args: argparse.Namespace) -> WeKanClient:
+def _handler(name: str) -> Callable[..., None]:
+    """Return a stand-in for handlers.<name> that imports the handlers on call."""
+
+    def handler(*args: Any) -> None:
+        from . import handlers
+
+        getattr(handlers, name)(*args)
+
+    handler.__name__ = handler.__qualname__ = name
+    return handler
+
+
+# Authenticated clients kept for reuse by a long-running process (the daemon),
+# keyed by everything create_client() builds them from. None disables reuse.
+warm_clients: "dict[tuple, WeKanClient] | None" = None
+_warm_clients_lock = threading.Lock()
+
+
+def create_client(args: argparse.Namespace) -> "WeKanClient":
     """Create and authenticate a WeKanClient from parsed args."""
+    from ..client import CardLocationIndex, RateLimiter, TokenCache, WeKanClient
+
     url = resolve_env(getattr(args, "url", None), "URL")
     username = resolve_env(getattr(args, "username", None), "USERNAME")
     password = resolve_env(getattr(args, "password", None), "PASSWORD")
@@ -100,14 +74,73 @@ def create_client(args: argparse.Namespace) -> WeKanClient:
         )
         sys.exit(1)
 
-    client = WeKanClient(url, username, password, token)
+    read_rate = resolve_env(getattr(args, "rate_limit", None), "RATE_LIMIT")
+    write_rate = resolve_env(
+        getattr(args, "write_rate_limit", None), "WRITE_RATE_LIMIT"
+    )
+    no_index = getattr(args, "no_index", False)
+    debug = resolve_env(None, "DEBUG")
+    key = (
+        url,
+        username,
+        password,
+        token,
+        read_rate,
+        write_rate,
+        no_index,
+        debug,
+        cache_dir(),
+    )
+    if warm_clients is not None:
+        with _warm_clients_lock:
+            if key in warm_clients:
+                return warm_clients[key]
+
+    rate_limiter = None
+    if read_rate or write_rate:
+        # File-backed so concurrent wekancli processes share one budget
+        rate_limiter = RateLimiter.create(
+            read_rate=float(read_rate) if read_rate else None,
+            write_rate=float(write_rate) if write_rate else None,
+            path=cache_dir() / "ratelimit.json",
+            key=url,
+        )
+
+    card_index = None
+    if not no_index:
+        card_index = CardLocationIndex(namespace=url)
+
+    client = WeKanClient(
+        url,
+        username,
+        password,
+        token,
+        rate_limiter=rate_limiter,
+        card_index=card_index,
+        token_cache=TokenCache(),
+        after_response=[record_request_stats, profile.record_response],
+    )
 
     if not token and username and password:
-        client.login()
+        client.authenticate()
 
+    if warm_clients is not None:
+        with _warm_clients_lock:
+            client = warm_clients.setdefault(key, client)
     return client
 
 
+def add_raw_option(parser: argparse.ArgumentParser) -> None:
+    """Add --raw to a subparser of a command that prints one API response."""
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        default=False,
+        help="Print the server's JSON as received, without validating or "
+        "reformatting it (ignores --format)",
+    )
+
+
 def add_data_field_options(parser: argparse.ArgumentParser) -> None:
     """Add -f/--field and --json options to a subparser."""
     parser.add_argument(
@@ -133,12 +166,16 @@ def add_data_field_options(parser: argparse.ArgumentParser) -> None:
 
 
 def _fields_help(
-    model: type[WeKanModel], label: str, *, include_advanced: bool = False
+    model_name: str, label: str, *, include_advanced: bool = False
 ) -> str:
     """Generate a help string listing fields and descriptions from a Pydantic model."""
     import types as _types
     import typing
 
+    from ..client import WeKanModel, types
+
+    model = getattr(types, model_name)
+
     lines = [f"{label}:"]
     has_advanced = False
 
@@ -210,19 +247,69 @@ def _fields_help(
     return "\n".join(lines)
 
 
-BOARD_FIELDS_HELP = _fields_help(BoardDetails, "board edit parameters")
-LIST_FIELDS_HELP = _fields_help(ListDetails, "list edit parameters")
-SWIMLANE_FIELDS_HELP = _fields_help(SwimlaneDetails, "swimlane edit parameters")
-CARD_FIELDS_HELP = _fields_help(CardDetails, "card edit parameters")
-CARD_FIELDS_HELP_ALL = _fields_help(
-    CardDetails, "card edit parameters", include_advanced=True
+# Field help walks the models, so it is only generated when help is shown
+BOARD_FIELDS_HELP = functools.partial(
+    _fields_help, "BoardDetails", "board edit parameters"
+)
+LIST_FIELDS_HELP = functools.partial(
+    _fields_help, "ListDetails", "list edit parameters"
+)
+SWIMLANE_FIELDS_HELP = functools.partial(
+    _fields_help, "SwimlaneDetails", "swimlane edit parameters"
 )
-COMMENT_FIELDS_HELP = _fields_help(CommentDetails, "comment edit parameters")
-CHECKLIST_FIELDS_HELP = _fields_help(ChecklistDetails, "checklist edit parameters")
-CHECKLIST_ITEM_FIELDS_HELP = _fields_help(
-    ChecklistItemDetails, "checklist-item edit parameters"
+CARD_FIELDS_HELP = functools.partial(
+    _fields_help, "CardDetails", "card edit parameters"
 )
-LABEL_COLORS_HELP = "colors:\n  " + ", ".join(c.value for c in Color)
+CARD_FIELDS_HELP_ALL = functools.partial(
+    _fields_help, "CardDetails", "card edit parameters", include_advanced=True
+)
+COMMENT_FIELDS_HELP = functools.partial(
+    _fields_help, "CommentDetails", "comment edit parameters"
+)
+CHECKLIST_FIELDS_HELP = functools.partial(
+    _fields_help, "ChecklistDetails", "checklist edit parameters"
+)
+CHECKLIST_ITEM_FIELDS_HELP = functools.partial(
+    _fields_help, "ChecklistItemDetails", "checklist-item edit parameters"
+)
+
+
+def _label_colors_help() -> str:
+    from ..client import Color
+
+    return "colors:\n  " + ", ".join(c.value for c in Color)
+
+
+BATCH_HELP = """\
+operations:
+  {"action": ACTION, "type": TYPE, ARG: VALUE, ...}
+  ARG names follow the command's arguments, e.g. card_id, board_id; -f fields
+  are given as a "fields" object. An optional "id" is echoed in the result.
+
+results:
+  {"id": ..., "ok": true, "result": ...}
+  {"id": ..., "ok": false, "error": "..."}
+
+example:
+  echo '{"action": "edit", "type": "card", "card_id": "ID", "fields": {"title": "x"}}' \\
+    | wekancli batch"""
+QUERY_HELP = """\
+fields:
+  board, list, swimlane, card  IDs
+  assignee, member             user IDs
+  label                        label IDs or names
+  title                        = exact, ~ substring
+  due, start, end, received,   ISO date, now, today, tomorrow, yesterday,
+  created, modified, activity  this-week, next-week, last-week, this-month,
+                               or an offset like +3d, -2w, +12h
+  cf.FIELD_ID                  custom field value (numbers compare as numbers)
+
+operators:
+  = != (comma-separated values match any), < <= > >= (dates, custom fields),
+  ~ (substring); "none" matches a missing value
+
+example:
+  wekancli query assignee=USER_ID label=Urgent due<=this-week 'title=My Card'"""
 
 
 # ---------------------------------------------------------------------------
@@ -230,6 +317,47 @@ LABEL_COLORS_HELP = "colors:\n  " + ", ".join(c.value for c in Color)
 # ---------------------------------------------------------------------------
 
 
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser whose epilog may be a callable, called when help is shown."""
+
+    def format_help(self) -> str:
+        if callable(self.epilog):
+            self.epilog = self.epilog()
+        return super().format_help()
+
+    def parse_known_args(  # type: ignore[override]
+        self,
+        args: Sequence[str] | None = None,
+        namespace: argparse.Namespace | None = None,
+    ) -> tuple[argparse.Namespace, list[str]]:
+        args = sys.argv[1:] if args is None else list(args)
+        # Only the top-level parser has the global options
+        if "--profile" in self._option_string_actions:
+            args = self._bare_profile(args)
+        return super().parse_known_args(args, namespace)
+
+    def _bare_profile(self, args: list[str]) -> list[str]:
+        """
+        Rewrite a bare --profile among the global options as --profile=
+
+        --profile takes its FILE only as --profile=FILE, so that a bare
+        --profile does not take the action after it as the file. Arguments
+        from the action name on, and values of other options, are left
+        as they are.
+        """
+        args = list(args)
+        i = 0
+        while i < len(args) and args[i].startswith("-") and args[i] != "--":
+            if args[i] == "--profile":
+                args[i] = "--profile="
+            else:
+                action = self._option_string_actions.get(args[i])
+                if action is not None and action.nargs is None:
+                    i += 1  # Skip the option's value
+            i += 1
+        return args
+
+
 class _HelpAllAction(argparse.Action):
     """Custom action that prints help with advanced fields and exits."""
 
@@ -251,15 +379,97 @@ class _HelpAllAction(argparse.Action):
         values: str | Sequence[Any] | None,
         option_string: str | None = None,
     ) -> None:
+        epilog = parser.epilog
         parser.epilog = getattr(parser, "_help_all_epilog", None)
-        parser.print_help()
+        try:
+            parser.print_help()
+        finally:
+            # Parsers are reused by the daemon
+            parser.epilog = epilog
         parser.exit()
 
 
+class _LazyParserMap(dict):
+    """Name to parser map of _LazySubParsersAction; None marks an unbuilt parser."""
+
+    def __init__(self, subparsers: "_LazySubParsersAction"):
+        super().__init__()
+        self._subparsers = subparsers
+
+    def __getitem__(self, name: str) -> argparse.ArgumentParser:
+        parser = super().__getitem__(name)
+        if parser is None:
+            parser = self._subparsers._build(name)
+        return parser
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def values(self) -> list[argparse.ArgumentParser]:  # type: ignore[override]
+        return [self[name] for name in self]
+
+    def items(  # type: ignore[override]
+        self,
+    ) -> list[tuple[str, argparse.ArgumentParser]]:
+        return [(name, self[name]) for name in self]
+
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers whose parsers are built the first time they are used
+
+    Names and help lines are registered up front, so usage, help and
+    invalid choice errors are as if every parser existed. Looking a parser
+    up in choices (as parsing the selected action does) builds just that
+    parser; iterating choices, as help and completion generators do,
+    builds them all.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._name_parser_map = self.choices = _LazyParserMap(self)
+        self._builders: dict[str, Callable[[argparse._SubParsersAction], None]] = {}
+        self._build_lock = threading.Lock()
+
+    def add_lazy_parser(
+        self,
+        name: str,
+        build: Callable[[argparse._SubParsersAction], None],
+        help: str | None = None,
+    ) -> None:
+        """
+        Register a parser to be built on first use
+
+        Args:
+            name: Choice name
+            build: Called with this action to add the parser named name
+            help: Help line in the parent's list of choices; None hides it
+        """
+        self._builders[name] = build
+        if help is not None:
+            self._choices_actions.append(self._ChoicesPseudoAction(name, (), help))
+        dict.__setitem__(self._name_parser_map, name, None)
+
+    def add_parser(self, name: str, **kwargs: Any) -> argparse.ArgumentParser:
+        if name not in self._builders:
+            return super().add_parser(name, **kwargs)
+        if kwargs.get("prog") is None:
+            kwargs["prog"] = f"{self._prog_prefix} {name}"
+        parser = self._parser_class(**kwargs)
+        dict.__setitem__(self._name_parser_map, name, parser)
+        return parser
+
+    def _build(self, name: str) -> argparse.ArgumentParser:
+        # The daemon parses concurrently with one shared parser
+        with self._build_lock:
+            if dict.__getitem__(self._name_parser_map, name) is None:
+                self._builders[name](self)
+            return dict.__getitem__(self._name_parser_map, name)
+
+
 def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     get_parser = actions.add_parser(
         "get",
-        help="Get a a single resource",
         description="Get a single resource.",
         epilog="Run 'wekancli get TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -271,7 +481,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
         description="Get user details on the current session user.",
         help="Get current user details",
     )
-    p.set_defaults(handler=handle_get_user)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_user"))
 
     p = types.add_parser(
         "board",
@@ -279,7 +490,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
         description="Retrieve full details for a board.",
     )
     p.add_argument("board_id", metavar="BOARD_ID")
-    p.set_defaults(handler=handle_get_board)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_board"))
 
     p = types.add_parser(
         "swimlane",
@@ -288,7 +500,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("swimlane_id", metavar="SWIMLANE_ID")
-    p.set_defaults(handler=handle_get_swimlane)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_swimlane"))
 
     p = types.add_parser(
         "list",
@@ -297,7 +510,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("list_id", metavar="LIST_ID")
-    p.set_defaults(handler=handle_get_list)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_list"))
 
     p = types.add_parser(
         "card",
@@ -305,7 +519,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
         description="Retrieve full details for a card by its ID.",
     )
     p.add_argument("card_id", metavar="CARD_ID")
-    p.set_defaults(handler=handle_get_card)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_card"))
 
     p = types.add_parser(
         "comment",
@@ -314,7 +529,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("comment_id", metavar="COMMENT_ID")
-    p.set_defaults(handler=handle_get_comment)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_comment"))
 
     p = types.add_parser(
         "checklist",
@@ -323,7 +539,8 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
-    p.set_defaults(handler=handle_get_checklist)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_checklist"))
 
     p = types.add_parser(
         "checklist-item",
@@ -333,13 +550,13 @@ def _build_parser_action_get(actions: argparse._SubParsersAction) -> None:
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
     p.add_argument("item_id", metavar="ITEM_ID")
-    p.set_defaults(handler=handle_get_checklist_item)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_get_checklist_item"))
 
 
 def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
     list_parser = actions.add_parser(
         "list",
-        help="List resources",
         description="List resources, returning brief representations..",
         epilog="Run 'wekancli list TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -353,7 +570,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         epilog="This command requires Admin privileges.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    p.set_defaults(handler=handle_list_users)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_users"))
 
     p = types.add_parser(
         "boards",
@@ -363,7 +581,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p.add_argument("user_id", metavar="USER_ID", nargs="?", help="Filter by user ID")
-    p.set_defaults(handler=handle_list_boards)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_boards"))
 
     p = types.add_parser(
         "labels",
@@ -371,7 +590,7 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         description="List all labels defined on a board.",
     )
     p.add_argument("board_id", metavar="BOARD_ID")
-    p.set_defaults(handler=handle_list_labels)
+    p.set_defaults(handler=_handler("handle_list_labels"))
 
     p = types.add_parser(
         "swimlanes",
@@ -379,7 +598,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         description="List all swimlanes belonging to a board.",
     )
     p.add_argument("board_id", metavar="BOARD_ID")
-    p.set_defaults(handler=handle_list_swimlanes)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_swimlanes"))
 
     p = types.add_parser(
         "lists",
@@ -387,7 +607,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         description="List all lists belonging to a board.",
     )
     p.add_argument("board_id", metavar="BOARD_ID")
-    p.set_defaults(handler=handle_list_lists)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_lists"))
 
     p = types.add_parser(
         "cards",
@@ -400,7 +621,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
     source.add_argument(
         "--swimlane-id", metavar="SWIMLANE_ID", help="List cards in a swimlane"
     )
-    p.set_defaults(handler=handle_list_cards)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_cards"))
 
     p = types.add_parser(
         "comments",
@@ -408,7 +630,8 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         description="List all comments on a card.",
     )
     p.add_argument("card_id", metavar="CARD_ID")
-    p.set_defaults(handler=handle_list_comments)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_comments"))
 
     p = types.add_parser(
         "checklists",
@@ -416,13 +639,15 @@ def _build_parser_action_list(actions: argparse._SubParsersAction) -> None:
         description="List all checklists attached to a card.",
     )
     p.add_argument("card_id", metavar="CARD_ID")
-    p.set_defaults(handler=handle_list_checklists)
+    add_raw_option(p)
+    p.set_defaults(handler=_handler("handle_list_checklists"))
 
 
 def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
+    from ..client import Color
+
     create_parser = actions.add_parser(
         "create",
-        help="Create a new resource",
         description="Create a new resource.",
         epilog="Run 'wekancli create TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -439,19 +664,19 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     p.add_argument("title", metavar="TITLE")
     p.add_argument("owner_id", metavar="OWNER_ID")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_create_board)
+    p.set_defaults(handler=_handler("handle_create_board"))
 
     p = types.add_parser(
         "label",
         help="Add a label to a board",
         description="Add a label to the board with a name and color to a board.",
-        epilog=LABEL_COLORS_HELP,
+        epilog=_label_colors_help,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("name", metavar="NAME")
     p.add_argument("color", metavar="COLOR", choices=[c.value for c in Color])
-    p.set_defaults(handler=handle_create_label)
+    p.set_defaults(handler=_handler("handle_create_label"))
 
     p = types.add_parser(
         "swimlane",
@@ -462,7 +687,7 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("title", metavar="TITLE")
-    p.set_defaults(handler=handle_create_swimlane)
+    p.set_defaults(handler=_handler("handle_create_swimlane"))
 
     p = types.add_parser(
         "list",
@@ -473,7 +698,7 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("title", metavar="TITLE")
-    p.set_defaults(handler=handle_create_list)
+    p.set_defaults(handler=_handler("handle_create_list"))
 
     p = types.add_parser(
         "card",
@@ -493,7 +718,7 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     p.add_argument("title", metavar="TITLE")
     p.add_argument("author_id", metavar="AUTHOR_ID")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_create_card)
+    p.set_defaults(handler=_handler("handle_create_card"))
 
     p = types.add_parser(
         "comment",
@@ -505,7 +730,7 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("author_id", metavar="AUTHOR_ID")
     p.add_argument("comment", metavar="COMMENT")
-    p.set_defaults(handler=handle_create_comment)
+    p.set_defaults(handler=_handler("handle_create_comment"))
 
     p = types.add_parser(
         "checklist",
@@ -517,7 +742,7 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("title", metavar="TITLE")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_create_checklist)
+    p.set_defaults(handler=_handler("handle_create_checklist"))
 
     p = types.add_parser(
         "checklist-item",
@@ -529,13 +754,12 @@ def _build_parser_action_create(actions: argparse._SubParsersAction) -> None:
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
     p.add_argument("title", metavar="TITLE")
-    p.set_defaults(handler=handle_create_checklist_item)
+    p.set_defaults(handler=_handler("handle_create_checklist_item"))
 
 
 def _build_parser_action_edit(actions: argparse._SubParsersAction) -> None:
     edit_parser = actions.add_parser(
         "edit",
-        help="Edit an existing resource",
         description="Edit an existing resource.",
         epilog="Run 'wekancli edit TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -557,7 +781,7 @@ def _build_parser_action_edit(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("card_id", metavar="CARD_ID")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_edit_card)
+    p.set_defaults(handler=_handler("handle_edit_card"))
 
     p = types.add_parser(
         "checklist-item",
@@ -570,13 +794,12 @@ def _build_parser_action_edit(actions: argparse._SubParsersAction) -> None:
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
     p.add_argument("item_id", metavar="ITEM_ID")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_edit_checklist_item)
+    p.set_defaults(handler=_handler("handle_edit_checklist_item"))
 
 
 def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     delete_parser = actions.add_parser(
         "delete",
-        help="Delete a resource",
         description="Delete a resource.",
         epilog="Run 'wekancli delete TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -591,7 +814,7 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p.add_argument("board_id", metavar="BOARD_ID")
-    p.set_defaults(handler=handle_delete_board)
+    p.set_defaults(handler=_handler("handle_delete_board"))
 
     p = types.add_parser(
         "swimlane",
@@ -600,7 +823,7 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("swimlane_id", metavar="SWIMLANE_ID")
-    p.set_defaults(handler=handle_delete_swimlane)
+    p.set_defaults(handler=_handler("handle_delete_swimlane"))
 
     p = types.add_parser(
         "list",
@@ -609,13 +832,13 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("board_id", metavar="BOARD_ID")
     p.add_argument("list_id", metavar="LIST_ID")
-    p.set_defaults(handler=handle_delete_list)
+    p.set_defaults(handler=_handler("handle_delete_list"))
 
     p = types.add_parser(
         "card", help="Delete a card", description="Permanently delete a card."
     )
     p.add_argument("card_id", metavar="CARD_ID")
-    p.set_defaults(handler=handle_delete_card)
+    p.set_defaults(handler=_handler("handle_delete_card"))
 
     p = types.add_parser(
         "comment",
@@ -624,7 +847,7 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("comment_id", metavar="COMMENT_ID")
-    p.set_defaults(handler=handle_delete_comment)
+    p.set_defaults(handler=_handler("handle_delete_comment"))
 
     p = types.add_parser(
         "checklist",
@@ -633,7 +856,7 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     )
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
-    p.set_defaults(handler=handle_delete_checklist)
+    p.set_defaults(handler=_handler("handle_delete_checklist"))
 
     p = types.add_parser(
         "checklist-item",
@@ -643,13 +866,12 @@ def _build_parser_action_delete(actions: argparse._SubParsersAction) -> None:
     p.add_argument("card_id", metavar="CARD_ID")
     p.add_argument("checklist_id", metavar="CHECKLIST_ID")
     p.add_argument("item_id", metavar="ITEM_ID")
-    p.set_defaults(handler=handle_delete_checklist_item)
+    p.set_defaults(handler=_handler("handle_delete_checklist_item"))
 
 
 def _build_parser_action_archive(actions: argparse._SubParsersAction) -> None:
     archive_parser = actions.add_parser(
         "archive",
-        help="Archive a resource",
         description="Archive a resource (use --restore to unarchive).",
         epilog="Run 'wekancli archive TYPE --help' for type-specific arguments.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -668,41 +890,121 @@ def _build_parser_action_archive(actions: argparse._SubParsersAction) -> None:
         description="Archive or restore a card.",
     )
     p.add_argument("card_id", metavar="CARD_ID")
-    p.set_defaults(handler=handle_archive_card)
+    p.set_defaults(handler=_handler("handle_archive_card"))
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="wekancli",
-        description="WeKan CLI - Kanban board management",
-        epilog="Run 'wekancli ACTION --help' for action-specific types and arguments.",
+def _build_parser_action_batch(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser(
+        "batch",
+        description="Run one operation per stdin line over a single "
+        "authenticated connection and write one JSON result line per "
+        "operation to stdout, in input order.",
+        epilog=BATCH_HELP,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument(
-        "--version", action="version", version=f"wekancli {__version__}"
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Operations run concurrently (default: 1, strictly in order)",
     )
-    parser.add_argument(
-        "--format",
-        dest="format",
-        choices=["json", "json-pretty", "text"],
-        default=None,
-        help="Output format (default: json, env: WEKAN_OUTPUT_FORMAT)",
+    p.set_defaults(handler=_handler("handle_batch"))
+
+
+def _build_parser_action_daemon(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser(
+        "daemon",
+        description="Listen on a Unix socket and run commands sent by wekancli "
+        "processes started with WEKAN_DAEMON=1, reusing one authenticated "
+        "connection per server and credentials. Runs until interrupted.",
+    )
+    p.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Socket path (default: daemon.sock in the cache directory, "
+        "env: WEKAN_DAEMON_SOCKET)",
     )
+    p.add_argument(
+        "--stop", action="store_true", default=False, help="Stop a running daemon"
+    )
+    p.set_defaults(handler=_handler("handle_daemon"), offline=True)
 
-    conn = parser.add_argument_group("connection options")
-    conn.add_argument(
-        "--url", metavar="URL", help="WeKan instance URL (env: WEKAN_URL)"
+
+def _build_parser_action_sync(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser(
+        "sync",
+        description="Copy boards, swimlanes, lists, cards, comments and "
+        "checklists into a local SQLite database. Only new or changed "
+        "entities are re-fetched.",
     )
-    conn.add_argument(
-        "--username", metavar="USER", help="Username (env: WEKAN_USERNAME)"
+    p.add_argument(
+        "--board",
+        dest="boards",
+        action="append",
+        metavar="BOARD_ID",
+        help="Sync only this board (repeatable, default: all of your boards)",
     )
-    conn.add_argument(
-        "--password", metavar="PASS", help="Password (env: WEKAN_PASSWORD)"
+    p.add_argument(
+        "--full",
+        action="store_true",
+        default=False,
+        help="Re-fetch everything instead of only changed entities",
     )
-    conn.add_argument("--token", metavar="TOKEN", help="Auth token (env: WEKAN_TOKEN)")
+    p.add_argument(
+        "--db",
+        metavar="PATH",
+        help="Mirror database (default: a per-server file in the cache directory)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Concurrent requests (default: connection pool size)",
+    )
+    p.set_defaults(handler=_handler("handle_sync"))
+
+
+def _build_parser_action_query(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser(
+        "query",
+        description="Find cards in the local mirror (see 'wekancli sync') "
+        "without contacting the server. All terms must match.",
+        epilog=QUERY_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p.add_argument("query", nargs="*", metavar="TERM", help="FIELD OP VALUE")
+    p.add_argument(
+        "--sort",
+        default="title",
+        metavar="FIELD",
+        help="Sort by title or a date field, prefix with - to reverse "
+        "(default: title)",
+    )
+    p.add_argument("--limit", type=int, metavar="N", help="Return at most N cards")
+    p.add_argument("--db", metavar="PATH", help="Mirror database (default: per server)")
+    p.set_defaults(handler=_handler("handle_query"), offline=True)
+
+
+def _build_parser_action_search(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser(
+        "search",
+        description="Search card titles, descriptions, comments and checklist "
+        "items in the local mirror (see 'wekancli sync'). Every word must "
+        "match as a prefix; quote a phrase to match it exactly. Results are "
+        "ranked best first.",
+    )
+    p.add_argument("text", nargs="+", metavar="TEXT")
+    p.add_argument("--board", metavar="BOARD_ID", help="Only search this board")
+    p.add_argument(
+        "--limit", type=int, default=20, metavar="N", help="Max results (default: 20)"
+    )
+    p.add_argument("--db", metavar="PATH", help="Mirror database (default: per server)")
+    p.set_defaults(handler=_handler("handle_search"), offline=True)
+
 
-    actions = parser.add_subparsers(dest="action", title="actions", metavar="ACTION")
-    p = actions.add_parser("login", help="Authenticate and print token")
+def _build_parser_action_login(actions: argparse._SubParsersAction) -> None:
+    p = actions.add_parser("login")
     p.add_argument(
         "--username",
         metavar="USER",
@@ -715,8 +1017,10 @@ def build_parser() -> argparse.ArgumentParser:
         default=argparse.SUPPRESS,
         help="Password (env: WEKAN_PASSWORD)",
     )
-    p.set_defaults(handler=handle_login)
+    p.set_defaults(handler=_handler("handle_login"))
 
+
+def _build_parser_action_api(actions: argparse._SubParsersAction) -> None:
     p = actions.add_parser("api")
     p.add_argument(
         "--method",
@@ -726,20 +1030,116 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p.add_argument("path", nargs="*", metavar="PATH", help="API path fragments")
     add_data_field_options(p)
-    p.set_defaults(handler=handle_api)
+    p.set_defaults(handler=_handler("handle_api"))
+
+
+# Actions in help order: (name, help line, builder adding the action's parser)
+ACTIONS: list[tuple[str, str | None, Callable[[argparse._SubParsersAction], None]]] = [
+    ("login", "Authenticate and print token", _build_parser_action_login),
     # This API command invocation doesn't need to be visible to users.
     # Particularly Agentic entities.. they can't be trusted with
     # unbridled powah.
-    actions._choices_actions = [
-        a for a in actions._choices_actions if a.metavar != "api"
-    ]
+    ("api", None, _build_parser_action_api),
+    ("list", "List resources", _build_parser_action_list),
+    ("get", "Get a a single resource", _build_parser_action_get),
+    ("create", "Create a new resource", _build_parser_action_create),
+    ("edit", "Edit an existing resource", _build_parser_action_edit),
+    ("archive", "Archive a resource", _build_parser_action_archive),
+    ("delete", "Delete a resource", _build_parser_action_delete),
+    ("batch", "Run operations from JSONL on stdin", _build_parser_action_batch),
+    (
+        "daemon",
+        "Serve commands from a warm, authenticated process",
+        _build_parser_action_daemon,
+    ),
+    ("sync", "Update the local mirror database", _build_parser_action_sync),
+    ("query", "Find cards in the local mirror", _build_parser_action_query),
+    ("search", "Full-text search of the local mirror", _build_parser_action_search),
+]
 
-    _build_parser_action_list(actions)
-    _build_parser_action_get(actions)
-    _build_parser_action_create(actions)
-    _build_parser_action_edit(actions)
-    _build_parser_action_archive(actions)
-    _build_parser_action_delete(actions)
+
+def build_parser() -> argparse.ArgumentParser:
+    # Subparsers are created with the same class
+    parser = _ArgumentParser(
+        prog="wekancli",
+        description="WeKan CLI - Kanban board management",
+        epilog="Run 'wekancli ACTION --help' for action-specific types and arguments.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        # An abbreviated --profile would take the action name as its FILE
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"wekancli {__version__}"
+    )
+    parser.add_argument(
+        "--format",
+        dest="format",
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="Output format (default: json, env: WEKAN_OUTPUT_FORMAT)",
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        default=False,
+        help="Always look cards up on the server instead of the local card index",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help="Print request counts and latency percentiles per endpoint to "
+        "stderr when the command finishes",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="Run the command under cProfile and print a breakdown of its time "
+        "to stderr; --profile=FILE also saves the stats to FILE for pstats",
+    )
+    parser.add_argument(
+        "--trace-malloc",
+        action="store_true",
+        default=False,
+        help="Print peak memory and the top allocation sites to stderr",
+    )
+
+    conn = parser.add_argument_group("connection options")
+    conn.add_argument(
+        "--url", metavar="URL", help="WeKan instance URL (env: WEKAN_URL)"
+    )
+    conn.add_argument(
+        "--username", metavar="USER", help="Username (env: WEKAN_USERNAME)"
+    )
+    conn.add_argument(
+        "--password", metavar="PASS", help="Password (env: WEKAN_PASSWORD)"
+    )
+    conn.add_argument("--token", metavar="TOKEN", help="Auth token (env: WEKAN_TOKEN)")
+    conn.add_argument(
+        "--rate-limit",
+        metavar="RPS",
+        type=float,
+        help="Max read requests/sec across all wekancli processes "
+        "(env: WEKAN_RATE_LIMIT)",
+    )
+    conn.add_argument(
+        "--write-rate-limit",
+        metavar="RPS",
+        type=float,
+        help="Max write requests/sec across all wekancli processes "
+        "(env: WEKAN_WRITE_RATE_LIMIT)",
+    )
+
+    actions = parser.add_subparsers(
+        dest="action",
+        title="actions",
+        metavar="ACTION",
+        action=_LazySubParsersAction,
+    )
+    for name, help, build in ACTIONS:
+        actions.add_lazy_parser(name, build, help=help)
 
     return parser
 
@@ -749,13 +1149,17 @@ def build_parser() -> argparse.ArgumentParser:
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    run(parser, args)
+
 
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Run the command selected by parsed args, exiting non-zero on errors."""
     if args.format is None:
-        env_fmt = os.getenv("WEKAN_OUTPUT_FORMAT", "json").lower()
-        if env_fmt in ("json", "json-pretty", "text"):
+        env_fmt = (resolve_env(None, "OUTPUT_FORMAT") or "json").lower()
+        if env_fmt in OUTPUT_FORMATS:
             args.format = env_fmt
         else:
             args.format = "json"
@@ -769,11 +1173,33 @@ def main() -> None:
         parser.parse_args([args.action, "--help"])
         sys.exit(0)
 
+    with contextlib.ExitStack() as stack:
+        if args.stats:
+            from ..client import RequestStats
+
+            stats = RequestStats()
+            stack.callback(lambda: print(stats.summary(), file=sys.stderr))
+            stack.callback(request_stats.reset, request_stats.set(stats))
+        if args.profile is not None or args.trace_malloc:
+            from . import STARTED
+
+            stack.enter_context(
+                profile.CommandProfile(args.profile, args.trace_malloc, STARTED)
+            )
+        _run_handler(handler, args)
+
+
+def _run_handler(handler: Callable[..., None], args: argparse.Namespace) -> None:
+    from pydantic import ValidationError
+
+    from ..client import WeKanAPIError
+
     try:
-        if args.action == "login":
+        if args.action == "login" or getattr(args, "offline", False):
             handler(args)
         else:
-            client = create_client(args)
+            with profile.phase("auth"):
+                client = create_client(args)
             handler(client, args)
     except WeKanAPIError as e:
         print(f"Error: {e.error}", file=sys.stderr)
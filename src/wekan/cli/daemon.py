@@ -0,0 +1,163 @@
+"""
+Long-running 'wekancli daemon' that runs commands for thin clients.
+
+The daemon keeps the CLI imported and one authenticated WeKanClient (with
+its connection pool) per URL and credentials, so a forwarded command
+costs about one HTTP round trip. Commands run concurrently, each with its
+own stdout, stderr, stdin, WEKAN_* environment and working directory.
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, TextIO
+
+from ..client.env import request_env
+
+# Commands that prompt, read stdin as a stream or manage the daemon itself
+LOCAL_ACTIONS = frozenset({"login", "batch", "daemon"})
+
+# Options naming files, resolved against the working directory of the client
+PATH_OPTIONS = ("db",)
+
+
+class _ThreadLocalStream:
+    """Stand-in for sys.stdout/stderr/stdin that each thread can redirect."""
+
+    def __init__(self, default: TextIO):
+        self._default = default
+        self._local = threading.local()
+
+    def redirect(self, stream: TextIO | None) -> None:
+        self._local.stream = stream
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(getattr(self._local, "stream", None) or self._default, name)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get("shutdown"):
+            threading.Thread(target=self.server.shutdown).start()
+            response: dict[str, Any] = {"exit": 0}
+        else:
+            response = self.server.execute(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running wekancli commands sent by thin clients."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path):
+        from .cli import build_parser
+
+        self.path = path
+        # Parsing does not modify the parser, so commands can share one
+        self.parser = build_parser()
+        # Create the socket private instead of restricting it after binding,
+        # which would let other users connect in between
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def execute(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one command; return its output and exit status."""
+        from . import cli
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        stdin = io.StringIO(request.get("stdin") or "")
+        streams = (sys.stdout, sys.stderr, sys.stdin)
+        for proxy, stream in zip(streams, (stdout, stderr, stdin)):
+            if isinstance(proxy, _ThreadLocalStream):
+                proxy.redirect(stream)
+        token = request_env.set(request.get("env") or {})
+        try:
+            args = self.parser.parse_args(request.get("argv") or [])
+            # Profiling measures (and tracemalloc traces) the whole process
+            profiled = args.profile is not None or args.trace_malloc
+            if args.action in LOCAL_ACTIONS or profiled:
+                return {"fallback": True}
+            cwd = request.get("cwd")
+            for option in PATH_OPTIONS if cwd else ():
+                if getattr(args, option, None):
+                    setattr(args, option, os.path.join(cwd, getattr(args, option)))
+            cli.run(self.parser, args)
+            code = 0
+        except SystemExit as e:
+            code = _exit_status(e)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            request_env.reset(token)
+            for proxy in streams:
+                if isinstance(proxy, _ThreadLocalStream):
+                    proxy.redirect(None)
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit": code}
+
+
+def serve(path: Path) -> None:
+    """
+    Run the daemon on a Unix socket until interrupted or asked to stop
+
+    Args:
+        path: Socket path; a stale socket left by a dead daemon is replaced
+    """
+    from . import cli
+
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        finally:
+            probe.close()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    saved = (sys.stdout, sys.stderr, sys.stdin)
+    sys.stdout, sys.stderr, sys.stdin = (_ThreadLocalStream(s) for s in saved)
+    cli.warm_clients = {}
+    try:
+        with DaemonServer(path) as server:
+            print(f"wekancli daemon listening on {path}", file=sys.stderr)
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(
+                    signal.SIGTERM,
+                    lambda *_: threading.Thread(target=server.shutdown).start(),
+                )
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+    finally:
+        sys.stdout, sys.stderr, sys.stdin = saved
+        cli.warm_clients = None
+        path.unlink(missing_ok=True)
+
+
+def _exit_status(e: SystemExit) -> int:
+    """Return the status a process exiting with e would have."""
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
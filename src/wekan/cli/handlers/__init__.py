@@ -1,5 +1,6 @@
 from .api import handle_api
 from .archive import handle_archive_card
+from .batch import handle_batch
 from .create import (
     handle_create_board,
     handle_create_card,
@@ -10,6 +11,7 @@ from .create import (
     handle_create_list,
     handle_create_swimlane,
 )
+from .daemon import handle_daemon
 from .delete import (
     handle_delete_board,
     handle_delete_card,
@@ -44,10 +46,13 @@ from .list import (
     handle_list_users,
 )
 from .login import handle_login
+from .query import handle_query, handle_search
+from .sync import handle_sync
 
 __all__ = [
     "handle_api",
     "handle_archive_card",
+    "handle_batch",
     "handle_create_board",
     "handle_create_card",
     "handle_create_checklist",
@@ -56,6 +61,7 @@ __all__ = [
     "handle_create_label",
     "handle_create_list",
     "handle_create_swimlane",
+    "handle_daemon",
     "handle_delete_board",
     "handle_delete_card",
     "handle_delete_checklist",
@@ -82,4 +88,7 @@ __all__ = [
     "handle_list_swimlanes",
     "handle_list_users",
     "handle_login",
+    "handle_query",
+    "handle_search",
+    "handle_sync",
 ]
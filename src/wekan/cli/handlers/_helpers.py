@@ -5,17 +5,53 @@ Shared helpers for handler functions.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import contextvars
 import json
 import sys
 import types as _types
 import typing
-from typing import Any, NoReturn
+from typing import Any, Callable, Iterator, NoReturn, TypeVar
 
+import requests
 from pydantic.fields import FieldInfo
 
-from wekan.client import CardDetails, WeKanClient, WeKanModel
+from wekan.client import (
+    CardDetails,
+    CardLocation,
+    WeKanAPIError,
+    WeKanClient,
+    WeKanModel,
+)
 
-from ..utils import format_output
+from ..profile import memory_checkpoint
+from ..utils import format_output, iter_ndjson
+
+T = TypeVar("T")
+
+# When set, output() appends to this list instead of printing (batch mode)
+_captured: contextvars.ContextVar[list[Any] | None] = contextvars.ContextVar(
+    "captured_output", default=None
+)
+
+
+class CommandError(SystemExit):
+    """A handler failure reported by error_exit(); exits with status 1."""
+
+    def __init__(self, message: str):
+        super().__init__(1)
+        self.message = message
+
+
+@contextlib.contextmanager
+def capture_output() -> Iterator[list[Any]]:
+    """Collect what handlers output in the current context instead of printing."""
+    captured: list[Any] = []
+    token = _captured.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured.reset(token)
 
 
 def _resolve_field_info(
@@ -173,13 +209,48 @@ def merge_fields_with_stdin(
 
 def output(data: Any, fmt: str) -> None:
     """Format and print data."""
+    captured = _captured.get()
+    if captured is not None:
+        captured.append(data)
+        return
+    memory_checkpoint()
+    if fmt == "ndjson":
+        # Each record is written as soon as it is serialized, so a consumer
+        # can start on the first while the rest are still being converted
+        for line in iter_ndjson(data):
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+        return
     print(format_output(data, fmt))
 
 
+def output_raw(body: bytes) -> None:
+    """Write a JSON response body to stdout as the server sent it."""
+    captured = _captured.get()
+    if captured is not None:
+        captured.append(json.loads(body) if body else None)
+        return
+    memory_checkpoint()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(body.decode() + "\n")
+        return
+    sys.stdout.flush()
+    buffer.write(body if body.endswith(b"\n") else body + b"\n")
+    buffer.flush()
+
+
+def status(message: str) -> None:
+    """Print a status message to stderr (suppressed while output is captured)."""
+    if _captured.get() is None:
+        print(message, file=sys.stderr)
+
+
 def error_exit(message: str) -> NoReturn:
     """Print error message to stderr and exit."""
-    print(f"Error: {message}", file=sys.stderr)
-    sys.exit(1)
+    if _captured.get() is None:
+        print(f"Error: {message}", file=sys.stderr)
+    raise CommandError(message)
 
 
 def not_found(label: str) -> NoReturn:
@@ -195,6 +266,29 @@ def resolve_card(client: WeKanClient, card_id: str) -> CardDetails:
     return card
 
 
+def with_card_location(
+    client: WeKanClient, card_id: str, call: Callable[[CardLocation], T]
+) -> T:
+    """Run call with the card's location, preferring the client's card index.
+
+    An indexed location may be stale. If the server rejects it (an error
+    status, or None for a missing entity) the entry is dropped and the call
+    is retried once with the location from a fresh card lookup.
+    """
+    index = client.card_index
+    location = index.get(card_id) if index is not None else None
+    if location is not None:
+        try:
+            result = call(location)
+        except (WeKanAPIError, requests.HTTPError):
+            result = None
+        if result is not None:
+            return result
+        index.discard(card_id)
+    card = resolve_card(client, card_id)
+    return call(CardLocation(card.boardId, card.listId, card.swimlaneId))
+
+
 def not_implemented(label: str) -> NoReturn:
     """Print not-implemented message and exit."""
     error_exit(f"Not implemented: {label}")
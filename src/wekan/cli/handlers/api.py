@@ -6,16 +6,18 @@ import argparse
 
 from wekan.client import WeKanClient
 
-from ._helpers import merge_fields_with_stdin, output
+from ._helpers import merge_fields_with_stdin, output, output_raw
 
 
 def handle_api(client: WeKanClient, args: argparse.Namespace) -> None:
     """Make a raw API call and output the response."""
     path = "/".join(args.path) if args.path else ""
-    url = f"{client.base_url}/api/{path}"
     body = merge_fields_with_stdin(args) or None
-    method = args.method.lower()
-    response = getattr(client.session, method)(url, json=body, timeout=client.timeout)
-    client._check_response(response)
-    data = response.json()
-    output(data, args.format)
+    # _request takes a route template; the path is literal
+    route = "/api/" + path.replace("{", "{{").replace("}", "}}")
+    response = client._request(args.method.upper(), route, json=body)
+    if args.format == "json":
+        # The body already is JSON; pass it on without decoding it
+        output_raw(response.content)
+        return
+    output(response.json(), args.format)
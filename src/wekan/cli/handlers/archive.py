@@ -3,18 +3,24 @@ Handlers for the 'archive' action.
 """
 
 import argparse
-import sys
 
 from wekan.client import WeKanClient
 
-from ._helpers import resolve_card
+from ._helpers import status, with_card_location
 
 
 def handle_archive_card(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
     if args.restore:
-        client.restore_card(card.boardId, card.listId, args.card_id)
-        print("Restored.", file=sys.stderr)
+        with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.restore_card(loc.boardId, loc.listId, args.card_id),
+        )
+        status("Restored.")
     else:
-        client.archive_card(card.boardId, card.listId, args.card_id)
-        print("Archived.", file=sys.stderr)
+        with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.archive_card(loc.boardId, loc.listId, args.card_id),
+        )
+        status("Archived.")
@@ -0,0 +1,211 @@
+"""
+Handler for the 'batch' action (many operations from a JSONL stream).
+"""
+
+import argparse
+import concurrent.futures
+import contextvars
+import json
+import queue
+import sys
+import threading
+from typing import IO, Any
+
+from pydantic import ValidationError
+
+from wekan.client import WeKanAPIError, WeKanClient
+
+from ..utils import _to_serializable
+from ._helpers import CommandError, capture_output
+
+# Keys of an operation that select the command rather than set an argument
+COMMAND_KEYS = ("action", "type", "id")
+
+# Actions that cannot run inside a batch
+EXCLUDED_ACTIONS = frozenset({"login", "batch", "daemon"})
+
+
+def operation_args(
+    parser: argparse.ArgumentParser, op: dict[str, Any]
+) -> argparse.Namespace:
+    """
+    Build the argument namespace a command line would produce for an operation
+
+    The operation names its command with "action" (and "type" where the
+    action has types). Every other key sets the argument with that dest,
+    e.g. {"action": "edit", "type": "card", "card_id": "...", "fields": {...}}.
+
+    Args:
+        parser: The wekancli parser
+        op: Decoded operation
+
+    Returns:
+        Namespace with parser defaults overlaid by the operation's values
+    """
+    action = op.get("action")
+    if not isinstance(action, str):
+        raise ValueError("Operation needs an 'action'")
+    if action in EXCLUDED_ACTIONS:
+        raise ValueError(f"Action '{action}' is not supported in a batch")
+
+    args = parser.parse_args([])
+    current = parser
+    for name in (action, op.get("type")):
+        subparsers = _subparsers(current)
+        if subparsers is None:
+            break
+        if name is None:
+            raise ValueError(f"Operation needs a 'type' for '{action}'")
+        if name not in subparsers.choices:
+            raise ValueError(f"Unknown {subparsers.dest} '{name}'")
+        setattr(args, subparsers.dest, name)
+        current = subparsers.choices[name]
+
+    for a in current._actions:
+        if a.dest != argparse.SUPPRESS and a.default != argparse.SUPPRESS:
+            setattr(args, a.dest, a.default)
+    for key, value in current._defaults.items():
+        setattr(args, key, value)
+    for key, value in op.items():
+        if key not in COMMAND_KEYS:
+            setattr(args, key.replace("-", "_"), value)
+
+    if not hasattr(args, "handler"):
+        raise ValueError(f"Operation '{action}' does not select a command")
+    missing = [
+        a.dest
+        for a in current._actions
+        if a.required and getattr(args, a.dest, None) is None
+    ]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
+    args.format = "json"
+    args.use_json = False
+    return args
+
+
+def run_operation(
+    client: WeKanClient, parser: argparse.ArgumentParser, op: Any
+) -> dict[str, Any]:
+    """
+    Run one operation through its handler, capturing its output
+
+    Returns:
+        {"ok": true, "result": ...} or {"ok": false, "error": "..."}, plus the
+        operation's "id" when it has one
+    """
+    result: dict[str, Any] = {}
+    if isinstance(op, dict) and "id" in op:
+        result["id"] = op["id"]
+    try:
+        if not isinstance(op, dict):
+            raise ValueError("Operation must be a JSON object")
+        args = operation_args(parser, op)
+        with capture_output() as captured:
+            if getattr(args, "offline", False):
+                args.handler(args)
+            else:
+                args.handler(client, args)
+    except CommandError as e:
+        return {**result, "ok": False, "error": e.message}
+    except WeKanAPIError as e:
+        return {**result, "ok": False, "error": str(e.error)}
+    except ValidationError:
+        return {**result, "ok": False, "error": "API returned invalid response"}
+    except SystemExit as e:
+        return {**result, "ok": False, "error": f"Exited with status {e.code}"}
+    except Exception as e:
+        return {**result, "ok": False, "error": f"{e} ({type(e).__name__})"}
+    data = captured[0] if len(captured) == 1 else captured or None
+    return {**result, "ok": True, "result": _to_serializable(data)}
+
+
+def run_batch(
+    client: WeKanClient,
+    parser: argparse.ArgumentParser,
+    lines: IO[str],
+    out: IO[str],
+    workers: int = 1,
+) -> int:
+    """
+    Run JSONL operations and write one JSONL result per operation, in order
+
+    Operations are dispatched as they are read, up to ``workers`` at a
+    time, and each result is written as soon as it and every result before
+    it are done, so results stream while input is still being written.
+    Blank lines are skipped. If results cannot be written (e.g. the reader
+    went away), no further operations are started and the error is raised
+    once the running ones finish.
+
+    Returns:
+        Number of failed operations
+    """
+
+    def run(line: str) -> dict[str, Any]:
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {"ok": False, "error": f"Invalid JSON: {e}"}
+        return run_operation(client, parser, op)
+
+    failures = 0
+    error: BaseException | None = None
+    # Bounds memory when input arrives faster than operations complete
+    slots = threading.BoundedSemaphore(workers * 2)
+    ordered: queue.Queue[concurrent.futures.Future | None] = queue.Queue()
+
+    def write_results() -> None:
+        nonlocal failures, error
+        while (future := ordered.get()) is not None:
+            # After a failure, keep freeing slots so the reader never blocks
+            if error is None:
+                try:
+                    result = future.result()
+                    out.write(json.dumps(result) + "\n")
+                    out.flush()
+                    failures += not result["ok"]
+                except BaseException as e:
+                    error = e
+            slots.release()
+
+    # Results are written by their own thread so that a caller waiting for
+    # a result before sending the next operation does not deadlock
+    writer = threading.Thread(target=write_results, name="batch-writer")
+    writer.start()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for line in lines:
+                if not line.strip():
+                    continue
+                slots.acquire()
+                if error is not None:
+                    pool.shutdown(cancel_futures=True)
+                    break
+                # In the caller's context, e.g. for --stats
+                ordered.put(pool.submit(contextvars.copy_context().run, run, line))
+    finally:
+        ordered.put(None)
+        writer.join()
+    if error is not None:
+        raise error
+    return failures
+
+
+def handle_batch(client: WeKanClient, args: argparse.Namespace) -> None:
+    """Run JSONL operations from stdin over one client."""
+    from ..cli import build_parser
+
+    if args.workers < 1:
+        raise ValueError("--workers must be at least 1")
+    failures = run_batch(client, build_parser(), sys.stdin, sys.stdout, args.workers)
+    if failures:
+        sys.exit(1)
+
+
+def _subparsers(
+    parser: argparse.ArgumentParser,
+) -> argparse._SubParsersAction | None:
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return action
+    return None
@@ -6,7 +6,13 @@ import argparse
 
 from wekan.client import BoardDetails, CardDetails, ChecklistDetails, WeKanClient
 
-from ._helpers import error_exit, merge_fields_with_stdin, not_found, output
+from ._helpers import (
+    error_exit,
+    merge_fields_with_stdin,
+    not_found,
+    output,
+    with_card_location,
+)
 
 
 def handle_create_label(client: WeKanClient, args: argparse.Namespace) -> None:
@@ -46,31 +52,36 @@ def handle_create_card(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_create_comment(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = client.get_card_by_id(args.card_id)
-    if card is None:
-        not_found(f"Card {args.card_id}")
-    comment = client.create_comment(
-        card.boardId, args.card_id, args.author_id, args.comment
+    comment = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.create_comment(
+            loc.boardId, args.card_id, args.author_id, args.comment
+        ),
     )
     output(comment, args.format)
 
 
 def handle_create_checklist(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = client.get_card_by_id(args.card_id)
-    if card is None:
-        not_found(f"Card {args.card_id}")
     fields = merge_fields_with_stdin(args, ChecklistDetails)
     items = fields.pop("items", None)
-    checklist = client.create_checklist(card.boardId, args.card_id, args.title, items)
+    checklist = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.create_checklist(
+            loc.boardId, args.card_id, args.title, items
+        ),
+    )
     output(checklist, args.format)
 
 
 def handle_create_checklist_item(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = client.get_card_by_id(args.card_id)
-    if card is None:
-        not_found(f"Card {args.card_id}")
-    item = client.create_checklist_item(
-        card.boardId, args.card_id, args.checklist_id, args.title
+    item = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.create_checklist_item(
+            loc.boardId, args.card_id, args.checklist_id, args.title
+        ),
     )
     output(item, args.format)
 
@@ -0,0 +1,25 @@
+"""
+Handler for the 'daemon' action.
+"""
+
+import argparse
+from pathlib import Path
+
+from ..thin import send, socket_path
+from ._helpers import error_exit, status
+
+
+def handle_daemon(args: argparse.Namespace) -> None:
+    """Serve commands for thin clients, or stop a running daemon."""
+    from ..daemon import serve
+
+    path = Path(args.socket) if args.socket else socket_path()
+    if args.stop:
+        if send({"shutdown": True}, path) is None:
+            error_exit(f"No daemon is listening on {path}")
+        status("Stopped.")
+        return
+    try:
+        serve(path)
+    except RuntimeError as e:
+        error_exit(str(e))
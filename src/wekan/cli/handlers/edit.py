@@ -5,16 +5,36 @@ Handlers for the 'edit' action.
 import argparse
 
 from wekan.client import CardDetails, ChecklistItemDetails, WeKanClient
+from wekan.client.client import MOVE_FIELDS
 
-from ._helpers import error_exit, merge_fields_with_stdin, output, resolve_card
+from ._helpers import (
+    error_exit,
+    merge_fields_with_stdin,
+    output,
+    resolve_card,
+    with_card_location,
+)
 
 
 def handle_edit_card(client: WeKanClient, args: argparse.Namespace) -> None:
     fields = merge_fields_with_stdin(args, CardDetails)
     if not fields:
         error_exit("No fields to update. Use -f key=value or --json.")
-    card = resolve_card(client, args.card_id)
-    result = client.edit_card(card.boardId, card.listId, args.card_id, **fields)
+    if any(key in fields for key in MOVE_FIELDS):
+        # A move completes the new location from the current one, which
+        # must not come from a stale index entry
+        card = resolve_card(client, args.card_id)
+        result = client.edit_card(
+            card.boardId, card.listId, args.card_id, card=card, **fields
+        )
+    else:
+        result = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.edit_card(
+                loc.boardId, loc.listId, args.card_id, **fields
+            ),
+        )
     output(result, args.format)
 
 
@@ -22,8 +42,11 @@ def handle_edit_checklist_item(client: WeKanClient, args: argparse.Namespace) ->
     fields = merge_fields_with_stdin(args, ChecklistItemDetails)
     if not fields:
         error_exit("No fields to update. Use -f key=value or --json.")
-    card = resolve_card(client, args.card_id)
-    item = client.edit_checklist_item(
-        card.boardId, args.card_id, args.checklist_id, args.item_id, **fields
+    item = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.edit_checklist_item(
+            loc.boardId, args.card_id, args.checklist_id, args.item_id, **fields
+        ),
     )
     output(item, args.format)
@@ -6,15 +6,28 @@ import argparse
 
 from wekan.client import WeKanClient
 
-from ._helpers import not_found, output, resolve_card
+from ._helpers import not_found, output, output_raw, with_card_location
+
+
+def _output_raw(body: bytes | None, label: str) -> None:
+    if body is None:
+        not_found(label)
+    output_raw(body)
 
 
 def handle_get_user(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        _output_raw(client.get_raw("/api/user"), "User")
+        return
     result = client.get_user()
     output(result, args.format)
 
 
 def handle_get_board(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw("/api/boards/{board_id}", board_id=args.board_id)
+        _output_raw(body, "Board")
+        return
     result = client.get_board(args.board_id)
     if result is None:
         not_found("Board")
@@ -22,6 +35,14 @@ def handle_get_board(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_get_list(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw(
+            "/api/boards/{board_id}/lists/{list_id}",
+            board_id=args.board_id,
+            list_id=args.list_id,
+        )
+        _output_raw(body, "List")
+        return
     result = client.get_list(args.board_id, args.list_id)
     if result is None:
         not_found("List")
@@ -29,6 +50,14 @@ def handle_get_list(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_get_swimlane(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw(
+            "/api/boards/{board_id}/swimlanes/{swimlane_id}",
+            board_id=args.board_id,
+            swimlane_id=args.swimlane_id,
+        )
+        _output_raw(body, "Swimlane")
+        return
     result = client.get_swimlane(args.board_id, args.swimlane_id)
     if result is None:
         not_found("Swimlane")
@@ -36,6 +65,10 @@ def handle_get_swimlane(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_get_card(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw("/api/cards/{card_id}", card_id=args.card_id)
+        _output_raw(body, "Card")
+        return
     result = client.get_card_by_id(args.card_id)
     if result is None:
         not_found("Card")
@@ -43,17 +76,51 @@ def handle_get_card(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_get_checklist(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
-    result = client.get_checklist(card.boardId, args.card_id, args.checklist_id)
+    if args.raw:
+        body = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.get_raw(
+                "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}",
+                board_id=loc.boardId,
+                card_id=args.card_id,
+                checklist_id=args.checklist_id,
+            ),
+        )
+        _output_raw(body, "Checklist")
+        return
+    result = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.get_checklist(loc.boardId, args.card_id, args.checklist_id),
+    )
     if result is None:
         not_found("Checklist")
     output(result, args.format)
 
 
 def handle_get_checklist_item(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
-    result = client.get_checklist_item(
-        card.boardId, args.card_id, args.checklist_id, args.item_id
+    if args.raw:
+        body = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.get_raw(
+                "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}"
+                "/items/{item_id}",
+                board_id=loc.boardId,
+                card_id=args.card_id,
+                checklist_id=args.checklist_id,
+                item_id=args.item_id,
+            ),
+        )
+        _output_raw(body, "Checklist item")
+        return
+    result = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.get_checklist_item(
+            loc.boardId, args.card_id, args.checklist_id, args.item_id
+        ),
     )
     if result is None:
         not_found("Checklist item")
@@ -61,8 +128,24 @@ def handle_get_checklist_item(client: WeKanClient, args: argparse.Namespace) ->
 
 
 def handle_get_comment(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
-    result = client.get_comment(card.boardId, args.card_id, args.comment_id)
+    if args.raw:
+        body = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.get_raw(
+                "/api/boards/{board_id}/cards/{card_id}/comments/{comment_id}",
+                board_id=loc.boardId,
+                card_id=args.card_id,
+                comment_id=args.comment_id,
+            ),
+        )
+        _output_raw(body, "Comment")
+        return
+    result = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.get_comment(loc.boardId, args.card_id, args.comment_id),
+    )
     if result is None:
         not_found("Comment")
     output(result, args.format)
@@ -6,7 +6,7 @@ import argparse
 
 from wekan.client import WeKanClient
 
-from ._helpers import not_found, output, resolve_card
+from ._helpers import not_found, output, output_raw, with_card_location
 
 
 def handle_list_labels(client: WeKanClient, args: argparse.Namespace) -> None:
@@ -17,6 +17,13 @@ def handle_list_labels(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_list_boards(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        if args.user_id:
+            body = client.get_raw("/api/users/{user_id}/boards", user_id=args.user_id)
+        else:
+            body = client.get_raw("/api/boards")
+        output_raw(body or b"[]")
+        return
     if args.user_id:
         boards = client.get_boards_for_user(args.user_id)
     else:
@@ -25,17 +32,42 @@ def handle_list_boards(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_list_lists(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw("/api/boards/{board_id}/lists", board_id=args.board_id)
+        output_raw(body or b"[]")
+        return
     lists = client.get_lists(args.board_id)
     output(lists, args.format)
 
 
 def handle_list_swimlanes(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        body = client.get_raw(
+            "/api/boards/{board_id}/swimlanes", board_id=args.board_id
+        )
+        output_raw(body or b"[]")
+        return
     swimlanes = client.get_swimlanes(args.board_id)
     output(swimlanes, args.format)
 
 
 def handle_list_cards(client: WeKanClient, args: argparse.Namespace) -> None:
     swimlane_id = getattr(args, "swimlane_id", None)
+    if args.raw:
+        if swimlane_id:
+            body = client.get_raw(
+                "/api/boards/{board_id}/swimlanes/{swimlane_id}/cards",
+                board_id=args.board_id,
+                swimlane_id=swimlane_id,
+            )
+        else:
+            body = client.get_raw(
+                "/api/boards/{board_id}/lists/{list_id}/cards",
+                board_id=args.board_id,
+                list_id=args.list_id,
+            )
+        output_raw(body or b"[]")
+        return
     if swimlane_id:
         cards = client.get_swimlane_cards(args.board_id, swimlane_id)
     else:
@@ -44,17 +76,50 @@ def handle_list_cards(client: WeKanClient, args: argparse.Namespace) -> None:
 
 
 def handle_list_users(client: WeKanClient, args: argparse.Namespace) -> None:
+    if args.raw:
+        output_raw(client.get_raw("/api/users") or b"[]")
+        return
     users = client.get_users()
     output(users, args.format)
 
 
 def handle_list_comments(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
-    comments = client.get_comments(card.boardId, args.card_id)
+    if args.raw:
+        body = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.get_raw(
+                "/api/boards/{board_id}/cards/{card_id}/comments",
+                board_id=loc.boardId,
+                card_id=args.card_id,
+            ),
+        )
+        output_raw(body or b"[]")
+        return
+    comments = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.get_comments(loc.boardId, args.card_id),
+    )
     output(comments, args.format)
 
 
 def handle_list_checklists(client: WeKanClient, args: argparse.Namespace) -> None:
-    card = resolve_card(client, args.card_id)
-    checklists = client.get_checklists(card.boardId, args.card_id)
+    if args.raw:
+        body = with_card_location(
+            client,
+            args.card_id,
+            lambda loc: client.get_raw(
+                "/api/boards/{board_id}/cards/{card_id}/checklists",
+                board_id=loc.boardId,
+                card_id=args.card_id,
+            ),
+        )
+        output_raw(body or b"[]")
+        return
+    checklists = with_card_location(
+        client,
+        args.card_id,
+        lambda loc: client.get_checklists(loc.boardId, args.card_id),
+    )
     output(checklists, args.format)
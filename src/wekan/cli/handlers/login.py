@@ -6,7 +6,7 @@ import argparse
 import getpass
 import sys
 
-from ...client import WeKanClient
+from ...client import TokenCache, WeKanClient
 from ..utils import resolve_env
 
 
@@ -49,6 +49,7 @@ def handle_login(args: argparse.Namespace) -> None:
     if not password:
         password = getpass.getpass("Password: ")
 
-    client = WeKanClient(url, username, password)
+    # Cached, so later commands with the same credentials reuse the token
+    client = WeKanClient(url, username, password, token_cache=TokenCache())
     client.login()
     display_login_info(client)
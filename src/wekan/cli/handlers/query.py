@@ -0,0 +1,54 @@
+"""
+Handlers for the 'query' and 'search' actions (offline lookups in the local mirror).
+"""
+
+import argparse
+import sys
+
+from wekan.mirror import Mirror, default_mirror_path
+
+from ..utils import resolve_env
+from ._helpers import output
+
+
+def mirror_path(args: argparse.Namespace) -> str:
+    """Return the mirror database selected by --db or the server URL."""
+    if args.db:
+        return args.db
+    url = resolve_env(getattr(args, "url", None), "URL")
+    if not url:
+        print(
+            "Error: WeKan URL or --db required. Use --url or set WEKAN_URL.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return str(default_mirror_path(url))
+
+
+def handle_query(args: argparse.Namespace) -> None:
+    """Output mirrored cards matching a query, without contacting the server."""
+    with Mirror(mirror_path(args)) as mirror:
+        # One term per argument: the shell has already split and unquoted them
+        cards = mirror.query(args.query, order_by=args.sort, limit=args.limit)
+    output(cards, args.format)
+
+
+def handle_search(args: argparse.Namespace) -> None:
+    """Output mirrored cards matching search text, best match first."""
+    with Mirror(mirror_path(args)) as mirror:
+        # Arguments the shell kept together (containing spaces) are phrases
+        hits = mirror.search(args.text, limit=args.limit, board_id=args.board)
+    output(
+        [
+            {
+                "cardId": hit.card.cardId,
+                "boardId": hit.card.boardId,
+                "listId": hit.card.listId,
+                "title": hit.card.title,
+                "score": round(hit.score, 3),
+                "snippet": hit.snippet,
+            }
+            for hit in hits
+        ],
+        args.format,
+    )
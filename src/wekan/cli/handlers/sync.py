@@ -0,0 +1,28 @@
+"""
+Handler for the 'sync' action (local mirror).
+"""
+
+import argparse
+import sys
+
+from wekan.client import WeKanClient
+from wekan.mirror import Mirror, sync
+
+from ._helpers import output
+from .query import mirror_path
+
+
+def handle_sync(client: WeKanClient, args: argparse.Namespace) -> None:
+    """Update the local mirror database and output sync statistics."""
+    path = mirror_path(args)
+    with Mirror(path) as mirror:
+        stats = sync(
+            client,
+            mirror,
+            board_ids=args.boards,
+            full=args.full,
+            max_workers=args.workers,
+        )
+    output({"database": path, **stats.as_dict()}, args.format)
+    if stats.errors:
+        sys.exit(1)
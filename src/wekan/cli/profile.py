@@ -0,0 +1,233 @@
+"""
+--profile and --trace-malloc: where a command's time and memory go
+
+--profile runs the command under cProfile and splits its wall time into
+phases: startup (loading wekancli, including modules first imported by the
+command, and parsing arguments), auth (creating and logging in the
+client), network wait (time with at least one request in flight),
+validation (pydantic), serialization (format_output) and output (writing
+it). Imports, validation, serialization and output are read from the
+profile, which only covers the main thread and inflates Python-heavy
+phases with its own overhead. Phases can overlap a little, e.g. when a
+module is first imported while a request is in flight.
+
+--trace-malloc reports the peak traced memory and the lines that had
+allocated the most when output started, while the result was still alive.
+"""
+
+import contextvars
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    from ..client import ResponseEvent
+
+PHASES = ("startup", "auth", "network wait", "validation", "serialization", "output")
+
+# pydantic-core methods whose time counts as validation
+_VALIDATOR = "of 'pydantic_core._pydantic_core.SchemaValidator' objects>"
+# Importing a module, as the profile names it (file, function)
+_IMPORT = ("<frozen importlib._bootstrap>", "_find_and_load")
+
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 10
+
+_current: "contextvars.ContextVar[CommandProfile | None]" = contextvars.ContextVar(
+    "command_profile", default=None
+)
+
+
+def record_response(event: "ResponseEvent") -> None:
+    """After-response hook adding a request to the running profile."""
+    profile = _current.get()
+    if profile is not None:
+        end = time.perf_counter()
+        profile.requests.append((end - event.duration, end))
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as a phase of the running profile, if any."""
+    profile = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            end = time.perf_counter()
+            profile.phases[name] = profile.phases.get(name, 0.0) + end - start
+            profile.phase_ends[name] = end
+
+
+def memory_checkpoint() -> None:
+    """Take the allocation snapshot for --trace-malloc, once per command."""
+    profile = _current.get()
+    if profile is not None and profile.trace_malloc and profile.snapshot is None:
+        import tracemalloc
+
+        start = time.perf_counter()
+        profile.snapshot = tracemalloc.take_snapshot()
+        # Not part of the command's output time
+        profile.overhead += time.perf_counter() - start
+
+
+def _union(intervals: list[tuple[float, float]]) -> float:
+    """Total length covered by possibly overlapping intervals."""
+    total, covered = 0.0, float("-inf")
+    for start, end in sorted(intervals):
+        start = max(start, covered)
+        if end > start:
+            total += end - start
+            covered = end
+    return total
+
+
+def _cumulative(stats: "pstats.Stats", *functions: Callable[..., Any]) -> float:
+    """Cumulative seconds spent in the given Python functions."""
+    total = 0.0
+    for func in functions:
+        code = func.__code__
+        entry = stats.stats.get(  # type: ignore[attr-defined]
+            (code.co_filename, code.co_firstlineno, code.co_name)
+        )
+        total += entry[3] if entry else 0.0
+    return total
+
+
+def _total(stats: "pstats.Stats", match: Callable[[str, str], bool]) -> float:
+    """Cumulative seconds spent in functions whose (file, name) match."""
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    return sum(entry[3] for (file, _, name), entry in entries if match(file, name))
+
+
+class CommandProfile:
+    """
+    Profile of one command, active while used as a context manager
+
+    Args:
+        path: File to write the cProfile stats to ("" prints the top
+            functions instead); None leaves cProfile off
+        trace_malloc: Trace allocations with tracemalloc
+        started: perf_counter() when wekancli started loading, for the
+            startup phase
+    """
+
+    def __init__(
+        self, path: str | None, trace_malloc: bool = False, started: float | None = None
+    ):
+        self.path = path
+        self.trace_malloc = trace_malloc
+        self.started = started
+        self.phases: dict[str, float] = {}
+        self.phase_ends: dict[str, float] = {}
+        self.requests: list[tuple[float, float]] = []
+        self.snapshot: "tracemalloc.Snapshot | None" = None
+        # Seconds the profile itself took within the command
+        self.overhead = 0.0
+        self._profiler: "cProfile.Profile | None" = None
+
+    def __enter__(self) -> "CommandProfile":
+        if self.trace_malloc:
+            import tracemalloc
+
+            tracemalloc.start()
+        if self.path is not None:
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+        self._token = _current.set(self)
+        self._start = time.perf_counter()
+        if self._profiler is not None:
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+        self._end = time.perf_counter()
+        _current.reset(self._token)
+        if self.trace_malloc:
+            self._report_memory()
+        if self._profiler is not None:
+            self._report_profile()
+
+    def breakdown(self, stats: "pstats.Stats") -> dict[str, float]:
+        """
+        Split the command's wall time into phases
+
+        Args:
+            stats: The command's cProfile statistics
+
+        Returns:
+            Seconds by phase (see PHASES), then "other" and "total"
+        """
+        helpers = sys.modules.get("wekan.cli.handlers._helpers")
+        utils = sys.modules["wekan.cli.utils"]
+        auth_end = self.phase_ends.get("auth", self._start)
+        startup = self._start - self.started if self.started else 0.0
+        phases = {
+            # Cumulative time counts nested imports once
+            "startup": startup + _total(stats, lambda *key: key == _IMPORT),
+            "auth": self.phases.get("auth", 0.0),
+            # Requests during auth are part of it
+            "network wait": _union([r for r in self.requests if r[1] > auth_end]),
+            "validation": _total(stats, lambda _, name: name.endswith(_VALIDATOR)),
+            "serialization": _cumulative(stats, utils.format_output, utils.iter_ndjson),
+        }
+        # Output includes the serialization it triggers
+        written = 0.0
+        if helpers is not None:
+            written = _cumulative(stats, helpers.output, helpers.output_raw)
+        phases["output"] = max(written - phases["serialization"] - self.overhead, 0.0)
+        command = self._end - self._start - self.overhead
+        accounted = sum(phases.values()) - startup
+        phases["other"] = max(command - accounted, 0.0)
+        phases["total"] = startup + command
+        return phases
+
+    def _report_profile(self) -> None:
+        import pstats
+
+        stats = pstats.Stats(self._profiler, stream=sys.stderr)
+        print("Phases (wall time):", file=sys.stderr)
+        requests = len(self.requests)
+        for name, seconds in self.breakdown(stats).items():
+            note = f"  ({requests} requests)" if name == "network wait" else ""
+            print(f"  {name:<14} {seconds * 1000:9.1f}ms{note}", file=sys.stderr)
+        if self.path:
+            stats.dump_stats(self.path)
+            print(
+                f"Profile written to {self.path} (python -m pstats {self.path})",
+                file=sys.stderr,
+            )
+        else:
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+    def _report_memory(self) -> None:
+        import tracemalloc
+
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = self.snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        # Module code is not what a command's data costs
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        print(f"Peak traced memory: {peak / 1e6:.1f} MB", file=sys.stderr)
+        print("Top allocation sites at output:", file=sys.stderr)
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            print(
+                f"  {stat.size / 1e6:8.2f} MB {stat.count:8} blocks  "
+                f"{frame.filename}:{frame.lineno}",
+                file=sys.stderr,
+            )
@@ -0,0 +1,76 @@
+"""
+Thin client for a running 'wekancli daemon'.
+
+Imports only the standard library and wekan.client.paths, so that
+forwarding a command does not pay for importing pydantic, requests or the
+full CLI.
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Sequence
+
+from ..client.paths import cache_dir
+
+
+def socket_path() -> Path:
+    """Return the daemon socket (env: WEKAN_DAEMON_SOCKET)."""
+    path = os.environ.get("WEKAN_DAEMON_SOCKET")
+    if path:
+        return Path(path)
+    return cache_dir() / "daemon.sock"
+
+
+def send(request: dict[str, Any], path: Path | None = None) -> dict[str, Any] | None:
+    """Send one request to the daemon; None if no daemon is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path or socket_path()))
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def run_remote(argv: Sequence[str]) -> int | None:
+    """
+    Run a command in the daemon and replay its output
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        The command's exit status, or None when it must run locally (no
+        daemon is listening, or the command is not run by the daemon)
+    """
+    request: dict[str, Any] = {
+        "argv": list(argv),
+        "env": {
+            k: v
+            for k, v in os.environ.items()
+            if k.startswith("WEKAN_") or k == "XDG_CACHE_HOME"
+        },
+        "cwd": os.getcwd(),
+    }
+    if "--json" in argv:
+        request["stdin"] = sys.stdin.read()
+    try:
+        response = send(request)
+    except (OSError, ValueError) as e:
+        # The command may have run; running it again locally could repeat a write
+        print(f"Error: lost connection to wekancli daemon: {e}", file=sys.stderr)
+        return 1
+    if response is None or response.get("fallback"):
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("exit", 1))
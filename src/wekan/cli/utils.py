@@ -4,9 +4,30 @@ Utility functions for WeKan CLI.
 
 from __future__ import annotations
 
+import contextvars
 import json
-import os
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
+
+from ..client.env import getenv
+
+if TYPE_CHECKING:
+    from ..client import RequestStats, ResponseEvent
+
+# Values of --format and WEKAN_OUTPUT_FORMAT
+OUTPUT_FORMATS = ("json", "json-pretty", "ndjson", "text")
+
+# Statistics of the running command's requests (--stats); a context variable
+# because the daemon's commands run concurrently and share warm clients
+request_stats: "contextvars.ContextVar[RequestStats | None]" = contextvars.ContextVar(
+    "request_stats", default=None
+)
+
+
+def record_request_stats(event: "ResponseEvent") -> None:
+    """After-response hook adding a request to the command's request_stats."""
+    stats = request_stats.get()
+    if stats is not None:
+        stats.record(event)
 
 
 def _to_serializable(data: Any) -> Any:
@@ -18,18 +39,34 @@ def _to_serializable(data: Any) -> Any:
     return data
 
 
+def iter_ndjson(data: Any) -> Iterator[str]:
+    """
+    Serialize data as JSON lines, one record at a time
+
+    Args:
+        data: A list of records, or a single record
+
+    Yields:
+        One JSON document per record, without the newline
+    """
+    for record in data if isinstance(data, list) else [data]:
+        yield json.dumps(_to_serializable(record))
+
+
 def format_output(data: Any, format_type: str = "json", indent_level: int = 0) -> str:
     """
     Format output data for display
 
     Args:
         data: Data to format
-        format_type: Output format (json, json-pretty, text)
+        format_type: Output format (json, json-pretty, ndjson, text)
         indent_level: Current indentation level for nested structures
 
     Returns:
         Formatted string
     """
+    if format_type == "ndjson":
+        return "\n".join(iter_ndjson(data))
     data = _to_serializable(data)
     if format_type == "json":
         return json.dumps(data)
@@ -63,5 +100,7 @@ def format_output(data: Any, format_type: str = "json", indent_level: int = 0) -
 
 
 def resolve_env(value: str | None, key: str) -> str | None:
-    """Return value if specified, otherwise os.getenv('WEKAN_{key}')."""
-    return value or os.getenv(f"WEKAN_{key}")
+    """Return value if specified, otherwise getenv('WEKAN_{key}')."""
+    if value:
+        return value
+    return getenv(f"WEKAN_{key}")
@@ -1,47 +1,138 @@
-from .client import WeKanAPIError, WeKanClient
-from .types import (
-    APIError,
-    BoardColor,
-    BoardDetails,
-    BoardId,
-    BoardInfo,
-    BoardLabel,
-    BoardMember,
-    BoardOrg,
-    BoardPermission,
-    BoardTeam,
-    CardDetails,
-    CardId,
-    CardInfo,
-    Checklist,
-    ChecklistDetails,
-    ChecklistId,
-    ChecklistItem,
-    ChecklistItemDetails,
-    ChecklistItemId,
-    Color,
-    Comment,
-    CommentDetails,
-    CommentId,
-    LabelId,
-    ListDetails,
-    ListId,
-    ListInfo,
-    LoginResponse,
-    SwimlaneDetails,
-    SwimlaneId,
-    SwimlaneInfo,
-    User,
-    UserDetails,
-    UserID,
-    Vote,
-    WeKanModel,
-    WIPLimit,
-)
+"""
+WeKan REST API client and models.
+
+Exports are imported on first use, so that importing this package (or a
+light submodule such as paths) does not load requests and pydantic.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncWeKanClient
+    from .cache import CacheStats, ResponseCache
+    from .client import WeKanAPIError, WeKanClient
+    from .index import CardLocation, CardLocationIndex
+    from .ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+    from .retry import RetryPolicy, RetryStats
+    from .stats import EndpointStats, RequestEvent, RequestStats, ResponseEvent
+    from .tokens import TokenCache
+    from .types import (
+        APIError,
+        BoardColor,
+        BoardDetails,
+        BoardId,
+        BoardInfo,
+        BoardLabel,
+        BoardMember,
+        BoardOrg,
+        BoardPermission,
+        BoardTeam,
+        CardDetails,
+        CardId,
+        CardInfo,
+        Checklist,
+        ChecklistDetails,
+        ChecklistId,
+        ChecklistItem,
+        ChecklistItemDetails,
+        ChecklistItemId,
+        Color,
+        Comment,
+        CommentDetails,
+        CommentId,
+        LabelId,
+        ListDetails,
+        ListId,
+        ListInfo,
+        LoginResponse,
+        SwimlaneDetails,
+        SwimlaneId,
+        SwimlaneInfo,
+        User,
+        UserDetails,
+        UserID,
+        Vote,
+        WeKanModel,
+        WIPLimit,
+    )
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "AsyncWeKanClient": "async_client",
+    "CacheStats": "cache",
+    "ResponseCache": "cache",
+    "WeKanAPIError": "client",
+    "WeKanClient": "client",
+    "CardLocation": "index",
+    "CardLocationIndex": "index",
+    "FileTokenBucket": "ratelimit",
+    "RateLimiter": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "RetryPolicy": "retry",
+    "RetryStats": "retry",
+    "EndpointStats": "stats",
+    "RequestEvent": "stats",
+    "RequestStats": "stats",
+    "ResponseEvent": "stats",
+    "TokenCache": "tokens",
+    "APIError": "types",
+    "BoardColor": "types",
+    "BoardDetails": "types",
+    "BoardId": "types",
+    "BoardInfo": "types",
+    "BoardLabel": "types",
+    "BoardMember": "types",
+    "BoardOrg": "types",
+    "BoardPermission": "types",
+    "BoardTeam": "types",
+    "CardDetails": "types",
+    "CardId": "types",
+    "CardInfo": "types",
+    "Checklist": "types",
+    "ChecklistDetails": "types",
+    "ChecklistId": "types",
+    "ChecklistItem": "types",
+    "ChecklistItemDetails": "types",
+    "ChecklistItemId": "types",
+    "Color": "types",
+    "Comment": "types",
+    "CommentDetails": "types",
+    "CommentId": "types",
+    "LabelId": "types",
+    "ListDetails": "types",
+    "ListId": "types",
+    "ListInfo": "types",
+    "LoginResponse": "types",
+    "SwimlaneDetails": "types",
+    "SwimlaneId": "types",
+    "SwimlaneInfo": "types",
+    "User": "types",
+    "UserDetails": "types",
+    "UserID": "types",
+    "Vote": "types",
+    "WeKanModel": "types",
+    "WIPLimit": "types",
+}
 
 __all__ = [
+    "AsyncWeKanClient",
     "WeKanAPIError",
     "WeKanClient",
+    "CacheStats",
+    "ResponseCache",
+    "CardLocation",
+    "CardLocationIndex",
+    "FileTokenBucket",
+    "RateLimiter",
+    "TokenBucket",
+    "RetryPolicy",
+    "RetryStats",
+    "EndpointStats",
+    "RequestEvent",
+    "RequestStats",
+    "ResponseEvent",
+    "TokenCache",
     "APIError",
     "WeKanModel",
     "BoardDetails",
@@ -80,3 +171,16 @@ __all__ = [
     "Vote",
     "WIPLimit",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
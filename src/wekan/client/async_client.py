@@ -0,0 +1,362 @@
+"""
+Asyncio WeKan REST API client module
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from .client import WeKanClient
+from .types import (
+    BoardDetails,
+    BoardId,
+    BoardInfo,
+    CardDetails,
+    CardId,
+    CardInfo,
+    Checklist,
+    ChecklistDetails,
+    ChecklistId,
+    ChecklistItemDetails,
+    ChecklistItemId,
+    Comment,
+    CommentDetails,
+    CommentId,
+    ListDetails,
+    ListId,
+    ListInfo,
+    LoginResponse,
+    SwimlaneDetails,
+    SwimlaneId,
+    SwimlaneInfo,
+    User,
+    UserDetails,
+    UserID,
+)
+
+T = TypeVar("T")
+
+
+class AsyncWeKanClient:
+    """Asyncio client for interacting with WeKan REST API
+
+    Mirrors the WeKanClient surface with coroutine methods. Requests are
+    issued on a bounded worker pool over a single shared requests session,
+    so at most ``max_concurrency`` calls are in flight at once and they all
+    reuse the same connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        timeout: float = 30,
+        max_concurrency: int = 10,
+        **client_options: Any,
+    ):
+        """
+        Initialize asyncio WeKan client
+
+        Args:
+            base_url: Base URL of the WeKan instance (e.g., https://wekan.example.com)
+            username: Username for authentication
+            password: Password for authentication
+            token: Authentication token (alternative to username/password)
+            timeout: Request timeout in seconds (default: 30)
+            max_concurrency: Maximum number of requests in flight (default: 10)
+            **client_options: Additional WeKanClient options (timeouts, pool_block)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Size the pool so every worker can hold a keep-alive connection
+        client_options.setdefault("pool_maxsize", max_concurrency)
+        self.client = WeKanClient(
+            base_url, username, password, token, timeout, **client_options
+        )
+        self.max_concurrency = max_concurrency
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="wekan-async"
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+    @property
+    def token(self) -> str | None:
+        return self.client.token
+
+    @property
+    def user_id(self) -> UserID | None:
+        return self.client.user_id
+
+    async def __aenter__(self) -> "AsyncWeKanClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the worker pool and close the underlying session."""
+        self._executor.shutdown(wait=True)
+        self.client.session.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking client call on the worker pool."""
+        # Created lazily so the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def login(self) -> LoginResponse:
+        """Login to WeKan and get authentication token."""
+        return await self._run(self.client.login)
+
+    async def authenticate(self) -> LoginResponse | None:
+        """Log in unless already authenticated, reusing a cached login."""
+        return await self._run(self.client.authenticate)
+
+    async def get_users(self) -> list[User]:
+        """Get all users."""
+        return await self._run(self.client.get_users)
+
+    async def get_user(self) -> UserDetails:
+        """Get the current authenticated user's details."""
+        return await self._run(self.client.get_user)
+
+    async def get_boards(self) -> list[BoardInfo]:
+        """Get all boards accessible to the user."""
+        return await self._run(self.client.get_boards)
+
+    async def get_boards_for_user(self, user_id: UserID) -> list[BoardInfo]:
+        """Get all boards accessible to a specific user."""
+        return await self._run(self.client.get_boards_for_user, user_id)
+
+    async def get_board(self, board_id: str) -> BoardDetails | None:
+        """Get details of a specific board."""
+        return await self._run(self.client.get_board, board_id)
+
+    async def export_board(self, board_id: str) -> dict[str, Any] | None:
+        """Export a board with its contents."""
+        return await self._run(self.client.export_board, board_id)
+
+    async def get_lists(self, board_id: str) -> list[ListInfo]:
+        """Get all lists in a board."""
+        return await self._run(self.client.get_lists, board_id)
+
+    async def get_swimlanes(self, board_id: str) -> list[SwimlaneInfo]:
+        """Get all swimlanes in a board."""
+        return await self._run(self.client.get_swimlanes, board_id)
+
+    async def get_swimlane(
+        self, board_id: str, swimlane_id: str
+    ) -> SwimlaneDetails | None:
+        """Get details of a specific swimlane."""
+        return await self._run(self.client.get_swimlane, board_id, swimlane_id)
+
+    async def create_swimlane(self, board_id: str, title: str) -> SwimlaneId:
+        """Create a new swimlane in a board."""
+        return await self._run(self.client.create_swimlane, board_id, title)
+
+    async def delete_swimlane(self, board_id: str, swimlane_id: str) -> SwimlaneId:
+        """Delete a swimlane."""
+        return await self._run(self.client.delete_swimlane, board_id, swimlane_id)
+
+    async def get_cards(self, board_id: str, list_id: str) -> list[CardInfo]:
+        """Get all cards in a list."""
+        return await self._run(self.client.get_cards, board_id, list_id)
+
+    async def get_card(
+        self, board_id: str, list_id: str, card_id: str
+    ) -> CardDetails | None:
+        """Get details of a specific card."""
+        return await self._run(self.client.get_card, board_id, list_id, card_id)
+
+    async def create_board(self, title: str, owner_id: UserID, **kwargs) -> BoardId:
+        """Create a new board."""
+        return await self._run(self.client.create_board, title, owner_id, **kwargs)
+
+    async def delete_board(self, board_id: str) -> BoardId:
+        """Delete a board."""
+        return await self._run(self.client.delete_board, board_id)
+
+    async def add_board_label(self, board_id: str, name: str, color: str) -> str | None:
+        """Add a label to a board."""
+        return await self._run(self.client.add_board_label, board_id, name, color)
+
+    async def create_list(self, board_id: str, title: str) -> ListId:
+        """Create a new list in a board."""
+        return await self._run(self.client.create_list, board_id, title)
+
+    async def get_list(self, board_id: str, list_id: str) -> ListDetails | None:
+        """Get a specific list."""
+        return await self._run(self.client.get_list, board_id, list_id)
+
+    async def delete_list(self, board_id: str, list_id: str) -> ListId:
+        """Delete a list."""
+        return await self._run(self.client.delete_list, board_id, list_id)
+
+    async def create_card(
+        self,
+        board_id: str,
+        list_id: str,
+        title: str,
+        author_id: UserID,
+        swimlane_id: str,
+        description: str | None = None,
+        **kwargs,
+    ) -> CardId:
+        """Create a new card in a list."""
+        return await self._run(
+            self.client.create_card,
+            board_id,
+            list_id,
+            title,
+            author_id,
+            swimlane_id,
+            description=description,
+            **kwargs,
+        )
+
+    async def edit_card(
+        self,
+        board_id: str,
+        list_id: str,
+        card_id: str,
+        swimlane_id: str | None = None,
+        card: CardDetails | None = None,
+        **kwargs,
+    ) -> CardId:
+        """Edit a card."""
+        return await self._run(
+            self.client.edit_card,
+            board_id,
+            list_id,
+            card_id,
+            swimlane_id=swimlane_id,
+            card=card,
+            **kwargs,
+        )
+
+    async def delete_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
+        """Delete a card."""
+        return await self._run(self.client.delete_card, board_id, list_id, card_id)
+
+    async def archive_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
+        """Archive a card."""
+        return await self._run(self.client.archive_card, board_id, list_id, card_id)
+
+    async def restore_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
+        """Restore an archived card."""
+        return await self._run(self.client.restore_card, board_id, list_id, card_id)
+
+    async def get_swimlane_cards(
+        self, board_id: str, swimlane_id: str
+    ) -> list[CardInfo]:
+        """Get all cards in a swimlane."""
+        return await self._run(self.client.get_swimlane_cards, board_id, swimlane_id)
+
+    async def get_card_by_id(self, card_id: str) -> CardDetails | None:
+        """Get card details by card ID only."""
+        return await self._run(self.client.get_card_by_id, card_id)
+
+    async def get_comments(self, board_id: str, card_id: str) -> list[Comment]:
+        """Get all comments on a card."""
+        return await self._run(self.client.get_comments, board_id, card_id)
+
+    async def create_comment(
+        self, board_id: str, card_id: str, author_id: UserID, comment: str
+    ) -> CommentId:
+        """Add a comment to a card."""
+        return await self._run(
+            self.client.create_comment, board_id, card_id, author_id, comment
+        )
+
+    async def get_comment(
+        self, board_id: str, card_id: str, comment_id: str
+    ) -> CommentDetails | None:
+        """Get a specific comment."""
+        return await self._run(self.client.get_comment, board_id, card_id, comment_id)
+
+    async def delete_comment(
+        self, board_id: str, card_id: str, comment_id: str
+    ) -> CommentId:
+        """Delete a comment."""
+        return await self._run(
+            self.client.delete_comment, board_id, card_id, comment_id
+        )
+
+    async def get_checklists(self, board_id: str, card_id: str) -> list[Checklist]:
+        """Get all checklists on a card."""
+        return await self._run(self.client.get_checklists, board_id, card_id)
+
+    async def create_checklist(
+        self, board_id: str, card_id: str, title: str, items: str | None = None
+    ) -> ChecklistId:
+        """Create a checklist on a card."""
+        return await self._run(
+            self.client.create_checklist, board_id, card_id, title, items
+        )
+
+    async def get_checklist(
+        self, board_id: str, card_id: str, checklist_id: str
+    ) -> ChecklistDetails | None:
+        """Get details of a specific checklist."""
+        return await self._run(
+            self.client.get_checklist, board_id, card_id, checklist_id
+        )
+
+    async def create_checklist_item(
+        self, board_id: str, card_id: str, checklist_id: str, title: str
+    ) -> ChecklistItemId:
+        """Add a new item to a checklist."""
+        return await self._run(
+            self.client.create_checklist_item, board_id, card_id, checklist_id, title
+        )
+
+    async def delete_checklist(
+        self, board_id: str, card_id: str, checklist_id: str
+    ) -> ChecklistId:
+        """Delete a checklist."""
+        return await self._run(
+            self.client.delete_checklist, board_id, card_id, checklist_id
+        )
+
+    async def delete_checklist_item(
+        self, board_id: str, card_id: str, checklist_id: str, item_id: str
+    ) -> ChecklistItemId:
+        """Delete a checklist item."""
+        return await self._run(
+            self.client.delete_checklist_item, board_id, card_id, checklist_id, item_id
+        )
+
+    async def get_checklist_item(
+        self, board_id: str, card_id: str, checklist_id: str, item_id: str
+    ) -> ChecklistItemDetails | None:
+        """Get a checklist item."""
+        return await self._run(
+            self.client.get_checklist_item, board_id, card_id, checklist_id, item_id
+        )
+
+    async def edit_checklist_item(
+        self, board_id: str, card_id: str, checklist_id: str, item_id: str, **kwargs
+    ) -> ChecklistItemId:
+        """Edit a checklist item."""
+        return await self._run(
+            self.client.edit_checklist_item,
+            board_id,
+            card_id,
+            checklist_id,
+            item_id,
+            **kwargs,
+        )
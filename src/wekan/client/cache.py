@@ -0,0 +1,167 @@
+"""
+In-process response cache for WeKan REST API GET requests
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple
+
+import requests
+
+
+def route_resource(route: str) -> str:
+    """
+    Return the resource a route template addresses
+
+    This is the last literal path segment, e.g. "cards" for both
+    /api/boards/{board_id}/lists/{list_id}/cards and /api/cards/{card_id}.
+    """
+    segments = [s for s in route.split("/") if s and not s.startswith("{")]
+    return segments[-1] if segments else ""
+
+
+class _Entry(NamedTuple):
+    response: requests.Response
+    size: int
+    expires: float
+
+
+@dataclass
+class CacheStats:
+    """Cache counters, safe to read while the cache is in use."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a snapshot of the counters."""
+        return dict(self.__dict__)
+
+
+@dataclass
+class ResponseCache:
+    """
+    Read-through cache of GET responses with TTL and LRU bounds
+
+    Entries expire after a per-resource TTL (see route_resource) and the
+    least recently used entries are evicted once either max_entries or
+    max_bytes is exceeded. The owning client invalidates entries whenever
+    it mutates a resource, so a client always reads its own writes.
+
+    Attributes:
+        ttl: Default time to live in seconds
+        ttls: Per-resource TTL overrides, e.g. {"boards": 300, "cards": 5}
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum total size of cached response bodies
+    """
+
+    ttl: float = 60.0
+    ttls: dict[str, float] = field(default_factory=dict)
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    stats: CacheStats = field(default_factory=CacheStats, init=False)
+
+    def __post_init__(self) -> None:
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> requests.Response | None:
+        """Return a cached response, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires <= self.clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.response
+
+    def put(self, key: str, route: str, response: requests.Response) -> None:
+        """Cache a response under key, using the TTL of the route's resource."""
+        ttl = self.ttls.get(route_resource(route), self.ttl)
+        size = len(response.content or b"")
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(response, size, self.clock() + ttl)
+            self.stats.entries += 1
+            self.stats.bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.stats.bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose key is prefix or a path below it."""
+        with self._lock:
+            for key in [k for k in self._entries if _under(k, prefix)]:
+                self._remove(key)
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def invalidate_mutation(
+        self, base_url: str, route: str, path: dict[str, str], body: Any = None
+    ) -> None:
+        """
+        Drop entries that a mutation of route may have changed
+
+        Mutations scoped to a board drop everything cached under that board
+        (and under a destination board when a card is moved) plus cards
+        fetched by ID. Creating or deleting a board also drops board and
+        user listings. Unrecognized routes clear the whole cache.
+        """
+        if route.startswith("/users/"):
+            return
+        board_id = path.get("board_id")
+        if board_id is None:
+            if route == "/api/boards":
+                self.invalidate(f"{base_url}/api/boards")
+                self.invalidate(f"{base_url}/api/users")
+                self.invalidate(f"{base_url}/api/user")
+            else:
+                self.clear()
+            return
+        if route == "/api/boards/{board_id}":
+            self.invalidate(f"{base_url}/api/boards")
+            self.invalidate(f"{base_url}/api/users")
+            self.invalidate(f"{base_url}/api/user")
+        else:
+            self.invalidate(f"{base_url}/api/boards/{board_id}")
+            new_board_id = body.get("newBoardId") if isinstance(body, dict) else None
+            if new_board_id and new_board_id != board_id:
+                self.invalidate(f"{base_url}/api/boards/{new_board_id}")
+        self.invalidate(f"{base_url}/api/cards")
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= entry.size
+
+
+def _under(key: str, prefix: str) -> bool:
+    return key == prefix or key.startswith(prefix + "/")
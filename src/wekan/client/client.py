@@ -2,10 +2,26 @@
 WeKan REST API client module
 """
 
-import os
+import contextvars
+import functools
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
 
 import requests
-
+from pydantic import TypeAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+from .cache import ResponseCache
+from .env import getenv
+from .index import CardLocation, CardLocationIndex
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryStats
+from .stats import RequestEvent, ResponseEvent
+from .tokens import TokenCache
 from .types import (
     APIError,
     BoardDetails,
@@ -34,7 +50,35 @@ from .types import (
     UserID,
 )
 
-DEBUG = os.getenv("WEKAN_DEBUG", False)
+T = TypeVar("T")
+
+# API errors are JSON objects with an "error" key; other bodies need not be
+# parsed to check them
+_JSON_OBJECT = re.compile(rb"\s*\{")
+
+# edit_card fields that move a card (the API needs all three to move it)
+MOVE_FIELDS = ("newBoardId", "newListId", "newSwimlaneId")
+
+
+@functools.cache
+def _list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """Return the (compiled once) validator for a JSON array of model."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def _validate_list(model: type[T], response: requests.Response) -> list[T]:
+    """Validate a JSON array response body straight from its bytes."""
+    return _list_adapter(model).validate_json(response.content)
+
+
+def _debug_response(event: ResponseEvent) -> None:
+    """Print one line per request attempt to stderr (WEKAN_DEBUG)."""
+    outcome = event.status if event.error is None else type(event.error).__name__
+    print(
+        f"{event.method} {event.url} -> {outcome}, {event.bytes} bytes, "
+        f"{event.duration * 1000:.1f}ms",
+        file=sys.stderr,
+    )
 
 
 class WeKanAPIError(Exception):
@@ -51,14 +95,14 @@ class WeKanClient:
     @staticmethod
     def _check_response(response: requests.Response) -> None:
         """Raise WeKanApiError if the response contains an API error."""
-        try:
-            if DEBUG:
-                print(response.content)
-            data = response.json()
-            if "error" in data:
-                raise WeKanAPIError(APIError.model_validate(data))
-        except (ValueError, KeyError):
-            pass
+        content = response.content
+        if _JSON_OBJECT.match(content) and b'"error"' in content:
+            try:
+                data = response.json()
+                if "error" in data:
+                    raise WeKanAPIError(APIError.model_validate(data))
+            except (ValueError, KeyError):
+                pass
         response.raise_for_status()
 
     def __init__(
@@ -67,29 +111,307 @@ class WeKanClient:
         username: str | None = None,
         password: str | None = None,
         token: str | None = None,
-        timeout: int = 30,
+        timeout: float = 30,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        card_index: CardLocationIndex | None = None,
+        cache: ResponseCache | None = None,
+        token_cache: TokenCache | None = None,
+        before_request: Iterable[Callable[[RequestEvent], None]] = (),
+        after_response: Iterable[Callable[[ResponseEvent], None]] = (),
     ):
         """
         Initialize WeKan client
 
+        The session is safe to share across threads: connections are drawn
+        from a thread-safe urllib3 pool and authentication state is only
+        modified under a lock.  Size ``pool_maxsize`` to the number of worker
+        threads to avoid discarding keep-alive connections under fan-out.
+
         Args:
             base_url: Base URL of the WeKan instance (e.g., https://wekan.example.com)
             username: Username for authentication
             password: Password for authentication
             token: Authentication token (alternative to username/password)
             timeout: Request timeout in seconds (default: 30)
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Read timeout in seconds (default: timeout)
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept open per host
+            pool_block: Block when the pool is exhausted instead of opening
+                a throwaway connection
+            retry: Retry policy for transient failures (default: no retries)
+            rate_limiter: Request rate limiter, applied to every attempt
+            card_index: Index updated with card locations seen in responses
+            cache: Read-through cache for GET responses, invalidated by
+                this client's own mutations
+            token_cache: Where logins are saved and reused by authenticate();
+                a token the server rejects is replaced by logging in again
+            before_request: Callables invoked with a RequestEvent before
+                every HTTP attempt (retries and re-sends after a new login
+                included; cache hits send nothing)
+            after_response: Callables invoked with a ResponseEvent after
+                every HTTP attempt, e.g. a RequestStats
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.token = token
         self.user_id: UserID | None = None
-        self.timeout = timeout
+        self.timeout: tuple[float, float] = (
+            timeout if connect_timeout is None else connect_timeout,
+            timeout if read_timeout is None else read_timeout,
+        )
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.pool_maxsize = pool_maxsize
+        self.card_index = card_index
+        self.cache = cache
+        self.token_cache = token_cache
+        # Hooks run in the thread making the request; they may be changed
+        # at any time, and an exception from one propagates to the caller
+        self.before_request = list(before_request)
+        self.after_response = list(after_response)
+        if getenv("WEKAN_DEBUG"):
+            self.after_response.append(_debug_response)
+        self._auth_lock = threading.Lock()
+        # Held while replacing a rejected token, so that only one thread
+        # logs in again
+        self._login_lock = threading.Lock()
         self.session = requests.Session()
 
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         if token:
             self.session.headers.update({"Authorization": f"Bearer {token}"})
 
+    def _request(
+        self, method: str, route: str, json: Any = None, **path: str
+    ) -> requests.Response:
+        """
+        Send a request to the WeKan API and check the response
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            route: Route template relative to the base URL (e.g., /api/boards/{board_id})
+            json: JSON request body
+            **path: Values substituted into the route template
+
+        Returns:
+            The checked response
+        """
+        url = self.base_url + route.format(**path)
+        cacheable = self.cache is not None and method == "GET"
+        if cacheable:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
+        token = self.token
+        response = self._send(method, route, url, json)
+        if (
+            response.status_code == 401
+            and route != "/users/login"
+            and self._reauthenticate(token)
+        ):
+            response.close()
+            response = self._send(method, route, url, json)
+
+        self._check_response(response)
+        if cacheable and response.content:
+            self.cache.put(url, route, response)
+        elif self.cache is not None and method != "GET":
+            self.cache.invalidate_mutation(self.base_url, route, path, json)
+        return response
+
+    def _send(
+        self, method: str, route: str, url: str, json: Any
+    ) -> requests.Response:
+        """Send a request, retrying transient failures per the retry policy."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method)
+            request = RequestEvent(method, route, url, attempt)
+            for hook in self.before_request:
+                hook(request)
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, json=json, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._after_response(request, start, error=e)
+                if not self._should_retry(method, attempt, error=e):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                self._after_response(request, start, response=response)
+                if not self._should_retry(method, attempt, response=response):
+                    return response
+                response.close()
+                time.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    def _after_response(
+        self,
+        request: RequestEvent,
+        start: float,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Invoke the after-response hooks for an attempt started at start."""
+        if not self.after_response:
+            return
+        event = ResponseEvent(
+            request.method,
+            request.route,
+            request.url,
+            request.attempt,
+            status=None if response is None else response.status_code,
+            bytes=0 if response is None else len(response.content),
+            duration=time.perf_counter() - start,
+            error=error,
+        )
+        for hook in self.after_response:
+            hook(event)
+
+    def _reauthenticate(self, rejected: str | None) -> bool:
+        """
+        Replace a token the server rejected with a new login
+
+        Concurrent callers rejected with the same token wait for the first
+        one's login instead of each logging in.
+
+        Args:
+            rejected: Token the rejected request was sent with
+
+        Returns:
+            True if the request should be sent again with the new token
+        """
+        if not rejected or not (self.username and self.password):
+            return False
+        with self._login_lock:
+            if self.token != rejected:
+                return True
+            if self.token_cache is not None:
+                self.token_cache.discard(self.base_url, self.username, rejected)
+                # Another process may already have logged in again
+                cached = self.token_cache.get(self.base_url, self.username)
+                if cached is not None:
+                    self._set_login(cached)
+                    return True
+            self.login()
+            return self.token != rejected
+
+    def _set_login(self, login: LoginResponse) -> None:
+        with self._auth_lock:
+            self.token = login.token
+            self.user_id = login.userId
+            self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+
+    def _should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Check the retry policy and consume from the retry budget."""
+        if self.retry is None:
+            return False
+        if not self.retry.is_retryable(method, attempt, response, error):
+            return False
+        reason = type(error).__name__ if error else str(response.status_code)
+        return self.retry_stats.acquire(self.retry.budget, reason)
+
+    def gather(
+        self, calls: Iterable[Callable[[], T]], max_workers: int | None = None
+    ) -> list[T | Exception]:
+        """
+        Run calls concurrently on a bounded thread pool
+
+        Results come back in input order. A call that raises does not abort
+        the batch; its exception is returned in its place instead.
+
+        Args:
+            calls: Zero-argument callables, e.g. functools.partial(client.get_card_by_id, id)
+            max_workers: Worker threads (default: pool_maxsize, so every
+                worker can keep a pooled connection)
+
+        Returns:
+            Result or exception for each call, in input order
+        """
+
+        def run(call: Callable[[], T]) -> T | Exception:
+            try:
+                return call()
+            except Exception as e:
+                return e
+
+        calls = list(calls)
+        if not calls:
+            return []
+        workers = min(max_workers or self.pool_maxsize, len(calls))
+        # Each call runs in a copy of the caller's context, so that context
+        # variables reach the hooks invoked on the worker threads
+        contexts = [contextvars.copy_context() for _ in calls]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda ctx, call: ctx.run(run, call), contexts, calls)
+            )
+
+    def map(
+        self,
+        func: Callable[..., T],
+        *iterables: Iterable[Any],
+        max_workers: int | None = None,
+    ) -> list[T | Exception]:
+        """
+        Apply a client method to every item concurrently
+
+        Example: ``client.map(client.get_cards, board_ids, list_ids)``
+
+        Args:
+            func: Callable invoked with one item from each iterable
+            *iterables: Argument sequences, zipped like the builtin map()
+            max_workers: Worker threads (default: pool_maxsize)
+
+        Returns:
+            Result or exception for each item, in input order
+        """
+        calls = [functools.partial(func, *args) for args in zip(*iterables)]
+        return self.gather(calls, max_workers=max_workers)
+
+    def _index_cards(
+        self, cards: list[Any], board_id: str, list_id: str = "", swimlane_id: str = ""
+    ) -> None:
+        """Record card locations, taking missing IDs from each card's own fields."""
+        if self.card_index is None:
+            return
+        entries = []
+        for card in cards:
+            location = CardLocation(
+                getattr(card, "boardId", None) or board_id,
+                getattr(card, "listId", None) or list_id,
+                getattr(card, "swimlaneId", None) or swimlane_id,
+            )
+            if location.boardId and location.listId:
+                entries.append((card.cardId, location))
+        self.card_index.record_many(entries)
+
     def login(self) -> LoginResponse:
         """
         Login to WeKan and get authentication token
@@ -100,20 +422,54 @@ class WeKanClient:
         if not self.token and (not self.username or not self.password):
             raise ValueError("Username and password required for login")
 
-        url = f"{self.base_url}/users/login"
         payload = {"username": self.username, "password": self.password}
-
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("POST", "/users/login", json=payload)
 
         result = LoginResponse.model_validate(response.json())
         if result.token:
-            self.token = result.token
-            self.user_id = result.userId
-            self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+            self._set_login(result)
+            if self.token_cache is not None and self.username:
+                self.token_cache.put(self.base_url, self.username, result)
 
         return result
 
+    def authenticate(self) -> LoginResponse | None:
+        """
+        Log in unless already authenticated, reusing a cached login
+
+        A token given to the client is used as is. Otherwise the token cache
+        is consulted, and only when it has no unexpired login for this user
+        does the client log in (and cache the result).
+
+        Returns:
+            The cached or new login, or None if the client was given a token
+        """
+        if self.token:
+            return None
+        if self.token_cache is not None and self.username:
+            cached = self.token_cache.get(self.base_url, self.username)
+            if cached is not None:
+                self._set_login(cached)
+                return cached
+        return self.login()
+
+    def get_raw(self, route: str, **path: str) -> bytes | None:
+        """
+        GET a route and return the response body without parsing it
+
+        Skips model validation and re-serialization for callers that pass
+        the server's JSON on unchanged; API errors still raise.
+
+        Args:
+            route: Route template relative to the base URL (e.g., /api/boards/{board_id})
+            **path: Values substituted into the route template
+
+        Returns:
+            The response body, or None if it is empty (not found)
+        """
+        response = self._request("GET", route, **path)
+        return response.content or None
+
     def get_users(self) -> list[User]:
         """
         Get all users
@@ -121,10 +477,8 @@ class WeKanClient:
         Returns:
             List of users
         """
-        url = f"{self.base_url}/api/users"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [User.model_validate(user) for user in response.json()]
+        response = self._request("GET", "/api/users")
+        return _validate_list(User, response)
 
     def get_user(self) -> UserDetails:
         """
@@ -133,9 +487,7 @@ class WeKanClient:
         Returns:
             User details
         """
-        url = f"{self.base_url}/api/user"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("GET", "/api/user")
         return UserDetails.model_validate(response.json())
 
     def get_boards(self) -> list[BoardInfo]:
@@ -145,10 +497,8 @@ class WeKanClient:
         Returns:
             List of boards
         """
-        url = f"{self.base_url}/api/boards"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [BoardInfo.model_validate(board) for board in response.json()]
+        response = self._request("GET", "/api/boards")
+        return _validate_list(BoardInfo, response)
 
     def get_boards_for_user(self, user_id: UserID) -> list[BoardInfo]:
         """
@@ -160,10 +510,8 @@ class WeKanClient:
         Returns:
             List of boards accessible to the user
         """
-        url = f"{self.base_url}/api/users/{user_id}/boards"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [BoardInfo.model_validate(board) for board in response.json()]
+        response = self._request("GET", "/api/users/{user_id}/boards", user_id=user_id)
+        return _validate_list(BoardInfo, response)
 
     def get_board(self, board_id: str) -> BoardDetails | None:
         """
@@ -175,13 +523,30 @@ class WeKanClient:
         Returns:
             Board details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("GET", "/api/boards/{board_id}", board_id=board_id)
         if not response.text:
             return None
         return BoardDetails.model_validate(response.json())
 
+    def export_board(self, board_id: str) -> dict[str, Any] | None:
+        """
+        Export a board with its swimlanes, lists, cards, comments and checklists
+
+        WeKan answers 403 to users who may not export the board.
+
+        Args:
+            board_id: ID of the board
+
+        Returns:
+            The export as WeKan returns it (unvalidated), or None if not found
+        """
+        response = self._request(
+            "GET", "/api/boards/{board_id}/export", board_id=board_id
+        )
+        if not response.text:
+            return None
+        return response.json()
+
     def get_lists(self, board_id: str) -> list[ListInfo]:
         """
         Get all lists in a board
@@ -192,10 +557,12 @@ class WeKanClient:
         Returns:
             List of lists in the board
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [ListInfo.model_validate(lst) for lst in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/lists",
+            board_id=board_id,
+        )
+        return _validate_list(ListInfo, response)
 
     def get_swimlanes(self, board_id: str) -> list[SwimlaneInfo]:
         """
@@ -207,10 +574,12 @@ class WeKanClient:
         Returns:
             List of swimlanes in the board
         """
-        url = f"{self.base_url}/api/boards/{board_id}/swimlanes"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [SwimlaneInfo.model_validate(s) for s in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/swimlanes",
+            board_id=board_id,
+        )
+        return _validate_list(SwimlaneInfo, response)
 
     def get_swimlane(self, board_id: str, swimlane_id: str) -> SwimlaneDetails | None:
         """
@@ -223,9 +592,12 @@ class WeKanClient:
         Returns:
             Swimlane details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/swimlanes/{swimlane_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/swimlanes/{swimlane_id}",
+            board_id=board_id,
+            swimlane_id=swimlane_id,
+        )
         if not response.text:
             return None
         return SwimlaneDetails.model_validate(response.json())
@@ -241,10 +613,13 @@ class WeKanClient:
         Returns:
             Created swimlane ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/swimlanes"
         payload = {"title": title}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/swimlanes",
+            json=payload,
+            board_id=board_id,
+        )
         return SwimlaneId.model_validate(response.json())
 
     def delete_swimlane(self, board_id: str, swimlane_id: str) -> SwimlaneId:
@@ -258,9 +633,12 @@ class WeKanClient:
         Returns:
             Deleted swimlane ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/swimlanes/{swimlane_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/swimlanes/{swimlane_id}",
+            board_id=board_id,
+            swimlane_id=swimlane_id,
+        )
         return SwimlaneId.model_validate(response.json())
 
     def get_cards(self, board_id: str, list_id: str) -> list[CardInfo]:
@@ -274,10 +652,32 @@ class WeKanClient:
         Returns:
             List of cards
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [CardInfo.model_validate(card) for card in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/lists/{list_id}/cards",
+            board_id=board_id,
+            list_id=list_id,
+        )
+        cards = _validate_list(CardInfo, response)
+        self._index_cards(cards, board_id, list_id=list_id)
+        return cards
+
+    def get_cards_for_lists(
+        self, board_id: str, list_ids: Iterable[str], max_workers: int | None = None
+    ) -> list[list[CardInfo] | Exception]:
+        """
+        Get the cards of many lists in a board concurrently
+
+        Args:
+            board_id: ID of the board
+            list_ids: IDs of the lists
+            max_workers: Worker threads (default: pool_maxsize)
+
+        Returns:
+            Cards, or the raised exception, for each list in input order
+        """
+        calls = [functools.partial(self.get_cards, board_id, lid) for lid in list_ids]
+        return self.gather(calls, max_workers=max_workers)
 
     def get_card(self, board_id: str, list_id: str, card_id: str) -> CardDetails | None:
         """
@@ -291,12 +691,18 @@ class WeKanClient:
         Returns:
             Card details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards/{card_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}",
+            board_id=board_id,
+            list_id=list_id,
+            card_id=card_id,
+        )
         if not response.text:
             return None
-        return CardDetails.model_validate(response.json())
+        card = CardDetails.model_validate(response.json())
+        self._index_cards([card], board_id)
+        return card
 
     def create_board(self, title: str, owner_id: UserID, **kwargs) -> BoardId:
         """
@@ -310,10 +716,8 @@ class WeKanClient:
         Returns:
             Created board ID
         """
-        url = f"{self.base_url}/api/boards"
         payload = {"title": title, "owner": owner_id, **kwargs}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("POST", "/api/boards", json=payload)
         return BoardId.model_validate(response.json())
 
     def delete_board(self, board_id: str) -> BoardId:
@@ -326,9 +730,7 @@ class WeKanClient:
         Returns:
             Deleted board ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("DELETE", "/api/boards/{board_id}", board_id=board_id)
         return BoardId.model_validate(response.json())
 
     def add_board_label(self, board_id: str, name: str, color: str) -> str | None:
@@ -343,10 +745,13 @@ class WeKanClient:
         Returns:
             Created label ID string, or None if the label already exists
         """
-        url = f"{self.base_url}/api/boards/{board_id}/labels"
         payload = {"label": {"name": name, "color": color}}
-        response = self.session.put(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "PUT",
+            "/api/boards/{board_id}/labels",
+            json=payload,
+            board_id=board_id,
+        )
         text = response.text.strip()
         if not text:
             return None
@@ -373,10 +778,13 @@ class WeKanClient:
         Returns:
             Created list ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists"
         payload = {"title": title}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/lists",
+            json=payload,
+            board_id=board_id,
+        )
         return ListId.model_validate(response.json())
 
     def get_list(self, board_id: str, list_id: str) -> ListDetails | None:
@@ -390,9 +798,12 @@ class WeKanClient:
         Returns:
             List details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/lists/{list_id}",
+            board_id=board_id,
+            list_id=list_id,
+        )
         if not response.text:
             return None
         return ListDetails.model_validate(response.json())
@@ -408,9 +819,12 @@ class WeKanClient:
         Returns:
             Deleted list ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/lists/{list_id}",
+            board_id=board_id,
+            list_id=list_id,
+        )
         return ListId.model_validate(response.json())
 
     def create_card(
@@ -438,7 +852,6 @@ class WeKanClient:
         Returns:
             Created card details
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards"
         payload = {
             "title": title,
             "authorId": author_id,
@@ -448,42 +861,83 @@ class WeKanClient:
         if description:
             payload["description"] = description
 
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
-        return CardId.model_validate(response.json())
-
-    def edit_card(self, board_id: str, list_id: str, card_id: str, **kwargs) -> CardId:
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/lists/{list_id}/cards",
+            json=payload,
+            board_id=board_id,
+            list_id=list_id,
+        )
+        card = CardId.model_validate(response.json())
+        self._index_cards([card], board_id, list_id, swimlane_id)
+        return card
+
+    def edit_card(
+        self,
+        board_id: str,
+        list_id: str,
+        card_id: str,
+        swimlane_id: str | None = None,
+        card: CardDetails | None = None,
+        **kwargs,
+    ) -> CardId:
         """
         Edit a card
 
+        newBoardId, newListId and newSwimlaneId move the card, so they are
+        only sent when one of them is given, or when card is: values from
+        a card the caller just fetched are current, unlike a cached location
+        that would move the card back. A move needs all three; missing ones
+        default to board_id, list_id and the card's swimlane (swimlane_id,
+        else card's, else fetched).
+
         Args:
             board_id: ID of the board
             list_id: ID of the list
             card_id: ID of the card
+            swimlane_id: Current swimlane of the card, if known
+            card: Current card details, if just fetched
             **kwargs: Fields to update (title, description, color, etc.)
 
         Returns:
             Updated card details
         """
-
-        previous_card = self.get_card(board_id, list_id, card_id)
-        if previous_card is None:
-            raise ValueError(f"Card {card_id} not found")
-
-        if "newBoardId" not in kwargs:
-            kwargs["newBoardId"] = board_id
-        if "newListId" not in kwargs:
-            kwargs["newListId"] = list_id
-        if "newSwimlaneId" not in kwargs:
-            kwargs["newSwimlaneId"] = previous_card.swimlaneId
+        moving = any(key in kwargs for key in MOVE_FIELDS)
+        if moving or card is not None:
+            if "newSwimlaneId" not in kwargs:
+                if swimlane_id is None and card is not None:
+                    swimlane_id = card.swimlaneId
+                if swimlane_id is None:
+                    previous_card = self.get_card(board_id, list_id, card_id)
+                    if previous_card is None:
+                        raise ValueError(f"Card {card_id} not found")
+                    swimlane_id = previous_card.swimlaneId
+                kwargs["newSwimlaneId"] = swimlane_id
+
+            if "newBoardId" not in kwargs:
+                kwargs["newBoardId"] = board_id
+            if "newListId" not in kwargs:
+                kwargs["newListId"] = list_id
         # Archive is listed as a required arg but the code does not require it
         # Leaving this commented out for now
         # if "archive" not in kwargs:
         #    kwargs["archive"] = False
 
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards/{card_id}"
-        response = self.session.put(url, json=kwargs, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "PUT",
+            "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}",
+            json=kwargs,
+            board_id=board_id,
+            list_id=list_id,
+            card_id=card_id,
+        )
+        if self.card_index is not None and "newListId" in kwargs:
+            self.card_index.record(
+                card_id,
+                kwargs["newBoardId"],
+                kwargs["newListId"],
+                kwargs["newSwimlaneId"],
+            )
         return CardId.model_validate(response.json())
 
     def delete_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
@@ -498,23 +952,39 @@ class WeKanClient:
         Returns:
             Deleted card ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards/{card_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}",
+            board_id=board_id,
+            list_id=list_id,
+            card_id=card_id,
+        )
+        if self.card_index is not None:
+            self.card_index.discard(card_id)
         return CardId.model_validate(response.json())
 
     def archive_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
         """Archive a card."""
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards/{card_id}/archive"
-        response = self.session.put(url, json={}, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "PUT",
+            "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}/archive",
+            json={},
+            board_id=board_id,
+            list_id=list_id,
+            card_id=card_id,
+        )
         return CardId.model_validate(response.json())
 
     def restore_card(self, board_id: str, list_id: str, card_id: str) -> CardId:
         """Restore an archived card."""
-        url = f"{self.base_url}/api/boards/{board_id}/lists/{list_id}/cards/{card_id}/restore"
-        response = self.session.put(url, json={}, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "PUT",
+            "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}/restore",
+            json={},
+            board_id=board_id,
+            list_id=list_id,
+            card_id=card_id,
+        )
         return CardId.model_validate(response.json())
 
     def get_swimlane_cards(self, board_id: str, swimlane_id: str) -> list[CardInfo]:
@@ -528,10 +998,15 @@ class WeKanClient:
         Returns:
             List of cards
         """
-        url = f"{self.base_url}/api/boards/{board_id}/swimlanes/{swimlane_id}/cards"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [CardInfo.model_validate(card) for card in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/swimlanes/{swimlane_id}/cards",
+            board_id=board_id,
+            swimlane_id=swimlane_id,
+        )
+        cards = _validate_list(CardInfo, response)
+        self._index_cards(cards, board_id, swimlane_id=swimlane_id)
+        return cards
 
     def get_card_by_id(self, card_id: str) -> CardDetails | None:
         """
@@ -543,12 +1018,28 @@ class WeKanClient:
         Returns:
             Card details, or None if not found
         """
-        url = f"{self.base_url}/api/cards/{card_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request("GET", "/api/cards/{card_id}", card_id=card_id)
         if not response.text:
             return None
-        return CardDetails.model_validate(response.json())
+        card = CardDetails.model_validate(response.json())
+        self._index_cards([card], card.boardId)
+        return card
+
+    def get_cards_by_ids(
+        self, card_ids: Iterable[str], max_workers: int | None = None
+    ) -> list[CardDetails | None | Exception]:
+        """
+        Get card details for many card IDs concurrently
+
+        Args:
+            card_ids: IDs of the cards
+            max_workers: Worker threads (default: pool_maxsize)
+
+        Returns:
+            Card details, None if not found, or the raised exception for
+            each ID, in input order
+        """
+        return self.map(self.get_card_by_id, card_ids, max_workers=max_workers)
 
     def get_comments(self, board_id: str, card_id: str) -> list[Comment]:
         """
@@ -561,10 +1052,13 @@ class WeKanClient:
         Returns:
             List of comments
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/comments"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [Comment.model_validate(c) for c in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/cards/{card_id}/comments",
+            board_id=board_id,
+            card_id=card_id,
+        )
+        return _validate_list(Comment, response)
 
     def create_comment(
         self, board_id: str, card_id: str, author_id: UserID, comment: str
@@ -581,10 +1075,14 @@ class WeKanClient:
         Returns:
             Created comment
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/comments"
         payload = {"authorId": author_id, "comment": comment}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/cards/{card_id}/comments",
+            json=payload,
+            board_id=board_id,
+            card_id=card_id,
+        )
         return CommentId.model_validate(response.json())
 
     def get_comment(
@@ -601,9 +1099,13 @@ class WeKanClient:
         Returns:
             Comment details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/comments/{comment_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/cards/{card_id}/comments/{comment_id}",
+            board_id=board_id,
+            card_id=card_id,
+            comment_id=comment_id,
+        )
         if not response.text:
             return None
         return CommentDetails.model_validate(response.json())
@@ -620,9 +1122,13 @@ class WeKanClient:
         Returns:
             Deleted comment ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/comments/{comment_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/cards/{card_id}/comments/{comment_id}",
+            board_id=board_id,
+            card_id=card_id,
+            comment_id=comment_id,
+        )
         return CommentId.model_validate(response.json())
 
     def get_checklists(self, board_id: str, card_id: str) -> list[Checklist]:
@@ -636,10 +1142,13 @@ class WeKanClient:
         Returns:
             List of checklists
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
-        return [Checklist.model_validate(c) for c in response.json()]
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/cards/{card_id}/checklists",
+            board_id=board_id,
+            card_id=card_id,
+        )
+        return _validate_list(Checklist, response)
 
     def create_checklist(
         self, board_id: str, card_id: str, title: str, items: str | None = None
@@ -656,12 +1165,16 @@ class WeKanClient:
         Returns:
             Created checklist ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists"
         payload = {"title": title}
         if items:
             payload["items"] = items
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/cards/{card_id}/checklists",
+            json=payload,
+            board_id=board_id,
+            card_id=card_id,
+        )
         return ChecklistId.model_validate(response.json())
 
     def get_checklist(
@@ -678,9 +1191,13 @@ class WeKanClient:
         Returns:
             Checklist details with items, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}",
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+        )
         if not response.text:
             return None
         return ChecklistDetails.model_validate(response.json())
@@ -700,10 +1217,15 @@ class WeKanClient:
         Returns:
             Created checklist item ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items"
         payload = {"title": title}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "POST",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items",
+            json=payload,
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+        )
         return ChecklistItemId.model_validate(response.json())
 
     def delete_checklist(
@@ -720,9 +1242,13 @@ class WeKanClient:
         Returns:
             Deleted checklist ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}",
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+        )
         return ChecklistId.model_validate(response.json())
 
     def delete_checklist_item(
@@ -740,9 +1266,14 @@ class WeKanClient:
         Returns:
             Deleted checklist item ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}"
-        response = self.session.delete(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "DELETE",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}",
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+            item_id=item_id,
+        )
         return ChecklistItemId.model_validate(response.json())
 
     def get_checklist_item(
@@ -760,9 +1291,14 @@ class WeKanClient:
         Returns:
             Checklist item details, or None if not found
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}"
-        response = self.session.get(url, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "GET",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}",
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+            item_id=item_id,
+        )
         if not response.text:
             return None
         return ChecklistItemDetails.model_validate(response.json())
@@ -783,7 +1319,13 @@ class WeKanClient:
         Returns:
             Updated checklist item ID
         """
-        url = f"{self.base_url}/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}"
-        response = self.session.put(url, json=kwargs, timeout=self.timeout)
-        self._check_response(response)
+        response = self._request(
+            "PUT",
+            "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}/items/{item_id}",
+            json=kwargs,
+            board_id=board_id,
+            card_id=card_id,
+            checklist_id=checklist_id,
+            item_id=item_id,
+        )
         return ChecklistItemId.model_validate(response.json())
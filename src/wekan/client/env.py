@@ -0,0 +1,19 @@
+"""
+Environment lookup that a long-running process can override per command
+"""
+
+import contextvars
+import os
+from typing import Mapping
+
+# Environment seen by getenv(); the daemon sets this to each request's
+# environment, since os.environ is shared by all of its threads
+request_env: contextvars.ContextVar[Mapping[str, str] | None] = (
+    contextvars.ContextVar("request_env", default=None)
+)
+
+
+def getenv(key: str) -> str | None:
+    """Return the variable from the current request's environment or os.environ."""
+    env = request_env.get()
+    return (os.environ if env is None else env).get(key)
@@ -0,0 +1,113 @@
+"""
+Persistent index of card locations
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from .paths import cache_dir
+
+
+class CardLocation(NamedTuple):
+    """Where a card lives: the IDs needed to address it in board-scoped routes."""
+
+    boardId: str
+    listId: str
+    swimlaneId: str
+
+
+class CardLocationIndex:
+    """
+    On-disk map of cardId to (boardId, listId, swimlaneId)
+
+    Card-scoped REST routes need the card's board (and often list), which
+    otherwise costs a GET /api/cards/:cardId before every operation. The
+    client records locations from any response that carries them; callers
+    should discard an entry when the server rejects its location.
+
+    Entries are namespaced by server so one index file can serve several
+    WeKan instances. Safe to share between threads and processes.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, namespace: str = ""):
+        """
+        Open (or create) a card location index
+
+        Args:
+            path: SQLite database file (default: <cache dir>/card_index.db)
+            namespace: Key separating entries of different servers, e.g. the URL
+        """
+        self.path = Path(path) if path is not None else cache_dir() / "card_index.db"
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=10, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS card_locations ("
+            " namespace TEXT NOT NULL,"
+            " card_id TEXT NOT NULL,"
+            " board_id TEXT NOT NULL,"
+            " list_id TEXT NOT NULL,"
+            " swimlane_id TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, card_id))"
+        )
+
+    def get(self, card_id: str) -> CardLocation | None:
+        """Return the recorded location of a card, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT board_id, list_id, swimlane_id FROM card_locations"
+                " WHERE namespace = ? AND card_id = ?",
+                (self.namespace, card_id),
+            ).fetchone()
+        return CardLocation(*row) if row else None
+
+    def record(
+        self, card_id: str, board_id: str, list_id: str, swimlane_id: str = ""
+    ) -> None:
+        """Record (or update) the location of a card."""
+        self.record_many([(card_id, CardLocation(board_id, list_id, swimlane_id))])
+
+    def record_many(self, entries: list[tuple[str, CardLocation]]) -> None:
+        """Record the locations of many cards in one transaction."""
+        if not entries:
+            return
+        rows = [(self.namespace, card_id, *loc) for card_id, loc in entries]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # Keep a known swimlane when the new entry doesn't carry one,
+                # unless the card moved: its old swimlane may no longer apply
+                self._conn.executemany(
+                    "INSERT INTO card_locations VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (namespace, card_id) DO UPDATE SET"
+                    " board_id = excluded.board_id,"
+                    " list_id = excluded.list_id,"
+                    " swimlane_id = CASE"
+                    "   WHEN excluded.swimlane_id != '' THEN excluded.swimlane_id"
+                    "   WHEN excluded.board_id != board_id"
+                    "     OR excluded.list_id != list_id THEN ''"
+                    "   ELSE swimlane_id END",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def discard(self, card_id: str) -> None:
+        """Forget the location of a card."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM card_locations WHERE namespace = ? AND card_id = ?",
+                (self.namespace, card_id),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
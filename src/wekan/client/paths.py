@@ -0,0 +1,25 @@
+"""
+Local storage locations for WeKan client state
+"""
+
+from pathlib import Path
+
+from .env import getenv
+
+
+def cache_dir() -> Path:
+    """
+    Return the directory for local client state, creating it if needed
+
+    Uses WEKAN_CACHE_DIR when set, otherwise $XDG_CACHE_HOME/wekan
+    (default: ~/.cache/wekan), as seen by the current command. The directory
+    is private to the user.
+    """
+    base = getenv("WEKAN_CACHE_DIR")
+    if base:
+        path = Path(base)
+    else:
+        xdg = getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(xdg) / "wekan"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
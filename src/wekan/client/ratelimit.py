@@ -0,0 +1,202 @@
+"""
+Client-side rate limiting for WeKan REST API requests
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Protocol
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class Bucket(Protocol):
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available; return seconds spent waiting."""
+        ...
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    A caller that finds the bucket empty reserves its token anyway and
+    sleeps until it is due, so sustained load settles at ``rate`` requests
+    per second while short bursts go through immediately.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (default: max(1, rate))
+            clock: Monotonic time source
+            sleep: Function used to wait for tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens, going into debt if needed; return seconds until they are due."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate) - tokens
+            self._updated = now
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available; return seconds spent waiting."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose state lives in a locked file
+
+    Every process that opens the same ``path`` and ``name`` draws from one
+    shared budget, so several ``wekancli`` processes on a host stay under a
+    combined request rate. Uses POSIX advisory locks (``fcntl.flock``).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        name: str,
+        rate: float,
+        burst: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize file-backed token bucket
+
+        Args:
+            path: State file shared between processes
+            name: Bucket name within the state file
+            rate: Tokens added per second
+            burst: Bucket capacity (default: max(1, rate))
+            sleep: Function used to wait for tokens
+        """
+        if fcntl is None:
+            raise RuntimeError("File-backed rate limiting requires fcntl (POSIX)")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.path = Path(path)
+        self.name = name
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._sleep = sleep
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens, going into debt if needed; return seconds until they are due."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+                # Wall-clock time, since monotonic clocks are per-process
+                now = time.time()
+                available, updated = state.get(self.name, (self.burst, now))
+                elapsed = max(0.0, now - updated)
+                available = min(self.burst, available + elapsed * self.rate) - tokens
+                wait = max(0.0, -available / self.rate)
+                state[self.name] = (available, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available; return seconds spent waiting."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Separate request budgets for reads and writes
+
+    GET/HEAD/OPTIONS requests draw from the read bucket and everything else
+    from the write bucket. Either bucket may be None to leave that class of
+    request unlimited.
+    """
+
+    def __init__(self, read: Bucket | None = None, write: Bucket | None = None):
+        self.read = read
+        self.write = write
+
+    @classmethod
+    def create(
+        cls,
+        read_rate: float | None = None,
+        write_rate: float | None = None,
+        read_burst: float | None = None,
+        write_burst: float | None = None,
+        path: str | os.PathLike | None = None,
+        key: str = "default",
+    ) -> "RateLimiter":
+        """
+        Build a limiter from rates, shared across processes when path is given
+
+        Args:
+            read_rate: Read requests per second (None = unlimited)
+            write_rate: Write requests per second (None = unlimited)
+            read_burst: Read bucket capacity
+            write_burst: Write bucket capacity
+            path: State file for a cross-process budget (default: in-process)
+            key: Budget name within the state file, e.g. the server URL
+        """
+
+        def bucket(kind: str, rate: float | None, burst: float | None):
+            if rate is None:
+                return None
+            if path is None:
+                return TokenBucket(rate, burst)
+            return FileTokenBucket(path, f"{key}:{kind}", rate, burst)
+
+        return cls(
+            bucket("read", read_rate, read_burst),
+            bucket("write", write_rate, write_burst),
+        )
+
+    def acquire(self, method: str) -> float:
+        """Block until the budget for this HTTP method allows a request."""
+        bucket = self.read if method.upper() in READ_METHODS else self.write
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
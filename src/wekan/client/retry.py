@@ -0,0 +1,119 @@
+"""
+Retry policy for WeKan REST API requests
+"""
+
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request
+
+    Idempotent methods (GET, PUT, DELETE) are retried by default. POST is
+    only retried when added to ``methods``, since replaying a create can
+    duplicate data on the server.
+
+    Attributes:
+        max_retries: Retries per request after the first attempt
+        backoff_factor: Base delay in seconds, doubled on every retry
+        max_backoff: Upper bound on a single delay in seconds
+        jitter: Randomize each delay between zero and the computed backoff
+        statuses: HTTP status codes that trigger a retry
+        methods: HTTP methods that may be retried
+        respect_retry_after: Honor the server's Retry-After header
+        budget: Total retries allowed over the client's lifetime (None = no limit)
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    statuses: frozenset[int] = RETRY_STATUSES
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    budget: int | None = None
+
+    def is_retryable(
+        self,
+        method: str,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Return whether a failed attempt (0-based) should be retried."""
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        return response is not None and response.status_code in self.statuses
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Return seconds to wait before retrying after a failed attempt (0-based)."""
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        backoff = min(self.backoff_factor * (2**attempt), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+
+@dataclass
+class RetryStats:
+    """Retry counters accumulated by a client, safe to update from many threads."""
+
+    retries: int = 0
+    exhausted: int = 0
+    reasons: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def acquire(self, budget: int | None, reason: str) -> bool:
+        """Consume one retry from the budget, recording its reason."""
+        with self._lock:
+            if budget is not None and self.retries >= budget:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            self.reasons[reason] += 1
+            return True
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "reasons": dict(self.reasons),
+            }
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,125 @@
+"""
+Request events for WeKanClient hooks, and per-endpoint latency statistics
+"""
+
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    An HTTP request about to be sent, passed to before-request hooks
+
+    Attributes:
+        method: HTTP method
+        route: Route template, e.g. /api/boards/{board_id}, which groups
+            requests by endpoint regardless of IDs
+        url: Full request URL
+        attempt: 0 for the first attempt, then 1, 2... for retries
+    """
+
+    method: str
+    route: str
+    url: str
+    attempt: int
+
+
+@dataclass(frozen=True)
+class ResponseEvent(RequestEvent):
+    """
+    A finished request attempt, passed to after-response hooks
+
+    Attributes:
+        status: HTTP status, or None if no response arrived
+        bytes: Size of the response body
+        duration: Seconds from sending the request to receiving the body
+        error: Connection error or timeout that ended the attempt, if any
+    """
+
+    status: int | None
+    bytes: int
+    duration: float
+    error: Exception | None = None
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class EndpointStats:
+    """Counters and durations of the requests to one endpoint."""
+
+    count: int = 0
+    errors: int = 0
+    bytes: int = 0
+    durations: list[float] = field(default_factory=list, repr=False)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters and the p50/p95/p99/max durations in seconds."""
+        ordered = sorted(self.durations)
+        result: dict[str, float] = {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+        }
+        for p in (50, 95, 99):
+            result[f"p{p}"] = _percentile(ordered, p) if ordered else 0.0
+        result["max"] = ordered[-1] if ordered else 0.0
+        return result
+
+
+class RequestStats:
+    """
+    Per-endpoint request counts and latency percentiles
+
+    An instance is an after-response hook: add it to a client's
+    after_response list (or call it with each ResponseEvent) and read the
+    summary when done. Safe to update from many threads.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: defaultdict[str, EndpointStats] = defaultdict(EndpointStats)
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ResponseEvent) -> None:
+        self.record(event)
+
+    def record(self, event: ResponseEvent) -> None:
+        """Add one request attempt to its endpoint's statistics."""
+        with self._lock:
+            endpoint = self._endpoints[f"{event.method} {event.route}"]
+            endpoint.count += 1
+            endpoint.bytes += event.bytes
+            endpoint.durations.append(event.duration)
+            if event.status is None or event.status >= 400:
+                endpoint.errors += 1
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Return a snapshot keyed by "METHOD route", busiest endpoint first."""
+        with self._lock:
+            endpoints = sorted(
+                self._endpoints.items(), key=lambda item: -item[1].count
+            )
+            return {name: stats.as_dict() for name, stats in endpoints}
+
+    def summary(self) -> str:
+        """Format the statistics as a table, with durations in milliseconds."""
+        endpoints = self.as_dict()
+        if not endpoints:
+            return "No requests sent"
+        width = max(len(name) for name in endpoints)
+        lines = [
+            f"{'endpoint':<{width}}  {'count':>5} {'errors':>6} {'bytes':>10}"
+            f" {'p50':>8} {'p95':>8} {'p99':>8}"
+        ]
+        for name, s in endpoints.items():
+            lines.append(
+                f"{name:<{width}}  {s['count']:>5} {s['errors']:>6} {s['bytes']:>10}"
+                + "".join(f" {s[p] * 1000:>6.1f}ms" for p in ("p50", "p95", "p99"))
+            )
+        return "\n".join(lines)
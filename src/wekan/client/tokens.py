@@ -0,0 +1,111 @@
+"""
+Persistent cache of login tokens
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .paths import cache_dir
+from .types import LoginResponse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenCache:
+    """
+    Login tokens kept on disk, keyed by server URL and username
+
+    Lets every process that logs in as the same user reuse one token until
+    it expires, instead of logging in (and being issued a new token) each
+    time. The file holds credentials, so it is readable by its owner only.
+    Safe to share between threads and processes (POSIX advisory locks).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        margin: float = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open a token cache
+
+        Args:
+            path: JSON state file (default: <cache dir>/tokens.json)
+            margin: Seconds before tokenExpires at which a token is not reused
+            clock: Wall-clock time source
+        """
+        self.path = Path(path) if path is not None else cache_dir() / "tokens.json"
+        self.margin = margin
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def get(self, url: str, username: str) -> LoginResponse | None:
+        """Return the cached login of a user, or None if missing or expiring."""
+        with self._state() as state:
+            entry = state.get(url, {}).get(username)
+        if not entry:
+            return None
+        try:
+            login = LoginResponse.model_validate(entry)
+            expires = datetime.fromisoformat(login.tokenExpires).timestamp()
+        except ValueError:
+            return None
+        if expires - self.margin <= self._clock():
+            return None
+        return login
+
+    def put(self, url: str, username: str, login: LoginResponse) -> None:
+        """Store the login of a user, replacing any previous one."""
+        with self._state(write=True) as state:
+            state.setdefault(url, {})[username] = login.model_dump()
+
+    def discard(self, url: str, username: str, token: str | None = None) -> None:
+        """
+        Forget the login of a user
+
+        Args:
+            url: Server URL
+            username: Username
+            token: Only forget the login if it still holds this token, so
+                that one another process has just stored is kept
+        """
+        with self._state(write=True) as state:
+            users = state.get(url, {})
+            if username in users and token in (None, users[username].get("token")):
+                del users[username]
+
+    @contextlib.contextmanager
+    def _state(self, write: bool = False) -> Iterator[dict[str, Any]]:
+        """Hold the file locked and yield its contents, saving them if write."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            # A file created some other way still must not be world-readable
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "r+") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+                try:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    yield state
+                    if write:
+                        f.seek(0)
+                        f.truncate()
+                        f.write(json.dumps(state))
+                        f.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,14 @@
+"""
+Local SQLite mirror of a WeKan server
+"""
+
+from .store import Mirror, SearchHit, default_mirror_path
+from .sync import SyncStats, sync
+
+__all__ = [
+    "Mirror",
+    "SearchHit",
+    "SyncStats",
+    "default_mirror_path",
+    "sync",
+]
@@ -0,0 +1,295 @@
+"""
+Filter language for querying the cards of a Mirror
+
+A query is a whitespace-separated list of terms (or a list of terms, as
+on a command line) that must all match. Each term is FIELD OP VALUE, for
+example::
+
+    assignee=u1 label=Urgent,Bug due<=this-week cf.points>=3
+
+Operators are = and != for every field, < <= > >= for dates and custom
+fields, and ~ (case-insensitive substring) for titles and custom fields.
+With = and != a comma-separated value matches any of its parts. Custom
+fields compare as numbers with < <= > >= when the value is a number.
+
+Dates take ISO dates or datetimes, "now", "today", "tomorrow",
+"yesterday", "this-week", "next-week", "last-week", "this-month" or an
+offset from now such as +3d, -2w or +12h. Days and weeks are taken in
+local time. "none" matches cards without a value.
+"""
+
+import re
+import shlex
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+# Field name -> (kind, column or side table)
+FIELDS: dict[str, tuple[str, str]] = {
+    "card": ("id", "id"),
+    "board": ("id", "board_id"),
+    "list": ("id", "list_id"),
+    "swimlane": ("id", "swimlane_id"),
+    "assignee": ("set", "card_assignees"),
+    "member": ("set", "card_members"),
+    "label": ("set", "card_labels"),
+    "title": ("text", "title"),
+    "due": ("date", "due_at"),
+    "start": ("date", "start_at"),
+    "end": ("date", "end_at"),
+    "received": ("date", "received_at"),
+    "created": ("date", "created_at"),
+    "modified": ("date", "modified_at"),
+    "activity": ("date", "last_activity_at"),
+}
+
+ALIASES = {
+    "id": "card",
+    "cardId": "card",
+    "boardId": "board",
+    "listId": "list",
+    "swimlaneId": "swimlane",
+    "assignees": "assignee",
+    "members": "member",
+    "labels": "label",
+    "labelIds": "label",
+    "dueAt": "due",
+    "startAt": "start",
+    "endsAt": "end",
+    "endAt": "end",
+    "receivedAt": "received",
+    "createdAt": "created",
+    "modifiedAt": "modified",
+    "dateLastActivity": "activity",
+}
+
+CUSTOM_FIELD_PREFIXES = ("cf.", "customFields.")
+
+OPERATORS = {
+    "id": {"=", "!="},
+    "set": {"=", "!="},
+    "text": {"=", "!=", "~"},
+    "date": {"=", "!=", "<", "<=", ">", ">="},
+    "custom": {"=", "!=", "<", "<=", ">", ">=", "~"},
+}
+
+_TERM = re.compile(r"^([A-Za-z][\w.-]*?)(!=|<=|>=|=|<|>|~)(.*)$", re.S)
+_OFFSET = re.compile(r"^([+-]\d+)([hdw])$")
+_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+# Stored custom field values that can be compared as numbers
+_NUMERIC_VALUE = "value GLOB '*[0-9]*' AND value NOT GLOB '*[^0-9.eE+-]*'"
+
+
+class Term(NamedTuple):
+    """One FIELD OP VALUE condition of a query."""
+
+    field: str
+    op: str
+    value: str
+
+
+def parse_query(text: str | list[str]) -> list[Term]:
+    """
+    Split a query into terms
+
+    Args:
+        text: Query text, where values containing spaces may be quoted, or
+            a list of terms such as command line arguments (not split)
+
+    Returns:
+        Terms with field aliases resolved
+    """
+    terms = []
+    for token in shlex.split(text) if isinstance(text, str) else text:
+        match = _TERM.match(token)
+        if not match:
+            raise ValueError(
+                f"Invalid query term '{token}', expected FIELD OP VALUE"
+            )
+        field, op, value = match.groups()
+        field = ALIASES.get(field, field)
+        kind = _kind(field)
+        if op not in OPERATORS[kind]:
+            raise ValueError(f"Operator '{op}' is not supported for field '{field}'")
+        terms.append(Term(field, op, value))
+    return terms
+
+
+def compile_query(
+    terms: list[Term], now: datetime | None = None
+) -> tuple[str, list[Any]]:
+    """
+    Compile terms into an SQL condition on the cards table (aliased c)
+
+    Args:
+        terms: Parsed query terms
+        now: Reference time for relative dates (default: current time)
+
+    Returns:
+        SQL expression and its parameters
+    """
+    now = now or datetime.now().astimezone()
+    clauses, params = [], []
+    for term in terms:
+        sql, args = _compile_term(term, now)
+        clauses.append(sql)
+        params.extend(args)
+    return " AND ".join(clauses) or "1 = 1", params
+
+
+def _kind(field: str) -> str:
+    if field.startswith(CUSTOM_FIELD_PREFIXES):
+        return "custom"
+    if field == "archived":
+        raise ValueError("The mirror only holds cards that are not archived")
+    if field not in FIELDS:
+        raise ValueError(f"Unknown query field '{field}'")
+    return FIELDS[field][0]
+
+
+def _compile_term(term: Term, now: datetime) -> tuple[str, list[Any]]:
+    kind = _kind(term.field)
+    op, value = term.op, term.value
+    values = [v for v in value.split(",") if v] if op in ("=", "!=") else [value]
+    if not values:
+        raise ValueError(f"Missing value for '{term.field}'")
+    negate = op == "!="
+
+    if kind == "custom":
+        field_id = term.field.split(".", 1)[1]
+        if value == "none":
+            sql = (
+                "c.id IN (SELECT card_id FROM card_custom_fields"
+                " WHERE field_id = ? AND value IS NOT NULL)"
+            )
+            return (f"NOT {sql}" if op == "=" else sql), [field_id]
+        if op in ("=", "!="):
+            cond, args = f"value IN ({_marks(values)})", values
+        elif op == "~":
+            cond, args = "value LIKE ? ESCAPE '\\'", [f"%{_escape_like(value)}%"]
+        elif _NUMBER.match(value):
+            # As numbers, so that 10 > 5, skipping values that are not numbers
+            cond = f"{_NUMERIC_VALUE} AND CAST(value AS REAL) {op} ?"
+            args = [float(value)]
+        else:
+            cond, args = f"value {op} ?", [value]
+        sql = (
+            "c.id IN (SELECT card_id FROM card_custom_fields"
+            f" WHERE field_id = ? AND {cond})"
+        )
+        return (f"NOT {sql}" if negate else sql), [field_id, *args]
+
+    column = FIELDS[term.field][1]
+    if kind == "id":
+        sql = f"c.{column} {'NOT IN' if negate else 'IN'} ({_marks(values)})"
+        return sql, values
+
+    if kind == "set":
+        if values == ["none"]:
+            sql = f"c.id IN (SELECT card_id FROM {column})"
+            return (f"NOT {sql}" if op == "=" else sql), []
+        if term.field == "label":
+            # Match labels by ID or by name
+            sql = (
+                "c.id IN (SELECT card_id FROM card_labels WHERE label_id IN"
+                f" ({_marks(values)}) OR label_id IN (SELECT label_id FROM"
+                f" board_labels WHERE name IN ({_marks(values)})))"
+            )
+            args = values * 2
+        else:
+            sql = (
+                f"c.id IN (SELECT card_id FROM {column}"
+                f" WHERE user_id IN ({_marks(values)}))"
+            )
+            args = values
+        return (f"NOT {sql}" if negate else sql), args
+
+    if kind == "text":
+        if op == "~":
+            return f"c.{column} LIKE ? ESCAPE '\\'", [f"%{_escape_like(value)}%"]
+        sql = f"c.{column} COLLATE NOCASE IN ({_marks(values)})"
+        return (f"NOT {sql}" if negate else sql), values
+
+    # Dates
+    if value == "none":
+        return f"c.{column} IS {'NOT ' if negate else ''}NULL", []
+    if op in ("=", "!="):
+        conds, args = [], []
+        for v in values:
+            sql, a = _compile_date(column, "=", v, now)
+            conds.append(sql)
+            args.extend(a)
+        sql = f"({' OR '.join(conds)})"
+        if negate:
+            return f"(c.{column} IS NULL OR NOT {sql})", args
+        return sql, args
+    return _compile_date(column, op, value, now)
+
+
+def _compile_date(
+    column: str, op: str, value: str, now: datetime
+) -> tuple[str, list[Any]]:
+    start, end = _parse_date(value, now)
+    col = f"c.{column}"
+    if start == end:
+        return f"{col} {op} ?", [start]
+    if op == "=":
+        return f"({col} >= ? AND {col} < ?)", [start, end]
+    if op == "<":
+        return f"{col} < ?", [start]
+    if op == ">=":
+        return f"{col} >= ?", [start]
+    if op == "<=":
+        return f"{col} < ?", [end]
+    return f"{col} >= ?", [end]
+
+
+def _parse_date(value: str, now: datetime) -> tuple[str, str]:
+    """Return the [start, end) range a date value covers, in stored format."""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    monday = midnight - timedelta(days=midnight.weekday())
+    named = {
+        "today": (midnight, midnight + timedelta(days=1)),
+        "tomorrow": (midnight + timedelta(days=1), midnight + timedelta(days=2)),
+        "yesterday": (midnight - timedelta(days=1), midnight),
+        "this-week": (monday, monday + timedelta(weeks=1)),
+        "next-week": (monday + timedelta(weeks=1), monday + timedelta(weeks=2)),
+        "last-week": (monday - timedelta(weeks=1), monday),
+    }
+    if value == "now":
+        return _stamp(now), _stamp(now)
+    if value in named:
+        start, end = named[value]
+        return _stamp(start), _stamp(end)
+    if value == "this-month":
+        start = midnight.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return _stamp(start), _stamp(end)
+    match = _OFFSET.match(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        units = {"h": "hours", "d": "days", "w": "weeks"}
+        point = now + timedelta(**{units[unit]: amount})
+        return _stamp(point), _stamp(point)
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}'") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=now.tzinfo)
+    if len(value) == 10:  # A bare date covers the whole (local) day
+        return _stamp(parsed), _stamp(parsed + timedelta(days=1))
+    return _stamp(parsed), _stamp(parsed)
+
+
+def _stamp(when: datetime) -> str:
+    """Format a datetime like the dates WeKan returns (UTC, milliseconds)."""
+    when = when.astimezone(timezone.utc)
+    return when.strftime("%Y-%m-%dT%H:%M:%S.") + f"{when.microsecond // 1000:03d}Z"
+
+
+def _marks(values: list[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
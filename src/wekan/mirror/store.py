@@ -0,0 +1,686 @@
+"""
+SQLite storage for the local mirror of a WeKan server
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, TypeVar
+
+from ..client import (
+    BoardDetails,
+    CardDetails,
+    ChecklistDetails,
+    Comment,
+    ListDetails,
+    SwimlaneDetails,
+    WeKanModel,
+)
+from ..client.paths import cache_dir
+from .query import ALIASES, FIELDS, compile_query, parse_query
+
+M = TypeVar("M", bound=WeKanModel)
+
+SCHEMA_VERSION = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    modified_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS swimlanes (
+    id TEXT PRIMARY KEY,
+    board_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    modified_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lists (
+    id TEXT PRIMARY KEY,
+    board_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    modified_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cards (
+    id TEXT PRIMARY KEY,
+    board_id TEXT NOT NULL,
+    list_id TEXT NOT NULL,
+    swimlane_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    due_at TEXT,
+    start_at TEXT,
+    end_at TEXT,
+    received_at TEXT,
+    created_at TEXT,
+    modified_at TEXT,
+    last_activity_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS card_assignees (
+    card_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (card_id, user_id)
+);
+CREATE TABLE IF NOT EXISTS card_members (
+    card_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (card_id, user_id)
+);
+CREATE TABLE IF NOT EXISTS card_labels (
+    card_id TEXT NOT NULL,
+    label_id TEXT NOT NULL,
+    PRIMARY KEY (card_id, label_id)
+);
+CREATE TABLE IF NOT EXISTS card_custom_fields (
+    card_id TEXT NOT NULL,
+    field_id TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (card_id, field_id)
+);
+CREATE TABLE IF NOT EXISTS board_labels (
+    board_id TEXT NOT NULL,
+    label_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    color TEXT,
+    PRIMARY KEY (board_id, label_id)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    card_id TEXT NOT NULL,
+    board_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checklists (
+    id TEXT PRIMARY KEY,
+    card_id TEXT NOT NULL,
+    board_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_docs (
+    rowid INTEGER PRIMARY KEY,
+    card_id TEXT NOT NULL UNIQUE
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS card_search USING fts5 (
+    title,
+    description,
+    comments,
+    checklists,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE INDEX IF NOT EXISTS swimlanes_board ON swimlanes (board_id);
+CREATE INDEX IF NOT EXISTS lists_board ON lists (board_id);
+CREATE INDEX IF NOT EXISTS cards_board ON cards (board_id);
+CREATE INDEX IF NOT EXISTS cards_list ON cards (list_id);
+CREATE INDEX IF NOT EXISTS cards_swimlane ON cards (swimlane_id);
+CREATE INDEX IF NOT EXISTS cards_due ON cards (due_at);
+CREATE INDEX IF NOT EXISTS card_assignees_user ON card_assignees (user_id);
+CREATE INDEX IF NOT EXISTS card_members_user ON card_members (user_id);
+CREATE INDEX IF NOT EXISTS card_labels_label ON card_labels (label_id);
+CREATE INDEX IF NOT EXISTS card_custom_fields_value
+    ON card_custom_fields (field_id, value);
+CREATE INDEX IF NOT EXISTS board_labels_name ON board_labels (name);
+CREATE INDEX IF NOT EXISTS comments_card ON comments (card_id);
+CREATE INDEX IF NOT EXISTS checklists_card ON checklists (card_id);
+"""
+
+# bm25 column weights of card_search: title, description, comments, checklists
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0, 2.0)
+
+# Tables holding one row per (card, value) of a card's list fields
+CARD_VALUE_TABLES = (
+    "card_assignees",
+    "card_members",
+    "card_labels",
+    "card_custom_fields",
+)
+
+
+class SearchHit(NamedTuple):
+    """A card found by Mirror.search(), with its BM25 score and a text snippet."""
+
+    card: CardDetails
+    score: float
+    snippet: str
+
+
+def default_mirror_path(url: str) -> Path:
+    """Return the default mirror database for a server URL."""
+    digest = hashlib.sha1(url.rstrip("/").encode()).hexdigest()[:12]
+    return cache_dir() / f"mirror-{digest}.db"
+
+
+class Mirror:
+    """
+    Local SQLite copy of boards, swimlanes, lists, cards, comments and checklists
+
+    Each entity is stored as its model's JSON alongside the columns needed to
+    look it up, and list fields of cards (assignees, members, labels, custom
+    fields) are unpacked into indexed side tables. Card text, comments and
+    checklist items are kept in an FTS5 index as they are written. Populate
+    it with
+    wekan.mirror.sync(); read it without touching the server through the
+    accessor methods, query() or the tables directly.
+
+    The mirror is a cache: a database written by an older schema version is
+    dropped and rebuilt by the next sync.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Open (or create) a mirror database
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(
+            "INSERT OR IGNORE INTO sync_state VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> "Mirror":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+    # -- writes ------------------------------------------------------------
+
+    def put_board(self, board: BoardDetails) -> None:
+        self._upsert(
+            "boards",
+            ("id", "title", "modified_at", "data"),
+            [(board.boardId, board.title, board.modifiedAt, board.model_dump_json())],
+        )
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM board_labels WHERE board_id = ?", (board.boardId,)
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO board_labels VALUES (?, ?, ?, ?)",
+                [
+                    (board.boardId, label.labelId, label.name, label.color)
+                    for label in board.labels or ()
+                ],
+            )
+
+    def put_swimlanes(self, swimlanes: Iterable[SwimlaneDetails]) -> None:
+        self._upsert(
+            "swimlanes",
+            ("id", "board_id", "title", "modified_at", "data"),
+            [
+                (x.swimlaneId, x.boardId, x.title, x.modifiedAt, x.model_dump_json())
+                for x in swimlanes
+            ],
+        )
+
+    def put_lists(self, lists: Iterable[ListDetails]) -> None:
+        self._upsert(
+            "lists",
+            ("id", "board_id", "title", "modified_at", "data"),
+            [
+                (x.listId, x.boardId, x.title, x.modifiedAt, x.model_dump_json())
+                for x in lists
+            ],
+        )
+
+    def put_cards(self, cards: Iterable[CardDetails]) -> None:
+        """Store cards, leaving those stored with the same data untouched."""
+        cards = list(cards)
+        data = {c.cardId: c.model_dump_json() for c in cards}
+        with self._lock:
+            stored = {
+                card_id: row[0]
+                for card_id in data
+                for row in self.conn.execute(
+                    "SELECT data FROM cards WHERE id = ?", (card_id,)
+                )
+            }
+        cards = [c for c in cards if stored.get(c.cardId) != data[c.cardId]]
+        if not cards:
+            return
+        self._upsert(
+            "cards",
+            (
+                "id",
+                "board_id",
+                "list_id",
+                "swimlane_id",
+                "title",
+                "due_at",
+                "start_at",
+                "end_at",
+                "received_at",
+                "created_at",
+                "modified_at",
+                "last_activity_at",
+                "data",
+            ),
+            [
+                (
+                    c.cardId,
+                    c.boardId,
+                    c.listId,
+                    c.swimlaneId,
+                    c.title,
+                    c.dueAt,
+                    c.startAt,
+                    c.endsAt,
+                    c.receivedAt,
+                    c.createdAt,
+                    c.modifiedAt,
+                    c.dateLastActivity,
+                    data[c.cardId],
+                )
+                for c in cards
+            ],
+        )
+        values = {
+            "card_assignees": [(c.cardId, u) for c in cards for u in c.assignees],
+            "card_members": [(c.cardId, u) for c in cards for u in c.members],
+            "card_labels": [(c.cardId, lbl) for c in cards for lbl in c.labelIds],
+            "card_custom_fields": [
+                (c.cardId, cf["_id"], _field_value(cf.get("value")))
+                for c in cards
+                for cf in c.customFields
+                if "_id" in cf
+            ],
+        }
+        with self._lock, self.conn:
+            self._delete_card_values([c.cardId for c in cards])
+            for table, rows in values.items():
+                if not rows:
+                    continue
+                placeholders = ", ".join("?" for _ in rows[0])
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})", rows
+                )
+            self._index_text([c.cardId for c in cards])
+
+    def replace_card_children(
+        self,
+        card_id: str,
+        board_id: str,
+        comments: list[Comment],
+        checklists: list[ChecklistDetails],
+    ) -> None:
+        """Replace the stored comments and checklists of a card."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM comments WHERE card_id = ?", (card_id,))
+            self.conn.execute("DELETE FROM checklists WHERE card_id = ?", (card_id,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?)",
+                [
+                    (c.commentId, card_id, board_id, c.model_dump_json())
+                    for c in comments
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO checklists VALUES (?, ?, ?, ?)",
+                [
+                    (c.checklistId, card_id, board_id, c.model_dump_json())
+                    for c in checklists
+                ],
+            )
+            self._index_text([card_id])
+
+    def prune(self, table: str, board_id: str, keep_ids: Iterable[str]) -> int:
+        """Delete rows of a board not in keep_ids; return how many were removed."""
+        if table not in ("swimlanes", "lists", "cards"):
+            raise ValueError(f"Cannot prune table {table}")
+        keep = set(keep_ids)
+        with self._lock, self.conn:
+            stale = [
+                row[0]
+                for row in self.conn.execute(
+                    f"SELECT id FROM {table} WHERE board_id = ?", (board_id,)
+                )
+                if row[0] not in keep
+            ]
+            self.conn.executemany(
+                f"DELETE FROM {table} WHERE id = ?", [(i,) for i in stale]
+            )
+            if table == "cards":
+                for child in ("comments", "checklists"):
+                    self.conn.executemany(
+                        f"DELETE FROM {child} WHERE card_id = ?",
+                        [(i,) for i in stale],
+                    )
+                self._delete_card_values(stale)
+        return len(stale)
+
+    def delete_board(self, board_id: str) -> None:
+        """Delete a board and everything stored under it."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM boards WHERE id = ?", (board_id,))
+            self.conn.execute(
+                "DELETE FROM board_labels WHERE board_id = ?", (board_id,)
+            )
+            card_ids = [
+                row[0]
+                for row in self.conn.execute(
+                    "SELECT id FROM cards WHERE board_id = ?", (board_id,)
+                )
+            ]
+            self._delete_card_values(card_ids)
+            for table in ("swimlanes", "lists", "cards", "comments", "checklists"):
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE board_id = ?", (board_id,)
+                )
+
+    def set_state(self, key: str, value: str) -> None:
+        self._upsert("sync_state", ("key", "value"), [(key, value)])
+
+    def get_state(self, key: str) -> str | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_synced(self) -> None:
+        self.set_state("last_sync", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+
+    # -- reads -------------------------------------------------------------
+
+    def card_versions(self, board_id: str) -> dict[str, tuple[str | None, str | None]]:
+        """Return cardId -> (modifiedAt, dateLastActivity) for a board."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, modified_at, last_activity_at FROM cards"
+                " WHERE board_id = ?",
+                (board_id,),
+            ).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def boards(self) -> list[BoardDetails]:
+        return self._select(BoardDetails, "SELECT data FROM boards ORDER BY title")
+
+    def board_ids(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT id FROM boards")]
+
+    def swimlanes(self, board_id: str) -> list[SwimlaneDetails]:
+        return self._select(
+            SwimlaneDetails,
+            "SELECT data FROM swimlanes WHERE board_id = ?",
+            (board_id,),
+        )
+
+    def lists(self, board_id: str) -> list[ListDetails]:
+        return self._select(
+            ListDetails, "SELECT data FROM lists WHERE board_id = ?", (board_id,)
+        )
+
+    def cards(
+        self, board_id: str | None = None, list_id: str | None = None
+    ) -> list[CardDetails]:
+        sql = "SELECT data FROM cards WHERE 1 = 1"
+        params: list[str] = []
+        if board_id is not None:
+            sql += " AND board_id = ?"
+            params.append(board_id)
+        if list_id is not None:
+            sql += " AND list_id = ?"
+            params.append(list_id)
+        return self._select(CardDetails, sql, params)
+
+    def query(
+        self,
+        query: str | list[str],
+        order_by: str = "title",
+        limit: int | None = None,
+        now: datetime | None = None,
+    ) -> list[CardDetails]:
+        """
+        Find cards matching a query (see wekan.mirror.query)
+
+        Args:
+            query: Query text, e.g. "assignee=u1 due<=this-week", or a list
+                of terms
+            order_by: Field to sort by (title or a date field), "-" for descending
+            limit: Maximum number of cards to return
+            now: Reference time for relative dates
+
+        Returns:
+            Matching cards
+        """
+        where, params = compile_query(parse_query(query), now)
+        descending = order_by.startswith("-")
+        field = ALIASES.get(order_by.lstrip("-"), order_by.lstrip("-"))
+        kind, column = FIELDS.get(field, (None, None))
+        if kind not in ("text", "date"):
+            raise ValueError(f"Cannot sort by '{order_by}'")
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT c.data FROM cards c WHERE {where}"
+            f" ORDER BY c.{column} IS NULL, c.{column} {direction}, c.id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._select(CardDetails, sql, params)
+
+    def search(
+        self,
+        text: str | list[str],
+        limit: int | None = 20,
+        board_id: str | None = None,
+    ) -> list[SearchHit]:
+        """
+        Full-text search of card titles, descriptions, comments and checklists
+
+        Every word must match, as a prefix; quoted phrases must match exactly.
+        Hits are ranked by BM25 with titles weighted highest.
+
+        Args:
+            text: Words to search for, or a list of words and phrases
+            limit: Maximum number of hits (None = all)
+            board_id: Only search this board
+
+        Returns:
+            Hits, best first
+        """
+        match = fts_query(text)
+        if not match:
+            return []
+        weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+        sql = (
+            f"SELECT c.data, bm25(card_search, {weights}),"
+            " snippet(card_search, -1, '[', ']', '...', 12)"
+            " FROM card_search"
+            " JOIN search_docs d ON d.rowid = card_search.rowid"
+            " JOIN cards c ON c.id = d.card_id"
+            " WHERE card_search MATCH ?"
+        )
+        params: list[Any] = [match]
+        if board_id is not None:
+            sql += " AND c.board_id = ?"
+            params.append(board_id)
+        sql += " ORDER BY 2"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [
+            SearchHit(CardDetails.model_validate_json(data), -rank, snippet)
+            for data, rank, snippet in rows
+        ]
+
+    def get_card(self, card_id: str) -> CardDetails | None:
+        cards = self._select(
+            CardDetails, "SELECT data FROM cards WHERE id = ?", (card_id,)
+        )
+        return cards[0] if cards else None
+
+    def comments(self, card_id: str) -> list[Comment]:
+        return self._select(
+            Comment, "SELECT data FROM comments WHERE card_id = ?", (card_id,)
+        )
+
+    def checklists(self, card_id: str) -> list[ChecklistDetails]:
+        return self._select(
+            ChecklistDetails,
+            "SELECT data FROM checklists WHERE card_id = ?",
+            (card_id,),
+        )
+
+    # -- internals ---------------------------------------------------------
+
+    def _migrate(self) -> None:
+        """Drop every table of a database written by another schema version."""
+        tables = [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        ]
+        if "sync_state" not in tables:
+            return
+        row = self.conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'schema_version'"
+        ).fetchone()
+        if row and row[0] == str(SCHEMA_VERSION):
+            return
+        virtual = [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master"
+                " WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL%'"
+            )
+        ]
+        with self.conn:
+            # Virtual tables first, which also drops their shadow tables
+            for table in virtual + tables:
+                if not table.startswith("sqlite_"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+    def _delete_card_values(self, card_ids: list[str]) -> None:
+        """Delete the side-table rows of cards; the caller holds the lock."""
+        params = [(i,) for i in card_ids]
+        for table in CARD_VALUE_TABLES:
+            self.conn.executemany(f"DELETE FROM {table} WHERE card_id = ?", params)
+        self.conn.executemany(
+            "DELETE FROM card_search WHERE rowid ="
+            " (SELECT rowid FROM search_docs WHERE card_id = ?)",
+            params,
+        )
+        self.conn.executemany("DELETE FROM search_docs WHERE card_id = ?", params)
+
+    def _index_text(self, card_ids: list[str]) -> None:
+        """Refresh the search index of stored cards; the caller holds the lock."""
+        for card_id in card_ids:
+            row = self.conn.execute(
+                "SELECT data FROM cards WHERE id = ?", (card_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            card = json.loads(row[0])
+            comments = [
+                json.loads(data).get("comment", "")
+                for (data,) in self.conn.execute(
+                    "SELECT data FROM comments WHERE card_id = ?", (card_id,)
+                )
+            ]
+            checklists = []
+            for (data,) in self.conn.execute(
+                "SELECT data FROM checklists WHERE card_id = ?", (card_id,)
+            ):
+                checklist = json.loads(data)
+                checklists.append(checklist.get("title", ""))
+                checklists.extend(i["title"] for i in checklist.get("items") or ())
+            self.conn.execute(
+                "INSERT OR IGNORE INTO search_docs (card_id) VALUES (?)", (card_id,)
+            )
+            (rowid,) = self.conn.execute(
+                "SELECT rowid FROM search_docs WHERE card_id = ?", (card_id,)
+            ).fetchone()
+            self.conn.execute("DELETE FROM card_search WHERE rowid = ?", (rowid,))
+            self.conn.execute(
+                "INSERT INTO card_search (rowid, title, description, comments,"
+                " checklists) VALUES (?, ?, ?, ?, ?)",
+                (
+                    rowid,
+                    card.get("title", ""),
+                    card.get("description", ""),
+                    "\n".join(comments),
+                    "\n".join(checklists),
+                ),
+            )
+
+    def _upsert(
+        self, table: str, columns: tuple[str, ...], rows: list[tuple[Any, ...]]
+    ) -> None:
+        if not rows:
+            return
+        placeholders = ", ".join("?" for _ in columns)
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)})"
+                f" VALUES ({placeholders})",
+                rows,
+            )
+
+    def _select(
+        self, model: type[M], sql: str, params: Iterable[Any] = ()
+    ) -> list[M]:
+        with self._lock:
+            rows = self.conn.execute(sql, tuple(params)).fetchall()
+        return [model.model_validate_json(row[0]) for row in rows]
+
+
+def fts_query(text: str | list[str]) -> str:
+    """
+    Turn user input into an FTS5 query that matches every word
+
+    Quoted phrases are kept as phrases; other words match as prefixes.
+    Given a list, such as command line arguments, each item containing
+    whitespace is a phrase. FTS5 operators in the input are treated as
+    plain words.
+    """
+    if isinstance(text, list):
+        words = text
+    else:
+        try:
+            words = shlex.split(text)
+        except ValueError:
+            words = text.split()
+    terms = []
+    for word in words:
+        if not any(ch.isalnum() for ch in word):
+            continue
+        quoted = '"' + word.replace('"', '""') + '"'
+        terms.append(quoted if " " in word.strip() else quoted + "*")
+    return " ".join(terms)
+
+
+def _field_value(value: Any) -> str | None:
+    """Return a custom field value as the text stored and compared by queries."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
@@ -0,0 +1,247 @@
+"""
+Incremental, concurrent crawl of a WeKan server into a Mirror
+"""
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from ..client import CardDetails, CardInfo, ListDetails, SwimlaneDetails, WeKanClient
+from .store import Mirror
+
+
+@dataclass
+class SyncStats:
+    """What a sync fetched, skipped and removed."""
+
+    boards: int = 0
+    swimlanes: int = 0
+    lists: int = 0
+    cards: int = 0
+    cards_changed: int = 0
+    cards_unchanged: int = 0
+    exports: int = 0
+    removed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of the counters."""
+        return {**self.__dict__, "errors": list(self.errors)}
+
+
+def sync(
+    client: WeKanClient,
+    mirror: Mirror,
+    board_ids: Iterable[str] | None = None,
+    full: bool = False,
+    max_workers: int | None = None,
+) -> SyncStats:
+    """
+    Bring a mirror up to date with the server
+
+    Each phase (boards, lists and swimlanes, cards, card details, comments
+    and checklists) is fetched concurrently with client.gather(). Each
+    board's export (GET /api/boards/{boardId}/export) provides its list
+    and swimlane details and the modifiedAt and dateLastActivity of its
+    cards, so only new or changed cards are fetched, with their comments
+    and checklists. Boards the user may not export fall back to fetching
+    every list, swimlane and card. Entities that disappeared from the
+    server are removed, except under boards where a fetch failed.
+
+    Args:
+        client: Authenticated client
+        mirror: Mirror to update
+        board_ids: Boards to sync (default: every board of the current user)
+        full: Re-fetch everything, ignoring what the mirror already holds
+        max_workers: Concurrent requests (default: the client's pool_maxsize)
+
+    Returns:
+        Statistics of the sync
+    """
+    stats = SyncStats()
+    gather = functools.partial(_gather, client, stats, max_workers)
+
+    if board_ids is None:
+        user = client.get_user()
+        board_ids = [b.boardId for b in client.get_boards_for_user(user.userId)]
+        synced_all = True
+    else:
+        synced_all = False
+    board_ids = list(dict.fromkeys(board_ids))
+
+    # Boards with any failed fetch are not pruned, so a transient error
+    # never deletes data from the mirror
+    failed: set[str] = set()
+
+    # Phase 1: board details, list and swimlane listings, board exports
+    calls: list[tuple[Any, Callable[[], Any]]] = []
+    for board_id in board_ids:
+        calls.append((board_id, functools.partial(client.get_board, board_id)))
+        calls.append((board_id, functools.partial(client.get_lists, board_id)))
+        calls.append((board_id, functools.partial(client.get_swimlanes, board_id)))
+    results = gather(calls, failed)
+    # An export holds every list, swimlane and card version of a board in
+    # one request. Without one (e.g. 403 for non-admins) entities are
+    # fetched one by one, which is not a failure of the board.
+    exports = client.gather(
+        [functools.partial(client.export_board, b) for b in board_ids],
+        max_workers=max_workers,
+    )
+    boards, lists, swimlanes = {}, {}, {}
+    exported: dict[str, dict[str, Any]] = {}
+    for i, board_id in enumerate(board_ids):
+        board, board_lists, board_swimlanes = results[3 * i : 3 * i + 3]
+        if board is not None:
+            mirror.put_board(board)
+            boards[board_id] = board
+            stats.boards += 1
+        lists[board_id] = board_lists
+        swimlanes[board_id] = board_swimlanes
+        if isinstance(exports[i], dict):
+            exported[board_id] = exports[i]
+    board_ids = [b for b in board_ids if b in boards]
+    stats.exports = len([b for b in board_ids if b in exported])
+
+    # Phase 2: list and swimlane details, from the export or fetched
+    calls = []
+    details: list[Any] = []
+    for board_id in board_ids:
+        export = exported.get(board_id, {})
+        for kind, infos, getter, id_attr in (
+            ("lists", lists[board_id], client.get_list, "listId"),
+            ("swimlanes", swimlanes[board_id], client.get_swimlane, "swimlaneId"),
+        ):
+            model = ListDetails if kind == "lists" else SwimlaneDetails
+            docs = {doc.get("_id"): doc for doc in export.get(kind) or ()}
+            for info in infos or ():
+                item_id = getattr(info, id_attr)
+                if item_id in docs:
+                    details.append(model.model_validate(docs[item_id]))
+                else:
+                    call = functools.partial(getter, board_id, item_id)
+                    calls.append((board_id, call))
+    details.extend(gather(calls, failed))
+    mirror.put_lists(d for d in details if isinstance(d, ListDetails))
+    mirror.put_swimlanes(d for d in details if isinstance(d, SwimlaneDetails))
+    for board_id in board_ids:
+        if lists[board_id] is not None:
+            stats.lists += len(lists[board_id])
+            if board_id not in failed:
+                keep = [lst.listId for lst in lists[board_id]]
+                stats.removed += mirror.prune("lists", board_id, keep)
+        if swimlanes[board_id] is not None:
+            stats.swimlanes += len(swimlanes[board_id])
+            if board_id not in failed:
+                keep = [s.swimlaneId for s in swimlanes[board_id]]
+                stats.removed += mirror.prune("swimlanes", board_id, keep)
+
+    # Phase 3: card listings of every list
+    calls = [
+        (
+            (board_id, lst.listId),
+            functools.partial(client.get_cards, board_id, lst.listId),
+        )
+        for board_id in board_ids
+        for lst in lists[board_id] or ()
+    ]
+    listed: list[tuple[str, str, CardInfo]] = []
+    for (board_id, list_id), cards in zip(
+        (key for key, _ in calls), gather(calls, failed)
+    ):
+        listed.extend((board_id, list_id, card) for card in cards or ())
+    stats.cards = len(listed)
+
+    # Phase 4: details of the cards that are new or changed according to
+    # the export, or of every card of boards without one
+    versions: dict[str, tuple[str | None, str | None]] = {}
+    if not full:
+        for board_id in board_ids:
+            versions.update(mirror.card_versions(board_id))
+    export_versions = {
+        doc.get("_id"): (doc.get("modifiedAt"), doc.get("dateLastActivity"))
+        for export in exported.values()
+        for doc in export.get("cards") or ()
+    }
+    calls = [
+        (
+            board_id,
+            functools.partial(client.get_card, board_id, list_id, card.cardId),
+        )
+        for board_id, list_id, card in listed
+        if card.cardId not in versions
+        or export_versions.get(card.cardId) != versions[card.cardId]
+    ]
+    cards: list[CardDetails] = [c for c in gather(calls, failed) if c is not None]
+    changed = [
+        c
+        for c in cards
+        if versions.get(c.cardId) != (c.modifiedAt, c.dateLastActivity)
+    ]
+    stats.cards_changed = len(changed)
+    stats.cards_unchanged = len(listed) - len(changed)
+
+    # Phase 5: comments and checklists of changed cards
+    calls = []
+    for card in changed:
+        for getter in (client.get_comments, client.get_checklists):
+            call = functools.partial(getter, card.boardId, card.cardId)
+            calls.append((card.boardId, call))
+    children = gather(calls, failed)
+    calls = [
+        (
+            card.boardId,
+            functools.partial(
+                client.get_checklist, card.boardId, card.cardId, checklist.checklistId
+            ),
+        )
+        for i, card in enumerate(changed)
+        for checklist in children[2 * i + 1] or ()
+    ]
+    checklists = iter(gather(calls, failed))
+
+    # Children are written before their card so that an interrupted sync
+    # leaves the old version stamp in place and retries the card next time
+    for i, card in enumerate(changed):
+        comments, checklist_infos = children[2 * i : 2 * i + 2]
+        card_checklists = [next(checklists) for _ in checklist_infos or ()]
+        if comments is None or checklist_infos is None:
+            continue
+        if any(c is None for c in card_checklists):
+            continue
+        mirror.replace_card_children(
+            card.cardId, card.boardId, comments, card_checklists
+        )
+        mirror.put_cards([card])
+    # Fetched cards whose version stamp did not change; put_cards only rewrites
+    # and reindexes the ones whose data differs from the stored copy
+    changed_ids = {c.cardId for c in changed}
+    mirror.put_cards(c for c in cards if c.cardId not in changed_ids)
+
+    for board_id in board_ids:
+        if board_id not in failed:
+            keep = [card.cardId for b, _, card in listed if b == board_id]
+            stats.removed += mirror.prune("cards", board_id, keep)
+    if synced_all and not failed:
+        for board_id in set(mirror.board_ids()) - set(board_ids):
+            mirror.delete_board(board_id)
+            stats.removed += 1
+    mirror.mark_synced()
+    return stats
+
+
+def _gather(
+    client: WeKanClient,
+    stats: SyncStats,
+    max_workers: int | None,
+    calls: list[tuple[Any, Callable[[], Any]]],
+    failed: set[str],
+) -> list[Any]:
+    """Run keyed calls concurrently; failures become None and mark their board."""
+    results = client.gather([call for _, call in calls], max_workers=max_workers)
+    for i, ((key, call), result) in enumerate(zip(calls, results)):
+        if isinstance(result, Exception):
+            board_id = key[0] if isinstance(key, tuple) else key
+            failed.add(board_id)
+            stats.errors.append(f"{call.func.__name__}{call.args}: {result}")
+            results[i] = None
+    return results
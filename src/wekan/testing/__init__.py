@@ -0,0 +1,16 @@
+"""
+Test doubles for exercising the client without a live WeKan server
+"""
+
+from .dataset import PRESETS, DatasetSpec, generate
+from .fake_server import ROUTES, FakeStore, FakeWeKanServer, RouteBehavior
+
+__all__ = [
+    "PRESETS",
+    "ROUTES",
+    "DatasetSpec",
+    "FakeStore",
+    "FakeWeKanServer",
+    "RouteBehavior",
+    "generate",
+]
@@ -0,0 +1,409 @@
+"""
+Seeded synthetic WeKan boards for scale and performance testing
+
+generate() fills a FakeStore with boards whose shape follows real usage:
+cards pile up unevenly across lists and swimlanes, most cards have no
+comments while a few have many, and labels, assignees, due dates and
+custom field values are each set on only part of the cards. The same
+spec and seed always produce the same data, IDs included.
+
+Usage:
+    store = generate(PRESETS["large"])
+    with FakeWeKanServer(store) as server:
+        ...
+
+    python -m wekan.testing.dataset --preset small --out exports/
+"""
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .fake_server import FakeStore
+
+# Timestamps are spread over the year before this instant, so they do not
+# depend on when the data is generated
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+LIST_TITLES = ("Backlog", "To Do", "In Progress", "Review", "Blocked", "Done")
+SWIMLANE_TITLES = ("Platform", "Web", "Mobile", "Infrastructure", "Data", "Support")
+LABEL_NAMES = ("bug", "feature", "chore", "urgent", "ux", "security", "docs", "debt")
+LABEL_COLORS = ("red", "green", "blue", "orange", "purple", "yellow", "sky", "navy")
+CUSTOM_FIELD_TYPES = ("dropdown", "number", "text", "date", "checkbox")
+VERBS = (
+    "Fix",
+    "Add",
+    "Update",
+    "Remove",
+    "Refactor",
+    "Investigate",
+    "Document",
+    "Test",
+    "Review",
+    "Migrate",
+)
+NOUNS = (
+    "login page",
+    "rate limiting",
+    "billing export",
+    "search index",
+    "onboarding email",
+    "dashboard widgets",
+    "CSV import",
+    "audit log",
+    "mobile layout",
+    "SSO settings",
+    "webhook retries",
+    "release notes",
+    "nightly backup",
+    "permission checks",
+    "notification service",
+)
+WORDS = (
+    "the",
+    "user",
+    "request",
+    "should",
+    "when",
+    "server",
+    "returns",
+    "error",
+    "after",
+    "update",
+    "page",
+    "data",
+    "cannot",
+    "expected",
+    "timeout",
+    "config",
+    "value",
+    "list",
+    "missing",
+    "works",
+)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    Size and shape of a generated dataset
+
+    Counts are per board. Means are of skewed distributions: most cards
+    get fewer comments, checklists or items than the mean, a few many more.
+
+    Attributes:
+        boards: Boards to generate
+        lists: Lists per board
+        swimlanes: Swimlanes per board (including the default one)
+        cards: Cards per board
+        users: Users, all members of every board
+        labels: Labels per board, besides WeKan's six unnamed defaults
+        custom_fields: Custom fields per board
+        comments_per_card: Mean comments per card
+        checklists_per_card: Mean checklists per card
+        items_per_checklist: Mean items per checklist
+        archived: Fraction of cards that are archived
+        seed: Random seed; the same spec and seed give the same data
+    """
+
+    boards: int = 1
+    lists: int = 6
+    swimlanes: int = 2
+    cards: int = 200
+    users: int = 5
+    labels: int = 6
+    custom_fields: int = 3
+    comments_per_card: float = 1.5
+    checklists_per_card: float = 0.4
+    items_per_checklist: float = 4.0
+    archived: float = 0.03
+    seed: int = 0
+
+
+PRESETS = {
+    "small": DatasetSpec(),
+    "medium": DatasetSpec(boards=3, lists=12, swimlanes=4, cards=5_000, users=20),
+    "large": DatasetSpec(lists=50, swimlanes=20, cards=100_000, users=50, labels=8),
+}
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+class _Generator:
+    def __init__(self, spec: DatasetSpec, store: FakeStore):
+        self.spec = spec
+        self.store = store
+        self.random = random.Random(spec.seed)
+
+    def count(self, mean: float, limit: int = 50) -> int:
+        """Draw a skewed count (geometric-like, rounded exponential)."""
+        if mean <= 0:
+            return 0
+        return min(int(self.random.expovariate(1 / mean) + 0.5), limit)
+
+    def moment(self, after: datetime | None = None) -> datetime:
+        """Draw an instant in the year before EPOCH (and after ``after``)."""
+        start = after or EPOCH - timedelta(days=365)
+        span = (EPOCH - start).total_seconds()
+        return start + timedelta(seconds=self.random.uniform(0, span))
+
+    def weights(self, n: int, skew: float = 1.0) -> list[float]:
+        """Zipf-like weights in random order, so a few items get most draws."""
+        weights = [1 / (rank + 1) ** skew for rank in range(n)]
+        self.random.shuffle(weights)
+        return weights
+
+    def sentence(self, words: int) -> str:
+        text = " ".join(self.random.choices(WORDS, k=words))
+        return text[0].upper() + text[1:] + "."
+
+    def title(self) -> str:
+        return f"{self.random.choice(VERBS)} {self.random.choice(NOUNS)}"
+
+    def numbered(self, names: tuple[str, ...], i: int) -> str:
+        name = names[i % len(names)]
+        return name if i < len(names) else f"{name} {i // len(names) + 1}"
+
+    def users(self) -> list[str]:
+        store = self.store
+        users = []
+        for i in range(self.spec.users):
+            user = store.find_user(f"user{i:03d}") or store.add_user(
+                f"user{i:03d}", "password"
+            )
+            users.append(user["_id"])
+        return users
+
+    def board(self, index: int, owner_id: str, users: list[str]) -> dict[str, Any]:
+        spec, store = self.spec, self.store
+        created = self.moment()
+        board = store.add_board(
+            f"Project {index + 1}",
+            owner_id,
+            createdAt=_timestamp(created),
+            modifiedAt=_timestamp(self.moment(created)),
+        )
+        board_id = board["_id"]
+        board["members"] += [store.member(u) for u in users if u != owner_id]
+        label_ids = [lb["_id"] for lb in board["labels"]]
+        for i in range(spec.labels):
+            name = self.numbered(LABEL_NAMES, i)
+            label_ids.append(store.add_label(board_id, name, LABEL_COLORS[i % 8]))
+
+        default = store.find("swimlanes", boardId=board_id)[0]
+        swimlanes = [default["_id"]] + [
+            store.add_swimlane(board_id, self.numbered(SWIMLANE_TITLES, i))["_id"]
+            for i in range(spec.swimlanes - 1)
+        ]
+        lists = [
+            store.add_list(board_id, self.numbered(LIST_TITLES, i))["_id"]
+            for i in range(spec.lists)
+        ]
+        custom_fields = [
+            self.custom_field(board_id, i) for i in range(spec.custom_fields)
+        ]
+
+        list_weights = self.weights(len(lists))
+        swimlane_weights = self.weights(len(swimlanes))
+        people = users or [owner_id]
+        for _ in range(spec.cards):
+            position = self.random.choices(range(len(lists)), list_weights)[0]
+            self.card(
+                board_id,
+                lists[position],
+                self.random.choices(swimlanes, swimlane_weights)[0],
+                # Cards further right (closer to "Done") are more complete
+                (position + 1) / len(lists),
+                people,
+                label_ids,
+                custom_fields,
+            )
+        return board
+
+    def custom_field(self, board_id: str, index: int) -> dict[str, Any]:
+        kind = CUSTOM_FIELD_TYPES[index % len(CUSTOM_FIELD_TYPES)]
+        settings: dict[str, Any] = {}
+        if kind == "dropdown":
+            settings["dropdownItems"] = [
+                {"_id": self.store.new_id(6), "name": name}
+                for name in ("Low", "Medium", "High", "Critical")
+            ]
+        return self.store.add_custom_field(
+            board_id,
+            f"{kind.title()} {index + 1}",
+            kind,
+            settings=settings,
+            showOnCard=self.random.random() < 0.5,
+        )
+
+    def custom_value(self, field: dict[str, Any]) -> Any:
+        kind = field["type"]
+        if kind == "dropdown":
+            return self.random.choice(field["settings"]["dropdownItems"])["_id"]
+        if kind == "number":
+            return self.random.randint(1, 100)
+        if kind == "date":
+            return _timestamp(self.moment())
+        if kind == "checkbox":
+            return self.random.random() < 0.5
+        return self.title()
+
+    def card(
+        self,
+        board_id: str,
+        list_id: str,
+        swimlane_id: str,
+        progress: float,
+        users: list[str],
+        label_ids: list[str],
+        custom_fields: list[dict[str, Any]],
+    ) -> None:
+        rand, store = self.random, self.store
+        created = self.moment()
+        modified = self.moment(created)
+        fields: dict[str, Any] = {
+            "createdAt": _timestamp(created),
+            "modifiedAt": _timestamp(modified),
+            "dateLastActivity": _timestamp(modified),
+            "labelIds": rand.sample(label_ids, min(self.count(1.2, 4), len(label_ids))),
+            "members": rand.sample(users, min(self.count(0.8, 4), len(users))),
+            "assignees": rand.sample(users, min(self.count(0.7, 3), len(users))),
+        }
+        if rand.random() < 0.6:
+            fields["description"] = " ".join(
+                self.sentence(rand.randint(4, 16)) for _ in range(self.count(3, 30) + 1)
+            )
+        if rand.random() < 0.35:
+            due = created + timedelta(days=rand.uniform(1, 60))
+            fields["dueAt"] = _timestamp(due)
+            if rand.random() < 0.5:
+                fields["startAt"] = _timestamp(created + (due - created) / 3)
+            if rand.random() < progress:
+                fields["endAt"] = _timestamp(self.moment(created))
+        if rand.random() < 0.1:
+            fields["color"] = rand.choice(LABEL_COLORS)
+        if custom_fields:
+            fields["customFields"] = [
+                {"_id": cf["_id"], "value": self.custom_value(cf)}
+                for cf in custom_fields
+                if rand.random() < 0.3
+            ]
+        if rand.random() < self.spec.archived:
+            fields.update(archived=True, archivedAt=_timestamp(self.moment(modified)))
+
+        author = rand.choice(users)
+        card = store.add_card(
+            board_id, list_id, swimlane_id, self.title(), author, **fields
+        )
+        card_id = card["_id"]
+        for _ in range(self.count(self.spec.comments_per_card)):
+            comment = store.add_comment(
+                board_id,
+                card_id,
+                rand.choice(users),
+                self.sentence(rand.randint(3, 40)),
+            )
+            comment["createdAt"] = comment["modifiedAt"] = _timestamp(
+                self.moment(created)
+            )
+        for _ in range(self.count(self.spec.checklists_per_card, 5)):
+            title = rand.choice(("Tasks", "QA", "Todo"))
+            checklist = store.add_checklist(card_id, title)
+            checklist["createdAt"] = _timestamp(self.moment(created))
+            for _ in range(self.count(self.spec.items_per_checklist, 20) + 1):
+                item = store.add_checklist_item(
+                    card_id,
+                    checklist["_id"],
+                    self.title(),
+                    is_finished=rand.random() < progress,
+                )
+                item["createdAt"] = item["modifiedAt"] = checklist["createdAt"]
+            store.update_checklist_finished(checklist["_id"])
+
+
+def generate(
+    spec: DatasetSpec = PRESETS["small"], store: FakeStore | None = None
+) -> FakeStore:
+    """
+    Generate boards into a fake server's store
+
+    Boards are owned by the store's first admin user. A store without one
+    gets the admin FakeWeKanServer would create (admin/admin) first.
+
+    Args:
+        spec: Size and shape of the data
+        store: Store to add the boards to (default: a new store seeded
+            with spec.seed)
+
+    Returns:
+        The store, ready for FakeWeKanServer(store)
+    """
+    if store is None:
+        store = FakeStore(spec.seed)
+    generator = _Generator(spec, store)
+    with store.lock:
+        # Anything the store stamps itself is dated EPOCH, not "now"
+        clock, store.clock = store.clock, EPOCH.timestamp
+        try:
+            admins = [u for u in store.collections["users"].values() if u["isAdmin"]]
+            owner = admins[0] if admins else store.add_user("admin", "admin", True)
+            users = generator.users()
+            for i in range(spec.boards):
+                generator.board(i, owner["_id"], users)
+        finally:
+            store.clock = clock
+    return store
+
+
+def export(store: FakeStore) -> list[dict[str, Any]]:
+    """Return every board of a store in WeKan's /export JSON format."""
+    board_ids = list(store.collections["boards"])
+    return [store.export_board(board_id) for board_id in board_ids]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m wekan.testing.dataset",
+        description="Generate synthetic WeKan boards as /export JSON",
+    )
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    for f in fields(DatasetSpec):
+        parser.add_argument(
+            f"--{f.name.replace('_', '-')}",
+            type=type(f.default),
+            metavar="N",
+            help=f"Override the preset's {f.name}",
+        )
+    parser.add_argument(
+        "--out",
+        type=Path,
+        help="Directory to write one <board id>.json per board "
+        "(default: one export per line on stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    overrides = {
+        f.name: getattr(args, f.name)
+        for f in fields(DatasetSpec)
+        if getattr(args, f.name) is not None
+    }
+    boards = export(generate(replace(PRESETS[args.preset], **overrides)))
+    if args.out is None:
+        for board in boards:
+            sys.stdout.write(json.dumps(board) + "\n")
+        return
+    args.out.mkdir(parents=True, exist_ok=True)
+    for board in boards:
+        (args.out / f"{board['_id']}.json").write_text(json.dumps(board))
+        print(args.out / f"{board['_id']}.json", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
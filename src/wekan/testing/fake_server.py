@@ -0,0 +1,1918 @@
+"""
+In-process fake WeKan server for tests and benchmarks
+
+Serves the REST routes of docs/openapi.yaml, and the variants WeKanClient
+calls that it does not list (all listed in ROUTES), from an in-memory
+FakeStore over keep-alive HTTP on localhost, so a WeKanClient talks to it
+exactly as to a live server: connection pooling, retries, re-login and
+concurrency all run unchanged. Latency, jitter and injected errors are set
+per route and drawn from a seeded generator, so benchmark runs are
+repeatable offline.
+
+Usage:
+    with FakeWeKanServer() as server:
+        server.set_behavior("GET /api/boards/{boardId}/lists", latency=0.005)
+        client = WeKanClient(server.url, "admin", "admin")
+        client.login()
+
+Responses follow the shapes WeKan returns, including a 200 with an empty
+body for a missing entity. Only admin-only routes check permissions;
+board membership is not enforced.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import traceback
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+# Meteor's ID alphabet (no easily confused characters)
+ID_CHARS = "23456789ABCDEFGHJKLMNPQRSTWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Labels WeKan adds to every new board
+DEFAULT_LABEL_COLORS = ("green", "yellow", "orange", "red", "purple", "blue")
+
+# Fields by which each collection is looked up, kept in an index
+INDEXED_FIELDS = {
+    "swimlanes": ("boardId",),
+    "lists": ("boardId",),
+    "cards": ("boardId", "listId", "swimlaneId"),
+    "checklists": ("cardId",),
+    "checklist_items": ("checklistId",),
+    "comments": ("cardId",),
+    "integrations": ("boardId",),
+    "attachments": ("boardId",),
+}
+
+# Card fields add_card() sets itself
+CARD_LOCATION = frozenset(
+    {"_id", "boardId", "listId", "swimlaneId", "title", "userId", "sort", "cardNumber"}
+)
+
+# Board export keys holding the documents of each collection
+EXPORT_KEYS = {
+    "swimlanes": "swimlanes",
+    "lists": "lists",
+    "cards": "cards",
+    "comments": "comments",
+    "checklists": "checklists",
+    "checklistItems": "checklist_items",
+    "customFields": "custom_fields",
+    "attachments": "attachments",
+}
+
+# Other keys of a board export that are not board fields
+EXPORT_EXTRAS = (
+    "_format",
+    "users",
+    "activities",
+    "rules",
+    "triggers",
+    "actions",
+    "subtaskItems",
+)
+
+# (sequence, collection, parent field) advanced by import_board()
+SEQUENCES = (
+    ("swimlanes", "swimlanes", "boardId"),
+    ("lists", "lists", "boardId"),
+    ("cards", "cards", "listId"),
+    ("checklists", "checklists", "cardId"),
+    ("checklist_items", "checklist_items", "checklistId"),
+)
+
+COLLECTIONS = (
+    "users",
+    "boards",
+    "swimlanes",
+    "lists",
+    "cards",
+    "checklists",
+    "checklist_items",
+    "comments",
+    "custom_fields",
+    "integrations",
+    "attachments",
+)
+
+
+def _export_key(collection: str) -> str:
+    return next(k for k, c in EXPORT_KEYS.items() if c == collection)
+
+
+def _iso(timestamp: float) -> str:
+    """Format a Unix time the way WeKan does (millisecond precision, UTC)."""
+    return (
+        datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S.%f"
+        )[:-3]
+        + "Z"
+    )
+
+
+def _as_list(value: Any) -> list:
+    """Read a string-or-array body field; an empty string clears it."""
+    if value == "" or value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _as_bool(value: Any) -> bool:
+    return value is True or str(value).lower() == "true"
+
+
+class _Error(Exception):
+    """An error answered as a Meteor-style JSON error object."""
+
+    def __init__(self, status: int, error: str, reason: str):
+        super().__init__(reason)
+        self.status = status
+        self.body = {
+            "error": error,
+            "reason": reason,
+            "message": f"{reason} [{error}]",
+            "statusCode": status,
+        }
+
+
+def _not_found(label: str) -> _Error:
+    return _Error(404, "not-found", f"{label} not found")
+
+
+@dataclass(frozen=True)
+class RouteBehavior:
+    """
+    How the server delays or fails requests to a route
+
+    Attributes:
+        latency: Seconds to wait before answering
+        jitter: Up to this many extra seconds, drawn uniformly per request
+        error_rate: Fraction of requests answered with error_status instead
+        error_status: HTTP status of injected errors
+        retry_after: Retry-After header (seconds) sent with injected errors
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: float | None = None
+
+
+class FakeStore:
+    """
+    In-memory WeKan database
+
+    Each collection maps _id to a document shaped like WeKan's MongoDB
+    record, which is what the routes return. Documents may be read and
+    changed in place, except their indexed fields (INDEXED_FIELDS), which
+    must be changed with update() so lookups by them stay correct. Every
+    method is safe to call from several threads; hold ``lock`` to read or
+    change several documents atomically.
+    """
+
+    def __init__(self, seed: int = 0, clock: Callable[[], float] = time.time):
+        """
+        Create an empty store
+
+        Args:
+            seed: Seed of the generated IDs and tokens
+            clock: Wall-clock time source for timestamps and token expiry
+        """
+        self.lock = threading.RLock()
+        self.clock = clock
+        self._random = random.Random(seed)
+        self.collections: dict[str, dict[str, dict[str, Any]]] = {
+            name: {} for name in COLLECTIONS
+        }
+        self.passwords: dict[str, str] = {}
+        # token -> (userId, expiry Unix time)
+        self.tokens: dict[str, tuple[str, float]] = {}
+        self._index: defaultdict[tuple[str, str, Any], dict[str, None]] = (
+            defaultdict(dict)
+        )
+        # Next sort value per parent and next card number per board
+        self._sequence: Counter[tuple[str, str]] = Counter()
+
+    # -- generic access ------------------------------------------------------
+
+    def new_id(self, length: int = 17) -> str:
+        """Return a new random Meteor-style ID."""
+        with self.lock:
+            return "".join(self._random.choices(ID_CHARS, k=length))
+
+    def now(self) -> str:
+        """Return the current time as a WeKan timestamp."""
+        return _iso(self.clock())
+
+    def next_sequence(self, kind: str, parent_id: str) -> int:
+        """Return 0, 1, 2... on successive calls for the same parent."""
+        with self.lock:
+            value = self._sequence[kind, parent_id]
+            self._sequence[kind, parent_id] += 1
+            return value
+
+    def get(self, collection: str, doc_id: str) -> dict[str, Any] | None:
+        """Return a document by ID, or None."""
+        return self.collections[collection].get(doc_id)
+
+    def find(self, collection: str, **where: Any) -> list[dict[str, Any]]:
+        """
+        Return the documents whose fields equal the given values
+
+        The first indexed field given is looked up in the index; the rest
+        are compared. Results are ordered by their sort field, if any.
+        """
+        with self.lock:
+            docs = self.collections[collection]
+            indexed = [f for f in INDEXED_FIELDS.get(collection, ()) if f in where]
+            if indexed:
+                key = (collection, indexed[0], where[indexed[0]])
+                candidates = [docs[i] for i in self._index.get(key, ())]
+            else:
+                candidates = list(docs.values())
+            found = [
+                doc
+                for doc in candidates
+                if all(doc.get(k) == v for k, v in where.items())
+            ]
+        if found and "sort" in found[0]:
+            found.sort(key=lambda doc: doc.get("sort") or 0)
+        return found
+
+    def insert(self, collection: str, doc: dict[str, Any]) -> dict[str, Any]:
+        """Add a document (given an _id if it has none) and return it."""
+        with self.lock:
+            doc.setdefault("_id", self.new_id())
+            self.collections[collection][doc["_id"]] = doc
+            for name in INDEXED_FIELDS.get(collection, ()):
+                self._index[collection, name, doc.get(name)][doc["_id"]] = None
+        return doc
+
+    def update(self, collection: str, doc_id: str, **changes: Any) -> dict[str, Any]:
+        """Change fields of a document, keeping the indexes current."""
+        with self.lock:
+            doc = self.collections[collection][doc_id]
+            for name in INDEXED_FIELDS.get(collection, ()):
+                if name in changes and changes[name] != doc.get(name):
+                    self._index[collection, name, doc.get(name)].pop(doc_id, None)
+                    self._index[collection, name, changes[name]][doc_id] = None
+            doc.update(changes)
+            return doc
+
+    def remove(self, collection: str, doc_id: str) -> dict[str, Any] | None:
+        """Remove a document (not its children) and return it."""
+        with self.lock:
+            doc = self.collections[collection].pop(doc_id, None)
+            if doc is not None:
+                for name in INDEXED_FIELDS.get(collection, ()):
+                    self._index[collection, name, doc.get(name)].pop(doc_id, None)
+            return doc
+
+    # -- users and tokens ----------------------------------------------------
+
+    def add_user(
+        self,
+        username: str,
+        password: str = "",
+        is_admin: bool = False,
+        email: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a user who can log in with the given password."""
+        user = self.insert("users", self._user(username, is_admin, email))
+        self.passwords[user["_id"]] = password
+        return user
+
+    def _user(
+        self, username: str, is_admin: bool = False, email: str | None = None
+    ) -> dict[str, Any]:
+        now = self.now()
+        return {
+            "username": username,
+            "emails": [
+                {"address": email or f"{username}@example.com", "verified": False}
+            ],
+            "profile": {"fullname": username},
+            "isAdmin": is_admin,
+            "loginDisabled": False,
+            "authenticationMethod": "password",
+            "createdAt": now,
+            "modifiedAt": now,
+        }
+
+    def find_user(self, id_or_name: str) -> dict[str, Any] | None:
+        """Return a user by ID or username."""
+        with self.lock:
+            user = self.get("users", id_or_name)
+            if user is None:
+                user = next(
+                    (
+                        u
+                        for u in self.collections["users"].values()
+                        if id_or_name in (u["username"], u["emails"][0]["address"])
+                    ),
+                    None,
+                )
+            return user
+
+    def issue_token(self, user_id: str, ttl: float) -> tuple[str, float]:
+        """Create a login token; return it and its expiry Unix time."""
+        token, expires = self.new_id(43), self.clock() + ttl
+        with self.lock:
+            self.tokens[token] = (user_id, expires)
+        return token, expires
+
+    def user_for_token(self, token: str) -> dict[str, Any] | None:
+        """Return the user a token belongs to, or None if unknown or expired."""
+        with self.lock:
+            user_id, expires = self.tokens.get(token, (None, 0.0))
+            if user_id is None or expires <= self.clock():
+                return None
+            user = self.get("users", user_id)
+        if user is None or user["loginDisabled"]:
+            return None
+        return user
+
+    def revoke_tokens(
+        self, user_id: str | None = None, token: str | None = None
+    ) -> int:
+        """
+        Invalidate login tokens, as an expiry or a server restart would
+
+        Args:
+            user_id: Only revoke this user's tokens
+            token: Only revoke this token
+
+        Returns:
+            Number of tokens revoked
+        """
+        with self.lock:
+            revoked = [
+                t
+                for t, (uid, _) in self.tokens.items()
+                if user_id in (None, uid) and token in (None, t)
+            ]
+            for t in revoked:
+                del self.tokens[t]
+        return len(revoked)
+
+    # -- boards and their contents -------------------------------------------
+
+    @staticmethod
+    def member(user_id: str, **permissions: Any) -> dict[str, Any]:
+        """Return a board member record with WeKan's default permissions."""
+        return {
+            "userId": user_id,
+            "isAdmin": False,
+            "isActive": True,
+            "isNoComments": False,
+            "isCommentOnly": False,
+            "isWorker": False,
+            **permissions,
+        }
+
+    def add_board(
+        self,
+        title: str,
+        owner_id: str,
+        permission: str = "private",
+        color: str = "belize",
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Create a board with its default labels and swimlane."""
+        now = self.now()
+        with self.lock:
+            board = self.insert(
+                "boards",
+                {
+                    "title": title,
+                    "permission": permission,
+                    "color": color,
+                    "description": "",
+                    "archived": False,
+                    "labels": [
+                        {"_id": self.new_id(6), "name": "", "color": c}
+                        for c in DEFAULT_LABEL_COLORS
+                    ],
+                    "members": [self.member(owner_id, isAdmin=True)],
+                    "sort": len(self.collections["boards"]),
+                    "createdAt": now,
+                    "modifiedAt": now,
+                    **fields,
+                },
+            )
+            self.add_swimlane(board["_id"], "Default")
+        return board
+
+    def add_label(self, board_id: str, name: str, color: str) -> str | None:
+        """Add a label to a board; return its ID, or None if it exists."""
+        with self.lock:
+            labels = self.collections["boards"][board_id]["labels"]
+            if any(lb["name"] == name and lb["color"] == color for lb in labels):
+                return None
+            label_id = self.new_id(6)
+            labels.append({"_id": label_id, "name": name, "color": color})
+        return label_id
+
+    def add_swimlane(self, board_id: str, title: str, **fields: Any) -> dict[str, Any]:
+        """Create a swimlane at the end of a board."""
+        now = self.now()
+        return self.insert(
+            "swimlanes",
+            {
+                "title": title,
+                "boardId": board_id,
+                "sort": self.next_sequence("swimlanes", board_id),
+                "archived": False,
+                "type": "swimlane",
+                "height": -1,
+                "createdAt": now,
+                "updatedAt": now,
+                "modifiedAt": now,
+                **fields,
+            },
+        )
+
+    def add_list(
+        self, board_id: str, title: str, swimlane_id: str = "", **fields: Any
+    ) -> dict[str, Any]:
+        """Create a list at the end of a board."""
+        now = self.now()
+        return self.insert(
+            "lists",
+            {
+                "title": title,
+                "boardId": board_id,
+                "swimlaneId": swimlane_id,
+                "sort": self.next_sequence("lists", board_id),
+                "archived": False,
+                "starred": False,
+                "wipLimit": {"value": 1, "enabled": False, "soft": False},
+                "type": "list",
+                "width": 272,
+                "createdAt": now,
+                "updatedAt": now,
+                "modifiedAt": now,
+                **fields,
+            },
+        )
+
+    def add_card(
+        self,
+        board_id: str,
+        list_id: str,
+        swimlane_id: str,
+        title: str,
+        author_id: str,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Create a card at the end of a list."""
+        now = self.now()
+        return self.insert(
+            "cards",
+            {
+                "title": title,
+                "description": "",
+                "boardId": board_id,
+                "listId": list_id,
+                "swimlaneId": swimlane_id,
+                "userId": author_id,
+                "sort": self.next_sequence("cards", list_id),
+                "cardNumber": self.next_sequence("cardNumber", board_id) + 1,
+                "archived": False,
+                "members": [],
+                "assignees": [],
+                "labelIds": [],
+                "customFields": [],
+                "parentId": "",
+                "requestedBy": "",
+                "assignedBy": "",
+                "spentTime": 0,
+                "isOverTime": False,
+                "type": "cardType-card",
+                "createdAt": now,
+                "modifiedAt": now,
+                "dateLastActivity": now,
+                **fields,
+            },
+        )
+
+    def add_comment(
+        self, board_id: str, card_id: str, author_id: str, text: str
+    ) -> dict[str, Any]:
+        """Add a comment to a card."""
+        now = self.now()
+        return self.insert(
+            "comments",
+            {
+                "boardId": board_id,
+                "cardId": card_id,
+                "userId": author_id,
+                "text": text,
+                "createdAt": now,
+                "modifiedAt": now,
+            },
+        )
+
+    def add_checklist(
+        self, card_id: str, title: str, items: Iterable[str] = ()
+    ) -> dict[str, Any]:
+        """Add a checklist, with unfinished items, to a card."""
+        checklist = self.insert(
+            "checklists",
+            {
+                "cardId": card_id,
+                "title": title,
+                "sort": self.next_sequence("checklists", card_id),
+                "finishedAt": None,
+                "createdAt": self.now(),
+            },
+        )
+        for item in items:
+            self.add_checklist_item(card_id, checklist["_id"], item)
+        return checklist
+
+    def add_checklist_item(
+        self, card_id: str, checklist_id: str, title: str, is_finished: bool = False
+    ) -> dict[str, Any]:
+        """Add an item to the end of a checklist."""
+        now = self.now()
+        return self.insert(
+            "checklist_items",
+            {
+                "title": title,
+                "checklistId": checklist_id,
+                "cardId": card_id,
+                "sort": self.next_sequence("checklist_items", checklist_id),
+                "isFinished": is_finished,
+                "createdAt": now,
+                "modifiedAt": now,
+            },
+        )
+
+    def add_custom_field(
+        self, board_id: str, name: str, type: str, **fields: Any
+    ) -> dict[str, Any]:
+        """Define a custom field on a board."""
+        return self.insert(
+            "custom_fields",
+            {
+                "name": name,
+                "type": type,
+                "boardIds": [board_id],
+                "settings": {},
+                "showOnCard": False,
+                "automaticallyOnCard": False,
+                "alwaysOnCard": False,
+                "showLabelOnMiniCard": False,
+                "showSumAtTopOfList": False,
+                "createdAt": self.now(),
+                **fields,
+            },
+        )
+
+    def board_custom_fields(self, board_id: str) -> list[dict[str, Any]]:
+        """Return the custom fields defined on a board."""
+        with self.lock:
+            return [
+                cf
+                for cf in self.collections["custom_fields"].values()
+                if board_id in cf["boardIds"]
+            ]
+
+    def update_checklist_finished(self, checklist_id: str) -> None:
+        """Set or clear finishedAt from the state of a checklist's items."""
+        items = self.find("checklist_items", checklistId=checklist_id)
+        finished = bool(items) and all(i["isFinished"] for i in items)
+        checklist = self.get("checklists", checklist_id)
+        if checklist is None:
+            return
+        if not finished:
+            checklist["finishedAt"] = None
+        elif not checklist["finishedAt"]:
+            checklist["finishedAt"] = self.now()
+
+    # -- deletion --------------------------------------------------------------
+
+    def delete_checklist(self, checklist_id: str) -> None:
+        """Delete a checklist and its items."""
+        with self.lock:
+            for item in self.find("checklist_items", checklistId=checklist_id):
+                self.remove("checklist_items", item["_id"])
+            self.remove("checklists", checklist_id)
+
+    def delete_card(self, card_id: str) -> None:
+        """Delete a card with its checklists and comments."""
+        with self.lock:
+            for checklist in self.find("checklists", cardId=card_id):
+                self.delete_checklist(checklist["_id"])
+            for comment in self.find("comments", cardId=card_id):
+                self.remove("comments", comment["_id"])
+            self.remove("cards", card_id)
+
+    def delete_board(self, board_id: str) -> None:
+        """Delete a board and everything on it."""
+        with self.lock:
+            for card in self.find("cards", boardId=board_id):
+                self.delete_card(card["_id"])
+            for collection in ("lists", "swimlanes", "integrations", "attachments"):
+                for doc in self.find(collection, boardId=board_id):
+                    self.remove(collection, doc["_id"])
+            for cf in self.board_custom_fields(board_id):
+                cf["boardIds"].remove(board_id)
+                if not cf["boardIds"]:
+                    self.remove("custom_fields", cf["_id"])
+            self.remove("boards", board_id)
+
+    # -- export ----------------------------------------------------------------
+
+    def export_board(self, board_id: str) -> dict[str, Any] | None:
+        """Return a board in WeKan's /export JSON format, or None."""
+        with self.lock:
+            board = self.get("boards", board_id)
+            if board is None:
+                return None
+            cards = self.find("cards", boardId=board_id)
+            card_ids = [card["_id"] for card in cards]
+            checklists = [
+                c for i in card_ids for c in self.find("checklists", cardId=i)
+            ]
+            member_ids = {m["userId"] for m in board["members"]}
+            return {
+                **board,
+                "_format": "wekan-board-1.0.0",
+                "swimlanes": self.find("swimlanes", boardId=board_id),
+                "lists": self.find("lists", boardId=board_id),
+                "cards": cards,
+                "comments": [
+                    c for i in card_ids for c in self.find("comments", cardId=i)
+                ],
+                "checklists": checklists,
+                "checklistItems": [
+                    item
+                    for c in checklists
+                    for item in self.find("checklist_items", checklistId=c["_id"])
+                ],
+                "customFields": self.board_custom_fields(board_id),
+                "attachments": self.find("attachments", boardId=board_id),
+                "activities": [],
+                "rules": [],
+                "triggers": [],
+                "actions": [],
+                "subtaskItems": [],
+                "users": [
+                    {key: user[key] for key in ("_id", "username", "profile")}
+                    for user_id in sorted(member_ids)
+                    if (user := self.get("users", user_id)) is not None
+                ],
+            }
+
+    def import_board(self, export: dict[str, Any]) -> dict[str, Any]:
+        """
+        Load a board from WeKan's /export JSON format, keeping its IDs
+
+        Users of the export that the store does not have are added without
+        a password, so they cannot log in.
+
+        Args:
+            export: Board export, e.g. from export_board() or a live server
+
+        Returns:
+            The board document
+        """
+        with self.lock:
+            board = {
+                k: v
+                for k, v in export.items()
+                if k not in EXPORT_KEYS and k not in EXPORT_EXTRAS
+            }
+            for user in export.get("users", []):
+                if self.get("users", user["_id"]) is None:
+                    self.insert("users", {**self._user(user["username"]), **user})
+            self.insert("boards", board)
+            for key, collection in EXPORT_KEYS.items():
+                for doc in export.get(key, []):
+                    self.insert(collection, dict(doc))
+            for kind, collection, parent in SEQUENCES:
+                for doc in export.get(_export_key(collection), []):
+                    key = (kind, doc.get(parent, ""))
+                    sort = doc.get("sort")
+                    if isinstance(sort, (int, float)):
+                        self._sequence[key] = max(self._sequence[key], int(sort) + 1)
+            numbers = [c.get("cardNumber", 0) for c in export.get("cards", [])]
+            self._sequence["cardNumber", board["_id"]] = max(numbers, default=0)
+        return board
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    body: dict[str, Any]
+    user: dict[str, Any] | None = None
+
+    @property
+    def user_id(self) -> str:
+        return self.user["_id"] if self.user else ""
+
+
+@dataclass(frozen=True)
+class _Route:
+    method: str
+    template: str
+    pattern: re.Pattern = field(compare=False)
+    handler: str = field(compare=False)
+    public: bool = field(default=False, compare=False)
+    documented: bool = field(default=True, compare=False)
+
+
+_ROUTES: list[_Route] = []
+
+
+def _route(
+    method: str, template: str, public: bool = False, documented: bool = True
+) -> Callable:
+    """Register a _Api method as the handler of a route."""
+    parts = re.split(r"\{(\w+)\}", template)
+    regex = "".join(
+        re.escape(part) if i % 2 == 0 else f"(?P<{part}>[^/]+)"
+        for i, part in enumerate(parts)
+    )
+
+    def register(handler: Callable) -> Callable:
+        pattern = re.compile(regex + "$")
+        _ROUTES.append(
+            _Route(method, template, pattern, handler.__name__, public, documented)
+        )
+        return handler
+
+    return register
+
+
+class _Api:
+    """Handlers of the REST routes, working on a FakeStore."""
+
+    def __init__(self, store: FakeStore, token_ttl: float):
+        self.store = store
+        self.token_ttl = token_ttl
+
+    # -- helpers -------------------------------------------------------------
+
+    def _admin(self, req: _Request) -> None:
+        if not (req.user and req.user["isAdmin"]):
+            raise _Error(403, "error", "Unauthorized: admin only")
+
+    def _require(self, collection: str, doc_id: str, label: str) -> dict[str, Any]:
+        doc = self.store.get(collection, doc_id)
+        if doc is None:
+            raise _not_found(label)
+        return doc
+
+    def _card(self, board_id: str, card_id: str) -> dict[str, Any]:
+        card = self.store.get("cards", card_id)
+        if card is None or card["boardId"] != board_id:
+            raise _not_found("Card")
+        return card
+
+    def _checklist(self, card_id: str, checklist_id: str) -> dict[str, Any]:
+        checklist = self.store.get("checklists", checklist_id)
+        if checklist is None or checklist["cardId"] != card_id:
+            raise _not_found("Checklist")
+        return checklist
+
+    def _item(self, checklist_id: str, item_id: str) -> dict[str, Any]:
+        item = self.store.get("checklist_items", item_id)
+        if item is None or item["checklistId"] != checklist_id:
+            raise _not_found("Checklist item")
+        return item
+
+    def _custom_field(self, board_id: str, field_id: str) -> dict[str, Any]:
+        cf = self.store.get("custom_fields", field_id)
+        if cf is None or board_id not in cf["boardIds"]:
+            raise _not_found("Custom field")
+        return cf
+
+    def _integration(self, board_id: str, int_id: str) -> dict[str, Any]:
+        integration = self.store.get("integrations", int_id)
+        if integration is None or integration["boardId"] != board_id:
+            raise _not_found("Integration")
+        return integration
+
+    def _login_response(self, user_id: str) -> dict[str, Any]:
+        token, expires = self.store.issue_token(user_id, self.token_ttl)
+        return {"id": user_id, "token": token, "tokenExpires": _iso(expires)}
+
+    def _user_details(self, user: dict[str, Any]) -> dict[str, Any]:
+        boards = [
+            {"boardId": b["_id"], **{k: v for k, v in m.items() if k != "userId"}}
+            for b in self.store.collections["boards"].values()
+            for m in b["members"]
+            if m["userId"] == user["_id"]
+        ]
+        return {**user, "boards": boards}
+
+    def _board_summaries(self, user_id: str) -> list[dict[str, Any]]:
+        return [
+            {"_id": b["_id"], "title": b["title"]}
+            for b in self.store.collections["boards"].values()
+            if not b["archived"]
+            and any(m["userId"] == user_id and m["isActive"] for m in b["members"])
+        ]
+
+    @staticmethod
+    def _summary(doc: dict[str, Any], *names: str) -> dict[str, Any]:
+        return {"_id": doc["_id"], **{n: doc.get(n) for n in names}}
+
+    # -- authentication --------------------------------------------------------
+
+    @_route("POST", "/users/login", public=True)
+    def login(self, req: _Request) -> Any:
+        name = req.body.get("username") or req.body.get("email") or ""
+        user = self.store.find_user(name)
+        if user is None or self.store.passwords.get(user["_id"]) != req.body.get(
+            "password"
+        ):
+            raise _Error(400, "error", "Login forbidden")
+        if user["loginDisabled"]:
+            raise _Error(403, "error", "Login disabled")
+        return self._login_response(user["_id"])
+
+    @_route("POST", "/users/register", public=True)
+    def register(self, req: _Request) -> Any:
+        username = req.body.get("username")
+        if not username or not req.body.get("password"):
+            raise _Error(400, "error", "Username and password are required")
+        if self.store.find_user(username) is not None:
+            raise _Error(403, "error", "Username already exists")
+        user = self.store.add_user(
+            username, req.body["password"], email=req.body.get("email")
+        )
+        return {"_id": user["_id"]}
+
+    # -- users -------------------------------------------------------------------
+
+    @_route("GET", "/api/user")
+    def get_current_user(self, req: _Request) -> Any:
+        return self._user_details(req.user)
+
+    @_route("GET", "/api/users")
+    def get_users(self, req: _Request) -> Any:
+        self._admin(req)
+        return [
+            self._summary(u, "username")
+            for u in self.store.collections["users"].values()
+        ]
+
+    @_route("GET", "/api/users/{userId}")
+    def get_user(self, req: _Request, userId: str) -> Any:
+        self._admin(req)
+        user = self.store.find_user(userId)
+        return self._user_details(user) if user else None
+
+    @_route("PUT", "/api/users/{userId}")
+    def edit_user(self, req: _Request, userId: str) -> Any:
+        self._admin(req)
+        user = self.store.find_user(userId)
+        if user is None:
+            raise _not_found("User")
+        action = req.body.get("action")
+        if action == "takeOwnership":
+            boards = []
+            for board in self.store.collections["boards"].values():
+                members = board["members"]
+                if any(m["userId"] == user["_id"] and m["isAdmin"] for m in members):
+                    board["members"] = [
+                        m for m in board["members"] if m["userId"] != req.user_id
+                    ] + [self.store.member(req.user_id, isAdmin=True)]
+                    boards.append(self._summary(board, "title"))
+            return boards
+        if action in ("disableLogin", "enableLogin"):
+            user["loginDisabled"] = action == "disableLogin"
+            if user["loginDisabled"]:
+                self.store.revoke_tokens(user["_id"])
+            return self._summary(user, "username", "loginDisabled")
+        raise _Error(400, "error", f"Unknown action: {action}")
+
+    @_route("DELETE", "/api/users/{userId}")
+    def delete_user(self, req: _Request, userId: str) -> Any:
+        self._admin(req)
+        user = self.store.find_user(userId)
+        if user is None:
+            raise _not_found("User")
+        self.store.revoke_tokens(user["_id"])
+        self.store.remove("users", user["_id"])
+        return {"_id": user["_id"]}
+
+    @_route("POST", "/api/users/")
+    def create_user(self, req: _Request) -> Any:
+        self._admin(req)
+        return {"_id": self.register(req)["_id"]}
+
+    @_route("POST", "/api/createtoken/{userId}")
+    def create_token(self, req: _Request, userId: str) -> Any:
+        self._admin(req)
+        user = self._require("users", userId, "User")
+        token, _ = self.store.issue_token(user["_id"], self.token_ttl)
+        return {"_id": user["_id"], "authToken": token}
+
+    @_route("POST", "/api/deletetoken")
+    def delete_token(self, req: _Request) -> Any:
+        self._admin(req)
+        user_id = req.body.get("userId")
+        if not user_id:
+            raise _Error(400, "error", "userId is required")
+        count = self.store.revoke_tokens(user_id, req.body.get("token"))
+        return {"message": f"Deleted {count} token(s)"}
+
+    # -- boards ------------------------------------------------------------------
+
+    @_route("GET", "/api/users/{userId}/boards")
+    def get_boards_for_user(self, req: _Request, userId: str) -> Any:
+        return self._board_summaries(userId)
+
+    @_route("GET", "/api/boards")
+    def get_public_boards(self, req: _Request) -> Any:
+        self._admin(req)
+        return [
+            self._summary(b, "title")
+            for b in self.store.collections["boards"].values()
+            if b["permission"] == "public" and not b["archived"]
+        ]
+
+    @_route("POST", "/api/boards")
+    def create_board(self, req: _Request) -> Any:
+        body = req.body
+        if not body.get("title") or not body.get("owner"):
+            raise _Error(400, "error", "title and owner are required")
+        permissions = {
+            k: _as_bool(body.get(k, default))
+            for k, default in (
+                ("isAdmin", True),
+                ("isActive", True),
+                ("isNoComments", False),
+                ("isCommentOnly", False),
+                ("isWorker", False),
+            )
+        }
+        board = self.store.add_board(
+            body["title"],
+            body["owner"],
+            permission=body.get("permission", "private"),
+            color=body.get("color", "belize"),
+        )
+        board["members"] = [self.store.member(body["owner"], **permissions)]
+        swimlane = self.store.find("swimlanes", boardId=board["_id"])[0]
+        return {"_id": board["_id"], "defaultSwimlaneId": swimlane["_id"]}
+
+    @_route("GET", "/api/boards_count")
+    def get_boards_count(self, req: _Request) -> Any:
+        self._admin(req)
+        boards = self.store.collections["boards"].values()
+        counts = Counter(board["permission"] for board in boards)
+        return {"private": counts["private"], "public": counts["public"]}
+
+    @_route("GET", "/api/boards/{boardId}")
+    def get_board(self, req: _Request, boardId: str) -> Any:
+        return self.store.get("boards", boardId)
+
+    @_route("DELETE", "/api/boards/{boardId}")
+    def delete_board(self, req: _Request, boardId: str) -> Any:
+        self._admin(req)
+        self._require("boards", boardId, "Board")
+        self.store.delete_board(boardId)
+        return {"_id": boardId}
+
+    @_route("PUT", "/api/boards/{boardId}/title")
+    def edit_board_title(self, req: _Request, boardId: str) -> Any:
+        board = self._require("boards", boardId, "Board")
+        board["title"] = req.body.get("title", board["title"])
+        board["modifiedAt"] = self.store.now()
+        return self._summary(board, "title")
+
+    @_route("PUT", "/api/boards/{boardId}/labels")
+    def add_board_label(self, req: _Request, boardId: str) -> Any:
+        self._require("boards", boardId, "Board")
+        label = req.body.get("label") or {}
+        label_id = self.store.add_label(
+            boardId, label.get("name", ""), label.get("color", "")
+        )
+        # WeKan answers with the bare ID, or nothing if the label exists
+        return label_id.encode() if label_id else None
+
+    @_route("POST", "/api/boards/{boardId}/copy")
+    def copy_board(self, req: _Request, boardId: str) -> Any:
+        store = self.store
+        with store.lock:
+            board = self._require("boards", boardId, "Board")
+            export = store.export_board(boardId)
+            title = req.body.get("title") or f"{board['title']} (copy)"
+            copy = store.add_board(
+                title, req.user_id, board["permission"], board["color"]
+            )
+            copy["labels"] = [dict(lb) for lb in board["labels"]]
+            copy["members"] = [dict(m) for m in board["members"]]
+            for swimlane in store.find("swimlanes", boardId=copy["_id"]):
+                store.remove("swimlanes", swimlane["_id"])
+            new_ids: dict[str, str] = {}
+            for collection, key in (("swimlanes", "swimlanes"), ("lists", "lists")):
+                for doc in export[key]:
+                    new = store.insert(
+                        collection,
+                        {**doc, "_id": store.new_id(), "boardId": copy["_id"]},
+                    )
+                    new_ids[doc["_id"]] = new["_id"]
+            for card in export["cards"]:
+                new = store.add_card(
+                    copy["_id"],
+                    new_ids.get(card["listId"], ""),
+                    new_ids.get(card["swimlaneId"], ""),
+                    card["title"],
+                    card["userId"],
+                    **{k: v for k, v in card.items() if k not in CARD_LOCATION},
+                )
+                for checklist in store.find("checklists", cardId=card["_id"]):
+                    items = store.find("checklist_items", checklistId=checklist["_id"])
+                    titles = [item["title"] for item in items]
+                    store.add_checklist(new["_id"], checklist["title"], titles)
+        return copy["_id"].encode()
+
+    @_route("POST", "/api/boards/{boardId}/members/{memberId}")
+    def set_board_member(self, req: _Request, boardId: str, memberId: str) -> Any:
+        self._admin(req)
+        board = self._require("boards", boardId, "Board")
+        member = next((m for m in board["members"] if m["userId"] == memberId), None)
+        if member is None:
+            raise _not_found("Member")
+        for name, value in req.body.items():
+            if name.startswith("is"):
+                member[name] = _as_bool(value)
+        return {"_id": boardId, "member": member}
+
+    @_route("POST", "/api/boards/{boardId}/members/{userId}/add")
+    def add_board_member(self, req: _Request, boardId: str, userId: str) -> Any:
+        self._admin(req)
+        board = self._require("boards", boardId, "Board")
+        self._require("users", userId, "User")
+        permissions = {
+            k: _as_bool(v) for k, v in req.body.items() if k.startswith("is")
+        }
+        board["members"] = [m for m in board["members"] if m["userId"] != userId] + [
+            self.store.member(userId, **permissions)
+        ]
+        return [self._summary(board, "title")]
+
+    @_route("POST", "/api/boards/{boardId}/members/{userId}/remove")
+    def remove_board_member(self, req: _Request, boardId: str, userId: str) -> Any:
+        self._admin(req)
+        board = self._require("boards", boardId, "Board")
+        board["members"] = [m for m in board["members"] if m["userId"] != userId]
+        return [self._summary(board, "title")]
+
+    @_route("GET", "/api/boards/{boardId}/attachments")
+    def get_board_attachments(self, req: _Request, boardId: str) -> Any:
+        return self.store.find("attachments", boardId=boardId)
+
+    # -- lists -------------------------------------------------------------------
+
+    @_route("GET", "/api/boards/{boardId}/lists")
+    def get_lists(self, req: _Request, boardId: str) -> Any:
+        return [
+            self._summary(lst, "title")
+            for lst in self.store.find("lists", boardId=boardId, archived=False)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/lists")
+    def create_list(self, req: _Request, boardId: str) -> Any:
+        self._require("boards", boardId, "Board")
+        lst = self.store.add_list(
+            boardId, req.body.get("title", ""), req.body.get("swimlaneId", "")
+        )
+        return {"_id": lst["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/lists/{listId}")
+    def get_list(self, req: _Request, boardId: str, listId: str) -> Any:
+        lst = self.store.get("lists", listId)
+        return lst if lst and lst["boardId"] == boardId else None
+
+    @_route("PUT", "/api/boards/{boardId}/lists/{listId}")
+    def edit_list(self, req: _Request, boardId: str, listId: str) -> Any:
+        lst = self._require("lists", listId, "List")
+        for name in ("title", "color", "wipLimit", "starred"):
+            if name in req.body:
+                lst[name] = req.body[name]
+        lst["modifiedAt"] = lst["updatedAt"] = self.store.now()
+        return {"_id": listId}
+
+    @_route("DELETE", "/api/boards/{boardId}/lists/{listId}")
+    def delete_list(self, req: _Request, boardId: str, listId: str) -> Any:
+        self._require("lists", listId, "List")
+        with self.store.lock:
+            for card in self.store.find("cards", listId=listId):
+                self.store.delete_card(card["_id"])
+            self.store.remove("lists", listId)
+        return {"_id": listId}
+
+    # -- swimlanes -----------------------------------------------------------------
+
+    @_route("GET", "/api/boards/{boardId}/swimlanes")
+    def get_swimlanes(self, req: _Request, boardId: str) -> Any:
+        return [
+            self._summary(s, "title")
+            for s in self.store.find("swimlanes", boardId=boardId, archived=False)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/swimlanes")
+    def create_swimlane(self, req: _Request, boardId: str) -> Any:
+        self._require("boards", boardId, "Board")
+        swimlane = self.store.add_swimlane(boardId, req.body.get("title", ""))
+        return {"_id": swimlane["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/swimlanes/{swimlaneId}")
+    def get_swimlane(self, req: _Request, boardId: str, swimlaneId: str) -> Any:
+        swimlane = self.store.get("swimlanes", swimlaneId)
+        return swimlane if swimlane and swimlane["boardId"] == boardId else None
+
+    @_route("PUT", "/api/boards/{boardId}/swimlanes/{swimlaneId}")
+    def edit_swimlane(self, req: _Request, boardId: str, swimlaneId: str) -> Any:
+        swimlane = self._require("swimlanes", swimlaneId, "Swimlane")
+        swimlane["title"] = req.body.get("title", swimlane["title"])
+        swimlane["modifiedAt"] = swimlane["updatedAt"] = self.store.now()
+        return {"_id": swimlaneId}
+
+    @_route("DELETE", "/api/boards/{boardId}/swimlanes/{swimlaneId}")
+    def delete_swimlane(self, req: _Request, boardId: str, swimlaneId: str) -> Any:
+        self._require("swimlanes", swimlaneId, "Swimlane")
+        with self.store.lock:
+            for card in self.store.find("cards", swimlaneId=swimlaneId):
+                self.store.delete_card(card["_id"])
+            self.store.remove("swimlanes", swimlaneId)
+        return {"_id": swimlaneId}
+
+    # -- cards -------------------------------------------------------------------
+
+    CARD_SUMMARY = ("title", "description", "receivedAt", "startAt", "dueAt", "endAt")
+
+    @_route("GET", "/api/boards/{boardId}/swimlanes/{swimlaneId}/cards")
+    def get_swimlane_cards(self, req: _Request, boardId: str, swimlaneId: str) -> Any:
+        return [
+            self._summary(c, *self.CARD_SUMMARY, "listId", "assignees", "sort")
+            for c in self.store.find(
+                "cards", swimlaneId=swimlaneId, boardId=boardId, archived=False
+            )
+        ]
+
+    @_route("GET", "/api/boards/{boardId}/lists/{listId}/cards")
+    def get_list_cards(self, req: _Request, boardId: str, listId: str) -> Any:
+        return [
+            self._summary(c, *self.CARD_SUMMARY, "swimlaneId", "assignees", "sort")
+            for c in self.store.find(
+                "cards", listId=listId, boardId=boardId, archived=False
+            )
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/lists/{listId}/cards")
+    def create_card(self, req: _Request, boardId: str, listId: str) -> Any:
+        body = req.body
+        self._require("boards", boardId, "Board")
+        self._require("lists", listId, "List")
+        if not body.get("swimlaneId"):
+            raise _Error(400, "error", "swimlaneId is required")
+        self._require("swimlanes", body["swimlaneId"], "Swimlane")
+        extra = {
+            k: body[k]
+            for k in ("description", "parentId", "receivedAt", "startAt", "dueAt")
+            if k in body
+        }
+        for name in ("members", "assignees", "labelIds"):
+            if name in body:
+                extra[name] = _as_list(body[name])
+        card = self.store.add_card(
+            boardId,
+            listId,
+            body["swimlaneId"],
+            body.get("title", ""),
+            body.get("authorId") or req.user_id,
+            **extra,
+        )
+        return {"_id": card["_id"]}
+
+    @_route("GET", "/api/cards/{cardId}")
+    def get_card_by_id(self, req: _Request, cardId: str) -> Any:
+        return self.store.get("cards", cardId)
+
+    @_route("GET", "/api/boards/{boardId}/lists/{listId}/cards/{cardId}")
+    def get_card(self, req: _Request, boardId: str, listId: str, cardId: str) -> Any:
+        card = self.store.get("cards", cardId)
+        if (
+            card is None
+            or card["archived"]
+            or (card["boardId"], card["listId"]) != (boardId, listId)
+        ):
+            return None
+        return card
+
+    @_route("PUT", "/api/boards/{boardId}/lists/{listId}/cards/{cardId}")
+    def edit_card(self, req: _Request, boardId: str, listId: str, cardId: str) -> Any:
+        store, body = self.store, req.body
+        with store.lock:
+            card = self._card(boardId, cardId)
+            changes: dict[str, Any] = {}
+            if "title" in body:
+                changes["title"] = str(body["title"])[:1000]
+            for name in (
+                "description",
+                "color",
+                "sort",
+                "parentId",
+                "requestedBy",
+                "assignedBy",
+                "receivedAt",
+                "startAt",
+                "dueAt",
+                "endAt",
+                "spentTime",
+                "isOverTime",
+                "customFields",
+                "vote",
+                "poker",
+            ):
+                if name in body:
+                    changes[name] = body[name]
+            for name in ("labelIds", "members", "assignees"):
+                if name in body:
+                    changes[name] = _as_list(body[name])
+            if "authorId" in body:
+                changes["userId"] = body["authorId"]
+            if "archive" in body:
+                changes["archived"] = _as_bool(body["archive"])
+            if all(k in body for k in ("newBoardId", "newSwimlaneId", "newListId")):
+                self._require("boards", body["newBoardId"], "Board")
+                self._require("swimlanes", body["newSwimlaneId"], "Swimlane")
+                self._require("lists", body["newListId"], "List")
+                changes["boardId"] = body["newBoardId"]
+                changes["swimlaneId"] = body["newSwimlaneId"]
+                changes["listId"] = body["newListId"]
+            for name, label in (("listId", "List"), ("swimlaneId", "Swimlane")):
+                if name in body:
+                    self._require(label.lower() + "s", body[name], label)
+                    changes[name] = body[name]
+            changes["modifiedAt"] = changes["dateLastActivity"] = store.now()
+            store.update("cards", card["_id"], **changes)
+        return {"_id": cardId}
+
+    @_route("DELETE", "/api/boards/{boardId}/lists/{listId}/cards/{cardId}")
+    def delete_card(self, req: _Request, boardId: str, listId: str, cardId: str) -> Any:
+        self._card(boardId, cardId)
+        self.store.delete_card(cardId)
+        return {"_id": cardId}
+
+    @_route("GET", "/api/boards/{boardId}/cards_count")
+    def get_board_cards_count(self, req: _Request, boardId: str) -> Any:
+        cards = self.store.find("cards", boardId=boardId, archived=False)
+        return {"board_cards_count": len(cards)}
+
+    @_route("GET", "/api/boards/{boardId}/lists/{listId}/cards_count")
+    def get_list_cards_count(self, req: _Request, boardId: str, listId: str) -> Any:
+        cards = self.store.find("cards", listId=listId, boardId=boardId, archived=False)
+        return {"list_cards_count": len(cards)}
+
+    @_route(
+        "GET",
+        "/api/boards/{boardId}/cardsByCustomField/{customFieldId}/{customFieldValue}",
+    )
+    def get_cards_by_custom_field(
+        self, req: _Request, boardId: str, customFieldId: str, customFieldValue: str
+    ) -> Any:
+        return [
+            card
+            for card in self.store.find("cards", boardId=boardId)
+            if any(
+                cf.get("_id") == customFieldId
+                and str(cf.get("value")) == customFieldValue
+                for cf in card["customFields"]
+            )
+        ]
+
+    @_route(
+        "POST",
+        "/api/boards/{boardId}/lists/{listId}/cards/{cardId}"
+        "/customFields/{customFieldId}",
+    )
+    def edit_card_custom_field(
+        self, req: _Request, boardId: str, listId: str, cardId: str, customFieldId: str
+    ) -> Any:
+        card = self._card(boardId, cardId)
+        value = req.body.get("value")
+        values = [cf for cf in card["customFields"] if cf.get("_id") != customFieldId]
+        card["customFields"] = values + [{"_id": customFieldId, "value": value}]
+        card["modifiedAt"] = card["dateLastActivity"] = self.store.now()
+        return self._summary(card, "customFields")
+
+    @_route("POST", "/api/boards/{boardId}/lists/{listId}/cards/{cardId}/archive")
+    @_route(
+        "PUT",
+        "/api/boards/{boardId}/lists/{listId}/cards/{cardId}/archive",
+        documented=False,
+    )
+    def archive_card(
+        self, req: _Request, boardId: str, listId: str, cardId: str
+    ) -> Any:
+        card = self._card(boardId, cardId)
+        card.update(archived=True, archivedAt=self.store.now())
+        return self._summary(card, "archived", "archivedAt")
+
+    @_route("POST", "/api/boards/{boardId}/lists/{listId}/cards/{cardId}/unarchive")
+    @_route(
+        "PUT",
+        "/api/boards/{boardId}/lists/{listId}/cards/{cardId}/restore",
+        documented=False,
+    )
+    def unarchive_card(
+        self, req: _Request, boardId: str, listId: str, cardId: str
+    ) -> Any:
+        card = self._card(boardId, cardId)
+        card["archived"] = False
+        card.pop("archivedAt", None)
+        return self._summary(card, "archived")
+
+    # -- checklists --------------------------------------------------------------
+
+    @_route("GET", "/api/boards/{boardId}/cards/{cardId}/checklists")
+    def get_checklists(self, req: _Request, boardId: str, cardId: str) -> Any:
+        return [
+            self._summary(c, "title")
+            for c in self.store.find("checklists", cardId=cardId)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/cards/{cardId}/checklists")
+    def create_checklist(self, req: _Request, boardId: str, cardId: str) -> Any:
+        self._card(boardId, cardId)
+        checklist = self.store.add_checklist(
+            cardId, req.body.get("title", ""), _as_list(req.body.get("items"))
+        )
+        return {"_id": checklist["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}")
+    def get_checklist(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str
+    ) -> Any:
+        checklist = self.store.get("checklists", checklistId)
+        if checklist is None or checklist["cardId"] != cardId:
+            return None
+        items = self.store.find("checklist_items", checklistId=checklistId)
+        return {
+            **checklist,
+            "items": [self._summary(i, "title", "isFinished") for i in items],
+        }
+
+    @_route("DELETE", "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}")
+    def delete_checklist(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str
+    ) -> Any:
+        self._checklist(cardId, checklistId)
+        self.store.delete_checklist(checklistId)
+        return {"_id": checklistId}
+
+    @_route(
+        "GET",
+        "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}/items/{itemId}",
+    )
+    def get_checklist_item(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str, itemId: str
+    ) -> Any:
+        item = self.store.get("checklist_items", itemId)
+        return item if item and item["checklistId"] == checklistId else None
+
+    @_route(
+        "PUT",
+        "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}/items/{itemId}",
+    )
+    def edit_checklist_item(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str, itemId: str
+    ) -> Any:
+        with self.store.lock:
+            item = self._item(checklistId, itemId)
+            if "title" in req.body:
+                item["title"] = req.body["title"]
+            if "isFinished" in req.body:
+                item["isFinished"] = _as_bool(req.body["isFinished"])
+            item["modifiedAt"] = self.store.now()
+            self.store.update_checklist_finished(checklistId)
+        return {"_id": itemId}
+
+    @_route(
+        "DELETE",
+        "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}/items/{itemId}",
+    )
+    def delete_checklist_item(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str, itemId: str
+    ) -> Any:
+        with self.store.lock:
+            self._item(checklistId, itemId)
+            self.store.remove("checklist_items", itemId)
+            self.store.update_checklist_finished(checklistId)
+        return {"_id": itemId}
+
+    @_route(
+        "POST", "/api/boards/{boardId}/cards/{cardId}/checklists/{checklistId}/items"
+    )
+    def create_checklist_item(
+        self, req: _Request, boardId: str, cardId: str, checklistId: str
+    ) -> Any:
+        with self.store.lock:
+            self._checklist(cardId, checklistId)
+            item = self.store.add_checklist_item(
+                cardId, checklistId, req.body.get("title", "")
+            )
+            self.store.update_checklist_finished(checklistId)
+        return {"_id": item["_id"]}
+
+    # -- comments ----------------------------------------------------------------
+
+    @_route("GET", "/api/boards/{boardId}/cards/{cardId}/comments")
+    def get_comments(self, req: _Request, boardId: str, cardId: str) -> Any:
+        return [
+            {"_id": c["_id"], "comment": c["text"], "authorId": c["userId"]}
+            for c in self.store.find("comments", cardId=cardId)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/cards/{cardId}/comments")
+    def create_comment(self, req: _Request, boardId: str, cardId: str) -> Any:
+        self._card(boardId, cardId)
+        comment = self.store.add_comment(
+            boardId,
+            cardId,
+            req.body.get("authorId") or req.user_id,
+            req.body.get("comment", ""),
+        )
+        return {"_id": comment["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/cards/{cardId}/comments/{commentId}")
+    def get_comment(
+        self, req: _Request, boardId: str, cardId: str, commentId: str
+    ) -> Any:
+        comment = self.store.get("comments", commentId)
+        return comment if comment and comment["cardId"] == cardId else None
+
+    @_route("DELETE", "/api/boards/{boardId}/cards/{cardId}/comments/{commentId}")
+    def delete_comment(
+        self, req: _Request, boardId: str, cardId: str, commentId: str
+    ) -> Any:
+        comment = self.store.get("comments", commentId)
+        if comment is None or comment["cardId"] != cardId:
+            raise _not_found("Comment")
+        self.store.remove("comments", commentId)
+        return {"_id": commentId}
+
+    # -- custom fields -------------------------------------------------------------
+
+    CUSTOM_FIELD_OPTIONS = (
+        "settings",
+        "showOnCard",
+        "automaticallyOnCard",
+        "alwaysOnCard",
+        "showLabelOnMiniCard",
+        "showSumAtTopOfList",
+    )
+
+    @_route("GET", "/api/boards/{boardId}/custom-fields")
+    def get_custom_fields(self, req: _Request, boardId: str) -> Any:
+        return [
+            self._summary(cf, "name", "type")
+            for cf in self.store.board_custom_fields(boardId)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/custom-fields")
+    def create_custom_field(self, req: _Request, boardId: str) -> Any:
+        self._require("boards", boardId, "Board")
+        body = req.body
+        if not body.get("name") or not body.get("type"):
+            raise _Error(400, "error", "name and type are required")
+        options = {k: body[k] for k in self.CUSTOM_FIELD_OPTIONS if k in body}
+        cf = self.store.add_custom_field(boardId, body["name"], body["type"], **options)
+        return {"_id": cf["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/custom-fields/{customFieldId}")
+    def get_custom_field(self, req: _Request, boardId: str, customFieldId: str) -> Any:
+        cf = self.store.get("custom_fields", customFieldId)
+        return cf if cf and boardId in cf["boardIds"] else None
+
+    @_route("PUT", "/api/boards/{boardId}/custom-fields/{customFieldId}")
+    def edit_custom_field(self, req: _Request, boardId: str, customFieldId: str) -> Any:
+        cf = self._custom_field(boardId, customFieldId)
+        for name in ("name", "type", *self.CUSTOM_FIELD_OPTIONS):
+            if name in req.body:
+                cf[name] = req.body[name]
+        return {"_id": customFieldId}
+
+    @_route("DELETE", "/api/boards/{boardId}/custom-fields/{customFieldId}")
+    def delete_custom_field(
+        self, req: _Request, boardId: str, customFieldId: str
+    ) -> Any:
+        self._custom_field(boardId, customFieldId)
+        self.store.remove("custom_fields", customFieldId)
+        return {"_id": customFieldId}
+
+    @_route(
+        "POST", "/api/boards/{boardId}/custom-fields/{customFieldId}/dropdown-items"
+    )
+    def add_dropdown_items(
+        self, req: _Request, boardId: str, customFieldId: str
+    ) -> Any:
+        cf = self._custom_field(boardId, customFieldId)
+        dropdown = cf["settings"].setdefault("dropdownItems", [])
+        for name in _as_list(req.body.get("items")):
+            dropdown.append({"_id": self.store.new_id(6), "name": name})
+        return {"_id": customFieldId}
+
+    @_route(
+        "PUT",
+        "/api/boards/{boardId}/custom-fields/{customFieldId}"
+        "/dropdown-items/{dropdownItemId}",
+    )
+    def edit_dropdown_item(
+        self, req: _Request, boardId: str, customFieldId: str, dropdownItemId: str
+    ) -> Any:
+        cf = self._custom_field(boardId, customFieldId)
+        for item in cf["settings"].get("dropdownItems", []):
+            if item["_id"] == dropdownItemId:
+                item["name"] = req.body.get("name", item["name"])
+                return {"_id": customFieldId}
+        raise _not_found("Dropdown item")
+
+    @_route(
+        "DELETE",
+        "/api/boards/{boardId}/custom-fields/{customFieldId}"
+        "/dropdown-items/{dropdownItemId}",
+    )
+    def delete_dropdown_item(
+        self, req: _Request, boardId: str, customFieldId: str, dropdownItemId: str
+    ) -> Any:
+        cf = self._custom_field(boardId, customFieldId)
+        items = cf["settings"].get("dropdownItems", [])
+        cf["settings"]["dropdownItems"] = [
+            item for item in items if item["_id"] != dropdownItemId
+        ]
+        return {"_id": customFieldId}
+
+    # -- integrations --------------------------------------------------------------
+
+    @staticmethod
+    def _public_integration(integration: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in integration.items() if k != "token"}
+
+    @_route("GET", "/api/boards/{boardId}/integrations")
+    def get_integrations(self, req: _Request, boardId: str) -> Any:
+        return [
+            self._public_integration(i)
+            for i in self.store.find("integrations", boardId=boardId)
+        ]
+
+    @_route("POST", "/api/boards/{boardId}/integrations")
+    def create_integration(self, req: _Request, boardId: str) -> Any:
+        self._require("boards", boardId, "Board")
+        integration = self.store.insert(
+            "integrations",
+            {
+                "enabled": True,
+                "title": req.body.get("title", ""),
+                "url": req.body.get("url", ""),
+                "token": req.body.get("token", ""),
+                "boardId": boardId,
+                "activities": ["all"],
+                "userId": req.user_id,
+                "createdAt": self.store.now(),
+            },
+        )
+        return {"_id": integration["_id"]}
+
+    @_route("GET", "/api/boards/{boardId}/integrations/{intId}")
+    def get_integration(self, req: _Request, boardId: str, intId: str) -> Any:
+        integration = self.store.get("integrations", intId)
+        if integration is None or integration["boardId"] != boardId:
+            return None
+        return self._public_integration(integration)
+
+    @_route("PUT", "/api/boards/{boardId}/integrations/{intId}")
+    def edit_integration(self, req: _Request, boardId: str, intId: str) -> Any:
+        integration = self._integration(boardId, intId)
+        for name in ("enabled", "title", "url", "token", "activities"):
+            if name in req.body:
+                integration[name] = req.body[name]
+        return {"_id": intId}
+
+    @_route("DELETE", "/api/boards/{boardId}/integrations/{intId}")
+    def delete_integration(self, req: _Request, boardId: str, intId: str) -> Any:
+        self._integration(boardId, intId)
+        self.store.remove("integrations", intId)
+        return {"_id": intId}
+
+    @_route("POST", "/api/boards/{boardId}/integrations/{intId}/activities")
+    def add_integration_activities(
+        self, req: _Request, boardId: str, intId: str
+    ) -> Any:
+        integration = self._integration(boardId, intId)
+        added = _as_list(req.body.get("activities"))
+        activities = integration["activities"] + added
+        integration["activities"] = list(dict.fromkeys(activities))
+        return self._summary(integration, "activities")
+
+    @_route("DELETE", "/api/boards/{boardId}/integrations/{intId}/activities")
+    def remove_integration_activities(
+        self, req: _Request, boardId: str, intId: str
+    ) -> Any:
+        integration = self._integration(boardId, intId)
+        removed = set(_as_list(req.body.get("activities")))
+        integration["activities"] = [
+            a for a in integration["activities"] if a not in removed
+        ]
+        return self._summary(integration, "activities")
+
+    # -- export --------------------------------------------------------------------
+
+    def _check_export_access(self, req: _Request, board: dict[str, Any]) -> None:
+        if board["permission"] == "public":
+            return
+        user = req.user or self.store.user_for_token(req.query.get("authToken", ""))
+        if user is None:
+            raise _Error(403, "error", "Forbidden")
+
+    @_route("GET", "/api/boards/{boardId}/export", public=True)
+    def export_board(self, req: _Request, boardId: str) -> Any:
+        board = self._require("boards", boardId, "Board")
+        self._check_export_access(req, board)
+        return self.store.export_board(boardId)
+
+    @_route(
+        "GET", "/api/boards/{boardId}/attachments/{attachmentId}/export", public=True
+    )
+    def export_attachment(
+        self, req: _Request, boardId: str, attachmentId: str
+    ) -> Any:
+        board = self._require("boards", boardId, "Board")
+        self._check_export_access(req, board)
+        attachment = self.store.get("attachments", attachmentId)
+        return attachment if attachment and attachment["boardId"] == boardId else None
+
+
+# (method, route template) of every route the server answers
+ROUTES: tuple[tuple[str, str], ...] = tuple((r.method, r.template) for r in _ROUTES)
+# Routes WeKanClient calls that docs/openapi.yaml does not list
+UNDOCUMENTED_ROUTES: tuple[tuple[str, str], ...] = tuple(
+    (r.method, r.template) for r in _ROUTES if not r.documented
+)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:
+        self.server.fake.handle(self)
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeWeKanServer"
+
+
+class FakeWeKanServer:
+    """
+    Fake WeKan server running on a background thread
+
+    Starts with one admin user. Per-route latency, jitter and error
+    injection are configured with set_behavior(); every request is counted
+    in ``requests`` by its method and route template.
+    """
+
+    def __init__(
+        self,
+        store: FakeStore | None = None,
+        username: str = "admin",
+        password: str = "admin",
+        seed: int = 0,
+        token_ttl: float = 90 * 24 * 3600,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Create a server (not yet listening; see start())
+
+        Args:
+            store: Data to serve (default: an empty store)
+            username: Admin user created if the store has no such user
+            password: Password of that admin user
+            seed: Seed of the generated IDs and the latency and error draws
+            token_ttl: Lifetime in seconds of login tokens
+            host: Address to listen on
+            port: Port to listen on (default: any free port)
+        """
+        self.store = store if store is not None else FakeStore(seed)
+        self.admin = self.store.find_user(username) or self.store.add_user(
+            username, password, is_admin=True
+        )
+        self.requests: Counter[str] = Counter()
+        self.injected_errors: Counter[str] = Counter()
+        self._api = _Api(self.store, token_ttl)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._default = RouteBehavior()
+        self._behaviors: dict[str, RouteBehavior] = {}
+        self._routes: dict[tuple[str, int], list[_Route]] = defaultdict(list)
+        for route in _ROUTES:
+            self._routes[route.method, route.template.count("/")].append(route)
+        self._address = (host, port)
+        self._server: _HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeWeKanServer":
+        """Start listening and serving on a background thread."""
+        if self._server is None:
+            self._server = _HTTPServer(self._address, _RequestHandler)
+            self._server.fake = self
+            # A short poll interval keeps stop() quick
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                args=(0.01,),
+                name="fake-wekan",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeWeKanServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def login_token(self, username: str | None = None) -> str:
+        """Issue a token for a user (default: the admin) without a request."""
+        user = self.store.find_user(username) if username else self.admin
+        if user is None:
+            raise ValueError(f"No such user: {username}")
+        return self.store.issue_token(user["_id"], self._api.token_ttl)[0]
+
+    def set_behavior(self, route: str | None = None, **changes: Any) -> RouteBehavior:
+        """
+        Configure the latency and errors of a route
+
+        Args:
+            route: "METHOD /template" (e.g., "GET /api/boards/{boardId}"), a
+                template for all its methods, or None for every route
+                without a behavior of its own
+            **changes: RouteBehavior fields to change
+
+        Returns:
+            The route's new behavior
+        """
+        unknown = set(changes) - {f.name for f in fields(RouteBehavior)}
+        if unknown:
+            raise TypeError(f"Unknown behavior fields: {', '.join(sorted(unknown))}")
+        if route is not None and not any(
+            route in (template, f"{method} {template}") for method, template in ROUTES
+        ):
+            raise ValueError(f"Unknown route: {route}")
+        with self._lock:
+            if route is None:
+                self._default = replace(self._default, **changes)
+                return self._default
+            behavior = replace(self._behaviors.get(route, self._default), **changes)
+            self._behaviors[route] = behavior
+            return behavior
+
+    def reset_behavior(self) -> None:
+        """Remove all configured latency and errors."""
+        with self._lock:
+            self._default = RouteBehavior()
+            self._behaviors.clear()
+
+    def behavior(self, method: str, template: str) -> RouteBehavior:
+        """Return the behavior that applies to a route."""
+        return (
+            self._behaviors.get(f"{method} {template}")
+            or self._behaviors.get(template)
+            or self._default
+        )
+
+    def _match(self, method: str, path: str) -> tuple[_Route, dict[str, str]] | None:
+        for route in self._routes.get((method, path.count("/")), ()):
+            match = route.pattern.match(path)
+            if match:
+                params = {k: unquote(v) for k, v in match.groupdict().items()}
+                return route, params
+        return None
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer one HTTP request."""
+        method = handler.command
+        url = urlsplit(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        matched = self._match(method, url.path)
+        template = matched[0].template if matched else url.path
+
+        behavior = self.behavior(method, template)
+        with self._lock:
+            self.requests[f"{method} {template}"] += 1
+            delay = behavior.latency
+            if behavior.jitter:
+                delay += self._random.uniform(0, behavior.jitter)
+            fail = bool(behavior.error_rate) and (
+                self._random.random() < behavior.error_rate
+            )
+            if fail:
+                self.injected_errors[f"{method} {template}"] += 1
+        if delay:
+            time.sleep(delay)
+
+        headers: dict[str, str] = {}
+        try:
+            if fail:
+                if behavior.retry_after is not None:
+                    headers["Retry-After"] = f"{behavior.retry_after:g}"
+                raise _Error(behavior.error_status, "injected", "Injected failure")
+            if matched is None:
+                raise _Error(404, "not-found", f"No route for {method} {url.path}")
+            route, params = matched
+            request = _Request(
+                method,
+                url.path,
+                dict(parse_qsl(url.query)),
+                self._parse_body(handler, raw),
+                self._authenticate(handler),
+            )
+            if request.user is None and not route.public:
+                raise _Error(401, "Unauthorized", "You must be logged in")
+            with self.store.lock:
+                result = getattr(self._api, route.handler)(request, **params)
+                status = 200
+                if result is None:
+                    body = b""
+                elif isinstance(result, bytes):
+                    body = result
+                else:
+                    body = json.dumps(result, separators=(",", ":")).encode()
+        except _Error as e:
+            status, body = e.status, json.dumps(e.body).encode()
+        except Exception as e:
+            traceback.print_exc()
+            error = _Error(500, "internal", str(e))
+            status, body = error.status, json.dumps(error.body).encode()
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _authenticate(self, handler: BaseHTTPRequestHandler) -> dict[str, Any] | None:
+        authorization = handler.headers.get("Authorization", "")
+        token = authorization.removeprefix("Bearer ").strip() or handler.headers.get(
+            "X-Auth-Token", ""
+        )
+        return self.store.user_for_token(token) if token else None
+
+    @staticmethod
+    def _parse_body(handler: BaseHTTPRequestHandler, raw: bytes) -> dict[str, Any]:
+        if not raw:
+            return {}
+        content_type = handler.headers.get("Content-Type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            return dict(parse_qsl(raw.decode()))
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise _Error(400, "error", "Malformed JSON body")
+        return body if isinstance(body, dict) else {}
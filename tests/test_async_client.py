@@ -0,0 +1,75 @@
+"""
+Tests for AsyncWeKanClient concurrency and result ordering.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from wekan.client import AsyncWeKanClient, CardDetails
+
+
+def _card(card_id: str) -> CardDetails:
+    return CardDetails.model_validate(
+        {
+            "_id": card_id,
+            "boardId": "b1",
+            "listId": "l1",
+            "swimlaneId": "s1",
+            "title": f"Card {card_id}",
+            "createdAt": "2024-01-01T00:00:00.000Z",
+            "modifiedAt": "2024-01-01T00:00:00.000Z",
+            "dateLastActivity": "2024-01-01T00:00:00.000Z",
+        }
+    )
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        AsyncWeKanClient("http://localhost", token="t", max_concurrency=0)
+
+
+def test_concurrency_limit_and_order():
+    client = AsyncWeKanClient("http://localhost", token="t", max_concurrency=3)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_get_card_by_id(card_id: str) -> CardDetails:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _card(card_id)
+
+    client.client.get_card_by_id = fake_get_card_by_id  # type: ignore[method-assign]
+
+    async def run() -> list[CardDetails | None]:
+        async with client:
+            ids = [f"c{i}" for i in range(12)]
+            return await asyncio.gather(*(client.get_card_by_id(i) for i in ids))
+
+    results = asyncio.run(run())
+    assert [r.cardId for r in results if r] == [f"c{i}" for i in range(12)]
+    assert 1 < peak <= 3
+
+
+def test_exceptions_propagate():
+    client = AsyncWeKanClient("http://localhost", token="t")
+
+    def failing_get_boards():
+        raise RuntimeError("boom")
+
+    client.client.get_boards = failing_get_boards  # type: ignore[method-assign]
+
+    async def run():
+        async with client:
+            await client.get_boards()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run())
@@ -0,0 +1,143 @@
+"""
+Tests for 'wekancli batch'.
+"""
+
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from wekan.cli.cli import build_parser
+from wekan.cli.handlers.batch import operation_args, run_batch
+from wekan.client import BoardInfo, CardDetails, WeKanClient
+
+CARD = {
+    "_id": "c1",
+    "boardId": "b1",
+    "listId": "l1",
+    "swimlaneId": "s1",
+    "title": "Card",
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "modifiedAt": "2024-01-01T00:00:00.000Z",
+    "dateLastActivity": "2024-01-01T00:00:00.000Z",
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    c = WeKanClient("http://a", token="t")
+
+    def get_card_by_id(card_id):
+        return CardDetails.model_validate(CARD) if card_id == "c1" else None
+
+    def edit_card(board_id, list_id, card_id, swimlane_id=None, card=None, **fields):
+        return {"_id": card_id, **fields}
+
+    monkeypatch.setattr(c, "get_card_by_id", get_card_by_id)
+    monkeypatch.setattr(c, "edit_card", edit_card)
+    board = BoardInfo.model_validate({"_id": "b1", "title": "B"})
+    monkeypatch.setattr(c, "get_boards", lambda: [board])
+    monkeypatch.setattr(c, "delete_board", lambda board_id: None)
+    return c
+
+
+def run(client, *ops, workers=1):
+    lines = io.StringIO("".join(json.dumps(op) + "\n" for op in ops))
+    out = io.StringIO()
+    failures = run_batch(client, build_parser(), lines, out, workers)
+    return failures, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestOperationArgs:
+    def test_defaults_and_values(self):
+        args = operation_args(
+            build_parser(),
+            {"action": "edit", "type": "card", "card_id": "c1", "fields": {"a": 1}},
+        )
+        assert (args.action, args.type, args.card_id) == ("edit", "card", "c1")
+        assert args.fields == {"a": 1} and args.use_json is False
+
+    @pytest.mark.parametrize(
+        "op, message",
+        [
+            ({}, "action"),
+            ({"action": "edit"}, "type"),
+            ({"action": "edit", "type": "nope"}, "Unknown type"),
+            ({"action": "get", "type": "card"}, "card_id"),
+            ({"action": "login"}, "not supported"),
+            ({"action": "daemon"}, "not supported"),
+        ],
+    )
+    def test_invalid_operations(self, op, message):
+        with pytest.raises(ValueError, match=message):
+            operation_args(build_parser(), op)
+
+
+class TestRunBatch:
+    def test_results_in_order(self, client, capsys):
+        failures, results = run(
+            client,
+            {
+                "id": 1,
+                "action": "edit",
+                "type": "card",
+                "card_id": "c1",
+                "fields": {"title": "New"},
+            },
+            {"id": 2, "action": "list", "type": "boards"},
+            {"id": 3, "action": "get", "type": "card", "card_id": "missing"},
+            {"id": 4, "action": "delete", "type": "board", "board_id": "b1"},
+        )
+        assert failures == 1
+        assert [r["id"] for r in results] == [1, 2, 3, 4]
+        assert results[0]["result"] == {"_id": "c1", "title": "New"}
+        assert results[1]["result"][0]["boardId"] == "b1"
+        assert results[2] == {"id": 3, "ok": False, "error": "Card not found"}
+        assert results[3] == {"id": 4, "ok": True, "result": None}
+        # Handlers' own printing is captured, not mixed into the stream
+        assert capsys.readouterr().err == ""
+
+    def test_invalid_lines_do_not_stop_the_batch(self, client):
+        lines = io.StringIO('not json\n\n{"action": "list", "type": "boards"}\n')
+        out = io.StringIO()
+        assert run_batch(client, build_parser(), lines, out) == 1
+        results = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert results[0]["ok"] is False and results[1]["ok"] is True
+
+    def test_concurrent_workers_keep_order(self, client, monkeypatch):
+        active, peak = 0, 0
+        lock = threading.Lock()
+
+        def get_card_by_id(card_id):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05 if card_id == "c0" else 0.01)
+            with lock:
+                active -= 1
+            return CardDetails.model_validate({**CARD, "_id": card_id})
+
+        monkeypatch.setattr(client, "get_card_by_id", get_card_by_id)
+        ops = [
+            {"id": i, "action": "get", "type": "card", "card_id": f"c{i}"}
+            for i in range(8)
+        ]
+        failures, results = run(client, *ops, workers=4)
+        assert failures == 0
+        assert [r["id"] for r in results] == list(range(8))
+        assert peak > 1
+
+    def test_write_failure_stops_the_batch(self, client):
+        class ClosedPipe(io.StringIO):
+            def write(self, text):
+                raise BrokenPipeError
+
+        ops = [{"action": "list", "type": "boards"}] * 20
+        lines = io.StringIO("".join(json.dumps(op) + "\n" for op in ops))
+        with pytest.raises(BrokenPipeError):
+            run_batch(client, build_parser(), lines, ClosedPipe(), workers=2)
+        # Reading stopped before the rest of the input
+        assert lines.tell() < len(lines.getvalue())
@@ -0,0 +1,106 @@
+"""
+Tests for the GET response cache.
+"""
+
+import io
+
+import requests
+
+from wekan.client import ResponseCache, WeKanClient
+from wekan.client.cache import route_resource
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(body: bytes = b"[]") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _client(cache: ResponseCache):
+    client = WeKanClient("http://a", token="t", cache=cache)
+    calls: list[tuple[str, str]] = []
+
+    def fake_request(method, url, **kwargs):
+        calls.append((method, url))
+        return _response(b'{"_id": "x"}' if method != "GET" else b"[]")
+
+    client.session.request = fake_request  # type: ignore[method-assign]
+    return client, calls
+
+
+def test_route_resource():
+    assert route_resource("/api/boards/{board_id}/lists/{list_id}/cards") == "cards"
+    assert route_resource("/api/cards/{card_id}") == "cards"
+    assert route_resource("/api/boards/{board_id}") == "boards"
+
+
+class TestResponseCache:
+    def test_per_resource_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, ttls={"cards": 1}, clock=clock)
+        cache.put("/a/lists", "/api/boards/{board_id}/lists", _response())
+        cache.put("/a/cards", "/api/cards/{card_id}", _response())
+        clock.now = 5
+        assert cache.get("/a/lists") is not None
+        assert cache.get("/a/cards") is None
+        assert cache.stats.expirations == 1
+
+    def test_lru_entry_bound(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, "/api/boards", _response())
+        cache.get("a")
+        cache.put("c", "/api/boards", _response())
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_byte_bound(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", "/api/boards", _response(b"123456"))
+        cache.put("b", "/api/boards", _response(b"123456"))
+        assert cache.get("a") is None
+        assert cache.stats.bytes == 6
+
+    def test_invalidate_prefix_respects_segments(self):
+        cache = ResponseCache()
+        cache.put("/api/boards/b1/lists", "/api/boards/{board_id}/lists", _response())
+        cache.put("/api/boards/b12/lists", "/api/boards/{board_id}/lists", _response())
+        cache.invalidate("/api/boards/b1")
+        assert cache.get("/api/boards/b1/lists") is None
+        assert cache.get("/api/boards/b12/lists") is not None
+
+
+class TestClientCache:
+    def test_repeated_get_hits_cache(self):
+        client, calls = _client(ResponseCache())
+        client.get_lists("b1")
+        client.get_lists("b1")
+        assert len(calls) == 1
+        assert client.cache.stats.hits == 1
+
+    def test_mutation_invalidates_board(self):
+        client, calls = _client(ResponseCache())
+        client.get_lists("b1")
+        client.get_swimlanes("b2")
+        client.create_list("b1", "New")
+        client.get_lists("b1")
+        client.get_swimlanes("b2")
+        assert [m for m, _ in calls] == ["GET", "GET", "POST", "GET"]
+
+    def test_board_delete_invalidates_listing(self):
+        client, calls = _client(ResponseCache())
+        client.get_boards()
+        client.delete_board("b1")
+        client.get_boards()
+        assert [m for m, _ in calls] == ["GET", "DELETE", "GET"]
@@ -0,0 +1,214 @@
+"""
+Tests for the persistent card location index.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from wekan.cli.cli import main
+from wekan.cli.handlers._helpers import with_card_location
+from wekan.client import (
+    CardDetails,
+    CardInfo,
+    CardLocation,
+    CardLocationIndex,
+    WeKanClient,
+)
+from wekan.testing import FakeWeKanServer
+
+CARD = {
+    "_id": "c1",
+    "boardId": "b1",
+    "listId": "l1",
+    "swimlaneId": "s1",
+    "title": "Card",
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "modifiedAt": "2024-01-01T00:00:00.000Z",
+    "dateLastActivity": "2024-01-01T00:00:00.000Z",
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = CardLocationIndex(tmp_path / "index.db", namespace="http://a")
+    yield idx
+    idx.close()
+
+
+class TestCardLocationIndex:
+    def test_record_and_get(self, index):
+        assert index.get("c1") is None
+        index.record("c1", "b1", "l1", "s1")
+        assert index.get("c1") == CardLocation("b1", "l1", "s1")
+
+    def test_update_keeps_known_swimlane(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        index.record("c1", "b1", "l1")
+        assert index.get("c1") == CardLocation("b1", "l1", "s1")
+
+    def test_move_clears_swimlane(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        index.record("c1", "b1", "l2")
+        assert index.get("c1") == CardLocation("b1", "l2", "")
+        index.record("c1", "b1", "l2", "s2")
+        index.record("c1", "b2", "l2")
+        assert index.get("c1") == CardLocation("b2", "l2", "")
+
+    def test_discard(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        index.discard("c1")
+        assert index.get("c1") is None
+
+    def test_namespaces_are_separate(self, index, tmp_path):
+        index.record("c1", "b1", "l1", "s1")
+        other = CardLocationIndex(tmp_path / "index.db", namespace="http://b")
+        assert other.get("c1") is None
+        # Persisted and visible to a second handle on the same namespace
+        same = CardLocationIndex(tmp_path / "index.db", namespace="http://a")
+        assert same.get("c1") == CardLocation("b1", "l1", "s1")
+
+
+class TestClientIndexing:
+    def test_get_card_by_id_records_location(self, index, monkeypatch):
+        client = WeKanClient("http://a", token="t", card_index=index)
+        response = type("R", (), {"text": "x", "json": lambda self: CARD})()
+        monkeypatch.setattr(client, "_request", lambda *a, **kw: response)
+        client.get_card_by_id("c1")
+        assert index.get("c1") == CardLocation("b1", "l1", "s1")
+
+    def test_list_cards_record_location(self, index, monkeypatch):
+        client = WeKanClient("http://a", token="t", card_index=index)
+        body = [{"_id": "c2", "title": "t", "swimlaneId": "s9"}]
+        response = type("R", (), {"content": json.dumps(body).encode()})()
+        monkeypatch.setattr(client, "_request", lambda *a, **kw: response)
+        cards = client.get_cards("b1", "l1")
+        assert isinstance(cards[0], CardInfo)
+        assert index.get("c2") == CardLocation("b1", "l1", "s9")
+
+
+class TestWithCardLocation:
+    def test_index_hit_skips_lookup(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        client = WeKanClient("http://a", token="t", card_index=index)
+        client.get_card_by_id = lambda card_id: pytest.fail("unexpected lookup")
+        assert with_card_location(client, "c1", lambda loc: loc.boardId) == "b1"
+
+    def test_stale_location_falls_back_to_lookup(self, index):
+        index.record("c1", "old-board", "l1", "s1")
+        client = WeKanClient("http://a", token="t", card_index=index)
+        client.get_card_by_id = lambda card_id: CardDetails.model_validate(CARD)
+        seen = []
+
+        def call(loc):
+            seen.append(loc.boardId)
+            return None if loc.boardId == "old-board" else "ok"
+
+        assert with_card_location(client, "c1", call) == "ok"
+        assert seen == ["old-board", "b1"]
+        assert index.get("c1") is None
+
+    def test_empty_list_is_not_stale(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        client = WeKanClient("http://a", token="t", card_index=index)
+        client.get_card_by_id = lambda card_id: pytest.fail("unexpected lookup")
+        assert with_card_location(client, "c1", lambda loc: []) == []
+        assert with_card_location(client, "c1", lambda loc: b"[]") == b"[]"
+
+    def test_validation_errors_are_not_retried(self, index):
+        index.record("c1", "b1", "l1", "s1")
+        client = WeKanClient("http://a", token="t", card_index=index)
+        client.get_card_by_id = lambda card_id: pytest.fail("unexpected lookup")
+        with pytest.raises(ValidationError):
+            with_card_location(
+                client, "c1", lambda loc: CardDetails.model_validate({})
+            )
+
+    def test_without_index(self):
+        client = WeKanClient("http://a", token="t")
+        client.get_card_by_id = lambda card_id: CardDetails.model_validate(CARD)
+        assert with_card_location(client, "c1", lambda loc: loc) == CardLocation(
+            "b1", "l1", "s1"
+        )
+
+
+def test_write_follows_card_moved_elsewhere(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("WEKAN_CACHE_DIR", str(tmp_path))
+    with FakeWeKanServer() as server:
+        store = server.store
+        board = store.add_board("B", server.admin["_id"])
+        swimlane = store.add_swimlane(board["_id"], "S")
+        first = store.add_list(board["_id"], "First")
+        second = store.add_list(board["_id"], "Second")
+        card = store.add_card(
+            board["_id"], first["_id"], swimlane["_id"], "Card", server.admin["_id"]
+        )
+        cli = ["--url", server.url, "--token", server.login_token()]
+        main([*cli, "get", "card", card["_id"]])
+        # Moved by another client after the index recorded it
+        store.update("cards", card["_id"], listId=second["_id"])
+        server.requests.clear()
+        main([*cli, "edit", "card", card["_id"], "-f", "title=New"])
+        capsys.readouterr()
+        # The indexed board is still right, so no lookup was needed
+        assert server.requests["GET /api/cards/{cardId}"] == 0
+
+        assert store.get("cards", card["_id"])["listId"] == second["_id"]
+        assert store.get("cards", card["_id"])["title"] == "New"
+
+        # A move to another swimlane keeps the card's current list
+        other = store.add_swimlane(board["_id"], "Other")
+        main([*cli, "edit", "card", card["_id"], "-f", f"newSwimlaneId={other['_id']}"])
+        capsys.readouterr()
+        moved = store.get("cards", card["_id"])
+        assert (moved["listId"], moved["swimlaneId"]) == (second["_id"], other["_id"])
+
+
+class TestEditCardPrefetch:
+    def _client(self, monkeypatch):
+        client = WeKanClient("http://a", token="t")
+        sent = []
+        response = type("R", (), {"json": lambda self: {"_id": "c1"}})()
+
+        def fake_request(method, route, json=None, **path):
+            sent.append((method, json))
+            return response
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        return client, sent
+
+    def test_edit_without_move_sends_only_fields(self, monkeypatch):
+        client, sent = self._client(monkeypatch)
+        client.get_card = lambda *a: pytest.fail("unexpected prefetch")
+        client.edit_card("b1", "l1", "c1", swimlane_id="s1", title="New")
+        assert sent == [("PUT", {"title": "New"})]
+
+    def test_known_swimlane_skips_get(self, monkeypatch):
+        client, sent = self._client(monkeypatch)
+        client.get_card = lambda *a: pytest.fail("unexpected prefetch")
+        client.edit_card("b1", "l1", "c1", swimlane_id="s1", newListId="l2")
+        assert sent == [
+            (
+                "PUT",
+                {"newListId": "l2", "newSwimlaneId": "s1", "newBoardId": "b1"},
+            )
+        ]
+
+    def test_fetched_card_supplies_location(self, monkeypatch):
+        client, sent = self._client(monkeypatch)
+        client.get_card = lambda *a: pytest.fail("unexpected prefetch")
+        card = CardDetails.model_validate(CARD)
+        client.edit_card("b1", "l1", "c1", card=card, title="New")
+        assert sent[0][1] == {
+            "title": "New",
+            "newSwimlaneId": "s1",
+            "newBoardId": "b1",
+            "newListId": "l1",
+        }
+
+    def test_unknown_swimlane_prefetches(self, monkeypatch):
+        client, sent = self._client(monkeypatch)
+        client.get_card = lambda *a: CardDetails.model_validate(CARD)
+        client.edit_card("b1", "l1", "c1", newListId="l2")
+        assert sent[0][1]["newSwimlaneId"] == "s1"
@@ -0,0 +1,144 @@
+"""
+Tests for wekancli argument parsing and help output.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from wekan.cli.cli import ACTIONS, build_parser, run
+from wekan.cli.handlers._helpers import output
+from wekan.cli.utils import format_output
+from wekan.client import BoardInfo
+
+
+# Budget for the import time of wekan's own modules when running --version,
+# about ten times what it takes; importing the client and pydantic, as it
+# did before imports were deferred, took about 300ms
+VERSION_IMPORT_BUDGET_MS = 100
+
+# Modules only a command that talks to the server should import
+DEFERRED_MODULES = ("pydantic", "requests", "wekan.client.types", "wekan.cli.handlers")
+
+
+def _actions(parser):
+    return parser._subparsers._group_actions[0]
+
+
+def _help(parser, capsys, *argv):
+    with pytest.raises(SystemExit):
+        parser.parse_args(list(argv))
+    return capsys.readouterr().out
+
+
+class TestHelp:
+    def test_field_help_is_generated_when_shown(self, capsys):
+        parser = build_parser()
+        create = _actions(parser).choices["create"]
+        card = create._subparsers._group_actions[0].choices["card"]
+        assert callable(card.epilog)
+
+        out = _help(parser, capsys, "create", "card", "--help")
+        assert "card edit parameters:\n" in out
+        assert "Use --help-all to see all available parameters" in out
+
+    def test_help_all_does_not_change_help(self, capsys):
+        parser = build_parser()
+        short = _help(parser, capsys, "edit", "card", "--help")
+        full = _help(parser, capsys, "edit", "card", "--help-all")
+        assert len(full) > len(short)
+        assert "--help-all to see" not in full
+        assert _help(parser, capsys, "edit", "card", "--help") == short
+
+
+class TestLazyParsers:
+    def test_only_the_selected_action_is_built(self):
+        parser = build_parser()
+        args = parser.parse_args(["get", "card", "c1"])
+        assert (args.action, args.type, args.card_id) == ("get", "card", "c1")
+        built = [name for name, p in dict.items(_actions(parser).choices) if p]
+        assert built == ["get"]
+
+    def test_iterating_choices_builds_every_parser(self):
+        choices = _actions(build_parser()).choices
+        assert list(choices) == [name for name, _, _ in ACTIONS]
+        assert all(p.prog == f"wekancli {name}" for name, p in choices.items())
+        assert "card" in choices["edit"]._subparsers._group_actions[0].choices
+
+    def test_hidden_action_is_parsed_but_not_listed(self, capsys):
+        parser = build_parser()
+        assert parser.parse_args(["api", "boards"]).path == ["boards"]
+        out = _help(parser, capsys, "--help")
+        assert "    login" in out and "api" not in out
+
+
+class TestStartup:
+    def test_version_import_time(self):
+        env = {k: v for k, v in os.environ.items() if not k.startswith("WEKAN_")}
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "wekan.cli", "--version"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # "import time: SELF_US | CUMULATIVE_US | <indent>NAME", children first
+        imports = [
+            line.split("|")
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        ]
+        names = {name.strip() for _, _, name in imports}
+        assert not [m for m in DEFERRED_MODULES if m in names]
+        wekan_us = sum(
+            int(cumulative)
+            for _, cumulative, name in imports
+            if name.startswith(" wekan")
+        )
+        assert wekan_us / 1000 < VERSION_IMPORT_BUDGET_MS
+
+
+class TestNdjson:
+    boards = [
+        BoardInfo.model_validate({"_id": f"b{i}", "title": "B"}) for i in range(3)
+    ]
+
+    def test_one_line_per_record(self, capsys):
+        output(self.boards, "ndjson")
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["boardId"] for line in lines] == ["b0", "b1", "b2"]
+
+    def test_single_record_and_empty_list(self, capsys):
+        output(self.boards[0], "ndjson")
+        output([], "ndjson")
+        assert capsys.readouterr().out == '{"boardId": "b0", "title": "B"}\n'
+
+    def test_records_are_flushed_as_written(self, monkeypatch):
+        writes = []
+
+        class Stream:
+            def write(self, text):
+                writes.append(text)
+
+            def flush(self):
+                writes.append(None)
+
+        monkeypatch.setattr(sys, "stdout", Stream())
+        output(self.boards, "ndjson")
+        assert writes[1::2] == [None] * 3
+
+    def test_format_output(self):
+        assert format_output(self.boards[:2], "ndjson") == (
+            '{"boardId": "b0", "title": "B"}\n{"boardId": "b1", "title": "B"}'
+        )
+
+    def test_selected_by_environment(self, monkeypatch):
+        monkeypatch.setenv("WEKAN_OUTPUT_FORMAT", "NDJSON")
+        parser = build_parser()
+        args = parser.parse_args(["query", "--db", os.devnull])
+        args.handler = lambda args: None
+        run(parser, args)
+        assert args.format == "ndjson"
@@ -0,0 +1,32 @@
+"""
+Tests for WeKanClient connection pool and timeout options.
+"""
+
+from wekan.client import WeKanClient
+
+
+def test_default_timeout_applies_to_connect_and_read():
+    client = WeKanClient("http://localhost", token="t")
+    assert client.timeout == (30, 30)
+
+
+def test_separate_connect_and_read_timeouts():
+    client = WeKanClient(
+        "http://localhost", token="t", timeout=60, connect_timeout=3.5
+    )
+    assert client.timeout == (3.5, 60)
+
+
+def test_pool_options_configure_adapters():
+    client = WeKanClient(
+        "http://localhost",
+        token="t",
+        pool_connections=4,
+        pool_maxsize=25,
+        pool_block=True,
+    )
+    for prefix in ("http://", "https://"):
+        adapter = client.session.get_adapter(prefix + "example.com")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
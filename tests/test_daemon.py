@@ -0,0 +1,100 @@
+"""
+Tests for 'wekancli daemon' and the thin client.
+"""
+
+import threading
+import time
+
+import pytest
+
+import wekan.client
+from wekan.cli.daemon import serve
+from wekan.cli.thin import run_remote, send
+from wekan.client import WeKanClient
+from wekan.client.client import _debug_response
+from wekan.client.env import request_env
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    path = tmp_path / "d.sock"
+    monkeypatch.setenv("WEKAN_DAEMON_SOCKET", str(path))
+    thread = threading.Thread(target=serve, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if path.exists():
+            break
+        time.sleep(0.01)
+    yield path
+    send({"shutdown": True}, path)
+    thread.join(5)
+    assert not path.exists()
+
+
+class TestDaemon:
+    def test_no_daemon_runs_locally(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("WEKAN_DAEMON_SOCKET", str(tmp_path / "none.sock"))
+        assert run_remote(["--version"]) is None
+
+    def test_output_and_exit_status(self, daemon, capsys):
+        assert run_remote(["--version"]) == 0
+        assert capsys.readouterr().out.startswith("wekancli ")
+
+        assert run_remote(["list", "boards"]) == 1
+        assert "WeKan URL required" in capsys.readouterr().err
+
+        assert run_remote(["no-such-action"]) == 2
+        assert "invalid choice" in capsys.readouterr().err
+
+    def test_request_environment(self, daemon, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("WEKAN_OUTPUT_FORMAT", "text")
+        assert run_remote(["query", "--db", str(tmp_path / "m.db")]) == 0
+        assert capsys.readouterr().out == "\n"
+
+    def test_socket_is_private(self, daemon):
+        assert daemon.stat().st_mode & 0o077 == 0
+
+    def test_relative_paths_use_client_cwd(self, daemon, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert run_remote(["query", "--db", "m.db"]) == 0
+        assert (tmp_path / "m.db").exists()
+
+    def test_cache_dir_per_request(self, daemon, tmp_path, monkeypatch):
+        monkeypatch.setenv("WEKAN_URL", "http://a")
+        monkeypatch.setenv("WEKAN_CACHE_DIR", str(tmp_path / "cache"))
+        assert run_remote(["query"]) == 0
+        assert list((tmp_path / "cache").glob("mirror-*.db"))
+
+    @pytest.mark.parametrize("env, debug", [({"WEKAN_DEBUG": "1"}, True), ({}, False)])
+    def test_debug_per_request(self, monkeypatch, env, debug):
+        monkeypatch.setenv("WEKAN_DEBUG", "1")
+        token = request_env.set(env)
+        try:
+            hooks = WeKanClient("http://a").after_response
+        finally:
+            request_env.reset(token)
+        assert (_debug_response in hooks) == debug
+
+    def test_interactive_commands_fall_back(self, daemon):
+        assert run_remote(["login"]) is None
+
+    def test_profiled_commands_fall_back(self, daemon):
+        assert run_remote(["--profile", "list", "boards"]) is None
+        assert run_remote(["--trace-malloc", "list", "boards"]) is None
+
+    def test_clients_are_reused(self, daemon, monkeypatch):
+        created = []
+
+        class FakeClient:
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+
+            def get_boards(self):
+                return []
+
+        monkeypatch.setattr(wekan.client, "WeKanClient", FakeClient)
+        monkeypatch.setenv("WEKAN_URL", "http://a")
+        monkeypatch.setenv("WEKAN_TOKEN", "t")
+        for _ in range(3):
+            assert run_remote(["--no-index", "list", "boards"]) == 0
+        assert len(created) == 1
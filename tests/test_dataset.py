@@ -0,0 +1,61 @@
+"""
+Tests for the synthetic dataset generator.
+"""
+
+import json
+from collections import Counter
+
+import pytest
+
+from wekan.client import WeKanClient
+from wekan.testing import DatasetSpec, FakeStore, FakeWeKanServer, generate
+from wekan.testing.dataset import export, main
+
+SPEC = DatasetSpec(cards=300, lists=5, swimlanes=3, users=4, seed=7)
+
+
+@pytest.fixture(scope="module")
+def store():
+    return generate(SPEC)
+
+
+def test_same_seed_same_data(store):
+    assert export(generate(SPEC)) == export(store)
+    assert export(generate(DatasetSpec(cards=300, seed=8))) != export(store)
+
+
+def test_shape(store):
+    (board,) = store.collections["boards"].values()
+    assert len(store.find("lists", boardId=board["_id"])) == 5
+    assert len(store.find("swimlanes", boardId=board["_id"])) == 3
+    assert len(board["members"]) == 5  # admin and 4 users
+    cards = store.find("cards", boardId=board["_id"])
+    assert len(cards) == 300
+    per_list = Counter(card["listId"] for card in cards)
+    assert max(per_list.values()) > 2 * min(per_list.values())
+    commented = {c["cardId"] for c in store.collections["comments"].values()}
+    assert 0 < len(commented) < 300
+
+
+def test_import_round_trip(store):
+    (board,) = export(store)
+    copy = FakeStore()
+    copy.import_board(json.loads(json.dumps(board)))
+    assert copy.export_board(board["_id"]) == board
+
+
+def test_served(store):
+    with FakeWeKanServer(store) as server:
+        client = WeKanClient(server.url, "admin", "admin")
+        client.login()
+        (board,) = client.get_boards_for_user(client.user_id)
+        lst = client.get_lists(board.boardId)[0]
+        cards = client.get_cards(board.boardId, lst.listId)
+        details = client.get_card_by_id(cards[0].cardId)
+        assert details.boardId == board.boardId
+
+
+def test_main(capsys):
+    main(["--cards", "10", "--boards", "2"])
+    boards = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [len(board["cards"]) for board in boards] == [10, 10]
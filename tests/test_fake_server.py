@@ -0,0 +1,144 @@
+"""
+Tests for the in-process fake WeKan server.
+"""
+
+import pathlib
+import re
+import time
+
+import pytest
+import requests
+
+from wekan.client import RetryPolicy, WeKanAPIError, WeKanClient
+from wekan.testing import ROUTES, FakeWeKanServer
+from wekan.testing.fake_server import UNDOCUMENTED_ROUTES
+
+OPENAPI = pathlib.Path(__file__).parent.parent / "docs" / "openapi.yaml"
+
+
+@pytest.fixture
+def server():
+    with FakeWeKanServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = WeKanClient(server.url, "admin", "admin")
+    client.login()
+    return client
+
+
+def _openapi_routes() -> set[tuple[str, str]]:
+    routes, path = set(), None
+    for line in OPENAPI.read_text().splitlines():
+        if m := re.match(r"  (/\S*):$", line):
+            path = m.group(1)
+        elif m := re.match(r"    (get|post|put|delete):$", line):
+            routes.add((m.group(1).upper(), path))
+    return routes
+
+
+def test_routes_match_openapi():
+    documented = [r for r in ROUTES if r not in UNDOCUMENTED_ROUTES]
+    assert sorted(documented) == sorted(_openapi_routes())
+
+
+class TestApi:
+    def test_board_contents(self, client):
+        board = client.create_board("B", client.user_id)
+        swimlane = client.get_swimlanes(board.boardId)[0]
+        lst = client.create_list(board.boardId, "L")
+        card = client.create_card(
+            board.boardId, lst.listId, "C", client.user_id, swimlane.swimlaneId
+        )
+        client.create_comment(board.boardId, card.cardId, client.user_id, "hi")
+
+        details = client.get_card_by_id(card.cardId)
+        assert (details.listId, details.swimlaneId) == (lst.listId, swimlane.swimlaneId)
+        assert [c.comment for c in client.get_comments(board.boardId, card.cardId)] == [
+            "hi"
+        ]
+        assert [b.boardId for b in client.get_boards_for_user(client.user_id)] == [
+            board.boardId
+        ]
+        assert client.get_card(board.boardId, lst.listId, "missing") is None
+
+    def test_archive_and_restore_card(self, client):
+        board = client.create_board("B", client.user_id)
+        swimlane = client.get_swimlanes(board.boardId)[0]
+        lst = client.create_list(board.boardId, "L")
+        card = client.create_card(
+            board.boardId, lst.listId, "C", client.user_id, swimlane.swimlaneId
+        )
+        client.archive_card(board.boardId, lst.listId, card.cardId)
+        assert client.get_cards(board.boardId, lst.listId) == []
+        assert client.get_card_by_id(card.cardId).archived
+
+        client.restore_card(board.boardId, lst.listId, card.cardId)
+        assert [c.cardId for c in client.get_cards(board.boardId, lst.listId)] == [
+            card.cardId
+        ]
+
+    def test_errors(self, server, client):
+        with pytest.raises(WeKanAPIError) as exc_info:
+            client.create_list("missing", "L")
+        assert exc_info.value.error.statusCode == 404
+        response = requests.get(server.url + "/api/user")
+        assert response.status_code == 401
+
+    def test_revoked_token_is_replaced_by_login(self, server, client):
+        server.store.revoke_tokens()
+        assert client.get_user().username == "admin"
+        assert server.requests["POST /users/login"] == 2
+
+    def test_export(self, server, client):
+        board = client.create_board("B", client.user_id)
+        client.create_list(board.boardId, "L")
+        url = f"{server.url}/api/boards/{board.boardId}/export"
+        assert requests.get(url).status_code == 403
+        export = requests.get(url, params={"authToken": client.token}).json()
+        assert [lst["title"] for lst in export["lists"]] == ["L"]
+
+
+class TestBehavior:
+    def test_latency(self, server, client):
+        server.set_behavior("GET /api/user", latency=0.05)
+        start = time.perf_counter()
+        client.get_user()
+        assert time.perf_counter() - start >= 0.05
+        start = time.perf_counter()
+        client.get_boards()
+        assert time.perf_counter() - start < 0.05
+
+    def test_injected_errors_are_retried(self, server):
+        server.set_behavior("/api/boards", error_rate=0.5, retry_after=0)
+        client = WeKanClient(
+            server.url,
+            token=server.login_token(),
+            retry=RetryPolicy(max_retries=10, jitter=False),
+        )
+        for _ in range(20):
+            assert client.get_boards() == []
+        injected = server.injected_errors["GET /api/boards"]
+        assert injected > 0
+        assert client.retry_stats.reasons["503"] == injected
+
+    def test_injected_errors_are_seeded(self):
+        def failures(seed):
+            with FakeWeKanServer(seed=seed) as server:
+                server.set_behavior(error_rate=0.5)
+                session = requests.Session()
+                return [
+                    session.get(server.url + "/api/boards").status_code == 503
+                    for _ in range(20)
+                ]
+
+        assert failures(1) == failures(1)
+        assert failures(1) != failures(2)
+
+    def test_unknown_route(self, server):
+        with pytest.raises(ValueError):
+            server.set_behavior("GET /api/nope", latency=1)
+        with pytest.raises(TypeError):
+            server.set_behavior(delay=1)
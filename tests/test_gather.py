@@ -0,0 +1,62 @@
+"""
+Tests for WeKanClient.gather / map batch helpers.
+"""
+
+import functools
+import threading
+import time
+
+from wekan.client import CardInfo, WeKanClient
+
+
+def test_gather_preserves_order_and_collects_errors():
+    client = WeKanClient("http://localhost", token="t")
+
+    def work(i: int) -> int:
+        time.sleep(0.01 * (5 - i))
+        if i == 2:
+            raise ValueError("bad id")
+        return i * 10
+
+    results = client.gather(functools.partial(work, i) for i in range(5))
+    assert results[:2] == [0, 10]
+    assert isinstance(results[2], ValueError)
+    assert results[3:] == [30, 40]
+
+
+def test_gather_empty():
+    client = WeKanClient("http://localhost", token="t")
+    assert client.gather([]) == []
+
+
+def test_map_bounds_concurrency():
+    client = WeKanClient("http://localhost", token="t", pool_maxsize=4)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work(a: str, b: str) -> str:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return a + b
+
+    results = client.map(work, "abcdefghij", "0123456789")
+    assert results == [a + b for a, b in zip("abcdefghij", "0123456789")]
+    assert peak <= 4
+
+
+def test_get_cards_by_ids_and_lists():
+    client = WeKanClient("http://localhost", token="t")
+    client.get_card_by_id = lambda card_id: None if card_id == "x" else card_id
+    client.get_cards = lambda board_id, list_id: [
+        CardInfo.model_validate({"_id": f"{list_id}-c", "title": "t"})
+    ]
+
+    assert client.get_cards_by_ids(["a", "x", "b"]) == ["a", None, "b"]
+    by_list = client.get_cards_for_lists("b1", ["l1", "l2"])
+    assert [cards[0].cardId for cards in by_list] == ["l1-c", "l2-c"]
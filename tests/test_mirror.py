@@ -0,0 +1,383 @@
+"""
+Tests for the local SQLite mirror and its incremental sync.
+"""
+
+import json
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from wekan.client import BoardDetails, CardDetails, Comment, WeKanClient
+from wekan.mirror import Mirror, sync
+from wekan.mirror.query import compile_query, parse_query
+from wekan.testing import DatasetSpec, FakeWeKanServer, generate
+
+T0 = "2024-01-01T00:00:00.000Z"
+T1 = "2024-02-01T00:00:00.000Z"
+CARD = "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}"
+
+
+class FakeServer:
+    """Answer WeKanClient._request from in-memory data, counting routes."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.board = {"_id": "b1", "title": "Board", "createdAt": T0, "modifiedAt": T0}
+        self.lists = [{"_id": "l1", "title": "Todo"}]
+        self.swimlanes = [{"_id": "s1", "title": "Default"}]
+        self.cards = {
+            "c1": self.card("c1", "First"),
+            "c2": self.card("c2", "Second"),
+        }
+        self.fail = set()
+        self.exportable = True
+
+    @staticmethod
+    def card(card_id, title, modified=T0):
+        return {
+            "_id": card_id,
+            "boardId": "b1",
+            "listId": "l1",
+            "swimlaneId": "s1",
+            "title": title,
+            "createdAt": T0,
+            "modifiedAt": modified,
+            "dateLastActivity": modified,
+        }
+
+    def __call__(self, method, route, json=None, **path):
+        self.calls[route] += 1
+        if route in self.fail:
+            raise ConnectionError(route)
+        detail = {"boardId": "b1", "createdAt": T0, "updatedAt": T0, "modifiedAt": T0}
+        if route == "/api/user":
+            body = {
+                "_id": "u1",
+                "username": "u",
+                "createdAt": T0,
+                "modifiedAt": T0,
+                "authenticationMethod": "password",
+            }
+        elif route == "/api/users/{user_id}/boards":
+            body = [{"_id": "b1", "title": "Board"}]
+        elif route == "/api/boards/{board_id}":
+            body = self.board
+        elif route == "/api/boards/{board_id}/export":
+            if not self.exportable:
+                raise PermissionError(route)
+            body = {
+                **self.board,
+                "lists": [{**x, **detail} for x in self.lists],
+                "swimlanes": [{**x, **detail} for x in self.swimlanes],
+                "cards": list(self.cards.values()),
+            }
+        elif route == "/api/boards/{board_id}/lists":
+            body = self.lists
+        elif route == "/api/boards/{board_id}/lists/{list_id}":
+            lst = next(x for x in self.lists if x["_id"] == path["list_id"])
+            body = {**lst, **detail}
+        elif route == "/api/boards/{board_id}/swimlanes":
+            body = self.swimlanes
+        elif route == "/api/boards/{board_id}/swimlanes/{swimlane_id}":
+            body = {**self.swimlanes[0], **detail}
+        elif route == "/api/boards/{board_id}/lists/{list_id}/cards":
+            body = [{"_id": c["_id"], "title": c["title"]} for c in self.cards.values()]
+        elif route == "/api/boards/{board_id}/lists/{list_id}/cards/{card_id}":
+            body = self.cards[path["card_id"]]
+        elif route == "/api/boards/{board_id}/cards/{card_id}/comments":
+            body = [{"_id": f"m-{path['card_id']}", "comment": "hi", "authorId": "u1"}]
+        elif route == "/api/boards/{board_id}/cards/{card_id}/checklists":
+            body = [{"_id": f"k-{path['card_id']}", "title": "Steps"}]
+        elif route == "/api/boards/{board_id}/cards/{card_id}/checklists/{checklist_id}":
+            body = {
+                "_id": path["checklist_id"],
+                "cardId": path["card_id"],
+                "title": "Steps",
+                "sort": 0,
+                "createdAt": T0,
+                "items": [{"_id": "i1", "title": "Do it", "isFinished": False}],
+            }
+        else:
+            raise AssertionError(f"unexpected route {route}")
+        return Response(body)
+
+
+class Response:
+    def __init__(self, body):
+        self.text = json.dumps(body)
+        self.content = self.text.encode()
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    c = WeKanClient("http://a", token="t")
+    monkeypatch.setattr(c, "_request", server)
+    return c
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    m = Mirror(tmp_path / "mirror.db")
+    yield m
+    m.close()
+
+
+class TestSync:
+    def test_initial_sync_populates_mirror(self, client, mirror):
+        stats = sync(client, mirror)
+        assert stats.boards == 1 and stats.cards == 2 and not stats.errors
+        assert [b.title for b in mirror.boards()] == ["Board"]
+        assert [lst.title for lst in mirror.lists("b1")] == ["Todo"]
+        assert [s.title for s in mirror.swimlanes("b1")] == ["Default"]
+        assert {c.cardId for c in mirror.cards(board_id="b1")} == {"c1", "c2"}
+        assert mirror.comments("c1")[0].comment == "hi"
+        assert mirror.checklists("c1")[0].items[0].title == "Do it"
+        assert mirror.get_state("last_sync") is not None
+
+    def test_resync_skips_unchanged(self, client, mirror, server):
+        sync(client, mirror)
+        server.calls.clear()
+        server.cards["c2"] = server.card("c2", "Second (edited)", modified=T1)
+
+        stats = sync(client, mirror)
+
+        assert stats.cards_changed == 1 and stats.cards_unchanged == 1
+        assert server.calls["/api/boards/{board_id}/cards/{card_id}/comments"] == 1
+        # Unchanged cards, lists and swimlanes come from the export
+        assert server.calls[CARD] == 1
+        assert server.calls["/api/boards/{board_id}/lists/{list_id}"] == 0
+        assert mirror.get_card("c2").title == "Second (edited)"
+        assert mirror.comments("c1")  # untouched children are kept
+
+    def test_list_changes_are_mirrored(self, client, mirror, server):
+        sync(client, mirror)
+        server.lists[0]["color"] = "red"
+        stats = sync(client, mirror)
+        assert stats.exports == 1
+        assert mirror.lists("b1")[0].color == "red"
+
+    def test_without_export_every_entity_is_fetched(self, client, mirror, server):
+        server.exportable = False
+        sync(client, mirror)
+        server.calls.clear()
+        server.lists[0]["color"] = "red"
+
+        stats = sync(client, mirror)
+
+        assert stats.exports == 0 and not stats.errors
+        assert stats.cards_changed == 0 and stats.cards_unchanged == 2
+        assert server.calls[CARD] == 2
+        assert server.calls["/api/boards/{board_id}/cards/{card_id}/comments"] == 0
+        assert mirror.lists("b1")[0].color == "red"
+
+    def test_full_refetches_everything(self, client, mirror, server):
+        sync(client, mirror)
+        server.calls.clear()
+        stats = sync(client, mirror, full=True)
+        assert stats.cards_changed == 2
+        assert server.calls[CARD] == 2
+
+    def test_noop_resync_against_server(self, mirror):
+        with FakeWeKanServer(generate(DatasetSpec(cards=40, lists=3))) as server:
+            client = WeKanClient(server.url, "admin", "admin")
+            client.login()
+            sync(client, mirror)
+            server.requests.clear()
+            stats = sync(client, mirror)
+        assert stats.exports == 1 and stats.cards_unchanged == stats.cards > 0
+        assert server.requests["GET /api/boards/{boardId}/export"] == 1
+        assert server.requests["GET /api/boards/{boardId}/lists/{listId}"] == 0
+        route = "GET /api/boards/{boardId}/lists/{listId}/cards/{cardId}"
+        assert server.requests[route] == 0
+
+    def test_deleted_cards_are_pruned(self, client, mirror, server):
+        sync(client, mirror)
+        del server.cards["c1"]
+        stats = sync(client, mirror)
+        assert stats.removed == 1
+        assert mirror.get_card("c1") is None
+        assert mirror.comments("c1") == []
+
+    def test_failures_do_not_prune(self, client, mirror, server):
+        sync(client, mirror)
+        server.fail.add("/api/boards/{board_id}/lists/{list_id}/cards")
+        stats = sync(client, mirror)
+        assert stats.errors
+        assert {c.cardId for c in mirror.cards()} == {"c1", "c2"}
+
+    @pytest.mark.parametrize("exportable", [True, False])
+    def test_resync_reindexes_only_changed_cards(
+        self, client, mirror, server, monkeypatch, exportable
+    ):
+        server.exportable = exportable
+        sync(client, mirror)
+        reindexed = []
+        index_text = mirror._index_text
+        monkeypatch.setattr(
+            mirror, "_index_text", lambda ids: (reindexed.extend(ids), index_text(ids))
+        )
+        server.cards["c2"] = server.card("c2", "Renamed", modified=T1)
+        sync(client, mirror)
+        assert set(reindexed) == {"c2"}
+        assert [h.card.cardId for h in mirror.search("renamed")] == ["c2"]
+
+    def test_other_schema_version_is_rebuilt(self, tmp_path):
+        with Mirror(tmp_path / "mirror.db") as old:
+            old.put_cards([make_card("a")])
+            old.conn.execute(
+                "UPDATE sync_state SET value = '3' WHERE key = 'schema_version'"
+            )
+            old.conn.execute("ALTER TABLE cards ADD COLUMN archived INTEGER")
+            old.conn.commit()
+        with Mirror(tmp_path / "mirror.db") as new:
+            assert new.cards() == []
+            columns = [row[1] for row in new.conn.execute("PRAGMA table_info(cards)")]
+            assert "archived" not in columns
+            new.put_cards([make_card("a")])
+            assert new.get_card("a").cardId == "a"
+
+
+def make_card(card_id, **fields):
+    return CardDetails.model_validate({**FakeServer.card(card_id, card_id), **fields})
+
+
+class TestQuery:
+    NOW = datetime(2024, 3, 6, 12, 0, tzinfo=timezone.utc)  # A Wednesday
+
+    @pytest.fixture(autouse=True)
+    def cards(self, mirror):
+        mirror.put_board(
+            BoardDetails.model_validate(
+                {
+                    "_id": "b1",
+                    "title": "Board",
+                    "createdAt": T0,
+                    "modifiedAt": T0,
+                    "labels": [{"_id": "lb1", "name": "Urgent", "color": "red"}],
+                }
+            )
+        )
+        mirror.put_cards(
+            [
+                make_card(
+                    "a",
+                    assignees=["u1"],
+                    labelIds=["lb1"],
+                    dueAt="2024-03-07T09:00:00.000Z",
+                ),
+                make_card("b", assignees=["u2"], dueAt="2024-03-20T09:00:00.000Z"),
+                make_card(
+                    "c",
+                    customFields=[
+                        {"_id": "cf1", "value": "high"},
+                        {"_id": "cf2", "value": 10},
+                    ],
+                ),
+            ]
+        )
+
+    def ids(self, mirror, query, **kwargs):
+        return [c.cardId for c in mirror.query(query, now=self.NOW, **kwargs)]
+
+    def test_set_fields(self, mirror):
+        assert self.ids(mirror, "assignee=u1") == ["a"]
+        assert self.ids(mirror, "assignee=u1,u2") == ["a", "b"]
+        assert self.ids(mirror, "assignee!=u1") == ["b", "c"]
+        assert self.ids(mirror, "assignees=none") == ["c"]
+
+    def test_label_by_id_or_name(self, mirror):
+        assert self.ids(mirror, "labelIds=lb1") == ["a"]
+        assert self.ids(mirror, "label=Urgent") == ["a"]
+
+    def test_dates(self, mirror):
+        assert self.ids(mirror, "due=this-week") == ["a"]
+        assert self.ids(mirror, "due<=+7d") == ["a"]
+        assert self.ids(mirror, "due>2024-03-10") == ["b"]
+        assert self.ids(mirror, "due=none") == ["c"]
+        assert self.ids(mirror, "due!=this-week") == ["b", "c"]
+
+    def test_custom_fields_and_title(self, mirror):
+        assert self.ids(mirror, "cf.cf1=high board=b1") == ["c"]
+        assert self.ids(mirror, "title~B") == ["b"]
+
+    def test_terms_are_not_split_again(self, mirror):
+        mirror.put_cards([make_card("d", title="My Card")])
+        assert self.ids(mirror, ["title=My Card"]) == ["d"]
+        assert self.ids(mirror, "title='my card'") == ["d"]
+
+    def test_custom_fields_compare_numbers(self, mirror):
+        mirror.put_cards(
+            [
+                make_card("d", customFields=[{"_id": "cf2", "value": "9"}]),
+                make_card("e", customFields=[{"_id": "cf2", "value": "n/a"}]),
+            ]
+        )
+        assert self.ids(mirror, "cf.cf2>5") == ["c", "d"]
+        assert self.ids(mirror, "cf.cf2<=9.5") == ["d"]
+        assert self.ids(mirror, "cf.cf2>-1") == ["c", "d"]
+
+    def test_sort_and_limit(self, mirror):
+        assert self.ids(mirror, "", order_by="-due") == ["b", "a", "c"]
+        assert self.ids(mirror, "", limit=1) == ["a"]
+
+    def test_invalid_queries(self, mirror):
+        queries = ("colour=red", "due~soon", "due<someday", "assignee", "archived=true")
+        for query in queries:
+            with pytest.raises(ValueError):
+                mirror.query(query)
+
+    def test_indexes_are_used(self, mirror):
+        where, params = compile_query(parse_query("assignee=u1"))
+        plan = mirror.conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT c.id FROM cards c WHERE {where}", params
+        ).fetchall()
+        assert any("card_assignees_user" in row[-1] for row in plan)
+
+
+class TestSearch:
+    def test_covers_titles_comments_and_checklist_items(self, client, mirror):
+        sync(client, mirror)
+        assert {h.card.cardId for h in mirror.search("do it")} == {"c1", "c2"}
+        assert {h.card.cardId for h in mirror.search("hi")} == {"c1", "c2"}
+        assert [h.card.cardId for h in mirror.search("sec")] == ["c2"]
+        assert mirror.search("nothing-like-this") == []
+
+    def test_title_ranks_above_comments(self, mirror):
+        mirror.put_cards(
+            [make_card("a", title="Deploy"), make_card("b", title="Other")]
+        )
+        comment = Comment.model_validate(
+            {"_id": "m1", "comment": "deploy later", "authorId": "u1"}
+        )
+        mirror.replace_card_children("b", "b1", [comment], [])
+        assert [h.card.cardId for h in mirror.search("deploy")] == ["a", "b"]
+        assert "[deploy]" in mirror.search("deploy")[1].snippet
+
+    def test_index_follows_updates_and_deletes(self, client, mirror, server):
+        sync(client, mirror)
+        server.cards["c2"] = server.card("c2", "Renamed", modified=T1)
+        del server.cards["c1"]
+        sync(client, mirror)
+        assert mirror.search("second") == []
+        assert [h.card.cardId for h in mirror.search("renamed")] == ["c2"]
+        assert [h.card.cardId for h in mirror.search("hi")] == ["c2"]
+
+    def test_operators_are_plain_words(self, mirror):
+        mirror.put_cards([make_card("a", title="Fix NOT working")])
+        assert [h.card.cardId for h in mirror.search('not "fix not" -- (')] == ["a"]
+
+    def test_arguments_with_spaces_are_phrases(self, mirror):
+        mirror.put_cards(
+            [make_card("a", title="Fix it now"), make_card("b", title="Now fix it")]
+        )
+        assert [h.card.cardId for h in mirror.search(["fix it", "now"])] == ["a", "b"]
+        assert [h.card.cardId for h in mirror.search(["now fix"])] == ["b"]
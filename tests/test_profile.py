@@ -0,0 +1,93 @@
+"""
+Tests for --profile and --trace-malloc.
+"""
+
+import pstats
+
+import pytest
+
+from wekan.cli.cli import build_parser, main
+from wekan.cli.profile import PHASES, _union
+from wekan.testing import DatasetSpec, FakeWeKanServer, generate
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeWeKanServer(generate(DatasetSpec(cards=50, lists=1))) as server:
+        yield server
+
+
+@pytest.fixture
+def wekancli(server, tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("WEKAN_CACHE_DIR", str(tmp_path))
+    (board_id,) = server.store.collections["boards"]
+    list_id = server.store.find("lists", boardId=board_id)[0]["_id"]
+
+    def run(*options: str) -> str:
+        connection = ["--url", server.url, "--username", "admin", "--password", "admin"]
+        main([*connection, *options, "list", "cards", board_id, "--list-id", list_id])
+        return capsys.readouterr().err
+
+    return run
+
+
+def _phases(err: str) -> dict[str, float]:
+    start = err.index("Phases (wall time):\n")
+    lines = err[start:].splitlines()[1 : len(PHASES) + 3]
+    return {
+        line[:16].strip(): float(line[16:].split("ms")[0]) for line in lines
+    }
+
+
+def test_profile_option():
+    parser = build_parser()
+    assert parser.parse_args(["list", "boards"]).profile is None
+    args = parser.parse_args(["--profile", "list", "boards"])
+    assert (args.profile, args.action) == ("", "list")
+    assert parser.parse_args(["--profile=out.prof", "list", "boards"]).profile == (
+        "out.prof"
+    )
+
+
+def test_profile_option_only_among_global_options():
+    parser = build_parser()
+    args = parser.parse_args(["--format", "json", "--profile", "list", "boards"])
+    assert (args.profile, args.format) == ("", "json")
+    # Values of other options and arguments of the action are left alone
+    for argv in (
+        ["--url", "--profile", "list", "boards"],
+        ["create", "card", "b1", "l1", "--profile"],
+        ["--", "--profile"],
+    ):
+        assert parser._bare_profile(argv) == argv
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--prof=out.prof", "list", "boards"])
+
+
+def test_union():
+    assert _union([]) == 0
+    assert _union([(0, 2), (1, 3), (5, 6), (5.5, 5.75)]) == 4
+
+
+def test_profile(wekancli):
+    err = wekancli("--profile")
+    phases = _phases(err)
+    assert list(phases) == [*PHASES, "other", "total"]
+    assert phases["network wait"] > 0 and phases["validation"] > 0
+    assert max(phases.values()) == phases["total"]
+    assert "Ordered by: cumulative time" in err
+
+
+def test_profile_file(wekancli, tmp_path):
+    path = tmp_path / "out.prof"
+    err = wekancli(f"--profile={path}")
+    assert f"Profile written to {path}" in err
+    assert "Ordered by" not in err
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_trace_malloc(wekancli):
+    err = wekancli("--trace-malloc")
+    assert err.startswith("Peak traced memory: ")
+    assert "Top allocation sites at output:" in err
+    assert "Phases" not in err
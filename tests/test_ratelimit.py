@@ -0,0 +1,71 @@
+"""
+Tests for the token-bucket rate limiter.
+"""
+
+import pytest
+
+from wekan.client import FileTokenBucket, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_burst_then_steady_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        assert bucket.acquire() == 0
+    # Bucket drained; each further token costs 1/rate seconds
+    for _ in range(10):
+        bucket.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_refill_is_capped_at_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=2, clock=clock, sleep=clock.sleep)
+    clock.now = 100
+    bucket.acquire()
+    bucket.acquire()
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_reads_and_writes_use_separate_buckets():
+    clock = FakeClock()
+    read = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+    write = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+    limiter = RateLimiter(read=read, write=write)
+    assert limiter.acquire("GET") == 0
+    assert limiter.acquire("POST") == 0
+    assert limiter.acquire("put") == pytest.approx(1.0)
+
+
+def test_unlimited_when_bucket_missing():
+    limiter = RateLimiter.create(read_rate=None, write_rate=None)
+    assert limiter.acquire("GET") == 0
+    assert limiter.acquire("DELETE") == 0
+
+
+def test_file_bucket_shares_budget(tmp_path):
+    path = tmp_path / "ratelimit.json"
+    waits: list[float] = []
+    first = FileTokenBucket(path, "srv:read", rate=0.001, burst=1, sleep=waits.append)
+    second = FileTokenBucket(path, "srv:read", rate=0.001, burst=1)
+    assert first.acquire() == 0
+    # The other instance sees the drained bucket through the shared file
+    assert second._reserve(1) > 0
+    other = FileTokenBucket(path, "srv:write", rate=0.001, burst=1)
+    assert other.acquire() == 0
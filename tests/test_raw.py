@@ -0,0 +1,89 @@
+"""
+Tests for raw passthrough (--raw, WeKanClient.get_raw and the api action).
+"""
+
+import io
+
+import pytest
+import requests
+
+from wekan.cli.cli import build_parser
+from wekan.cli.handlers._helpers import CommandError
+from wekan.client import WeKanAPIError, WeKanClient
+
+# Spacing and key order that re-serializing would not preserve
+CARD = b'{"_id":"c1",  "title":"T","boardId":"b1","zzz":1}'
+
+
+def _response(status: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.fixture
+def routes():
+    return {}
+
+
+@pytest.fixture
+def client(routes):
+    c = WeKanClient("http://a", token="t")
+
+    def request(method, url, **kwargs):
+        return _response(200, routes.get(url.removeprefix("http://a"), b""))
+
+    c.session.request = request  # type: ignore[method-assign]
+    return c
+
+
+def run(client, *argv):
+    args = build_parser().parse_args(list(argv))
+    args.format = args.format or "json"
+    args.handler(client, args)
+
+
+class TestGetRaw:
+    def test_returns_body_unparsed(self, client, routes):
+        routes["/api/cards/c1"] = CARD
+        assert client.get_raw("/api/cards/{card_id}", card_id="c1") == CARD
+        assert client.get_raw("/api/cards/{card_id}", card_id="c2") is None
+
+    def test_api_errors_still_raise(self, client, routes):
+        routes["/api/boards"] = (
+            b'{"error": "Unauthorized", "reason": "no", "message": "",'
+            b' "statusCode": 401}'
+        )
+        with pytest.raises(WeKanAPIError):
+            client.get_raw("/api/boards")
+
+
+class TestRawCommands:
+    def test_get_passes_body_through(self, client, routes, capsys):
+        routes["/api/cards/c1"] = CARD
+        run(client, "get", "card", "c1", "--raw")
+        assert capsys.readouterr().out == CARD.decode() + "\n"
+
+    def test_get_not_found(self, client, capsys):
+        with pytest.raises(CommandError) as exc_info:
+            run(client, "get", "card", "c2", "--raw")
+        assert exc_info.value.message == "Card not found"
+
+    def test_list_passes_body_through(self, client, routes, capsys):
+        routes["/api/boards/b1/lists"] = b'[{"_id":"l1","title":"Todo"}]'
+        run(client, "list", "lists", "b1", "--raw")
+        assert capsys.readouterr().out == '[{"_id":"l1","title":"Todo"}]\n'
+
+    def test_api_streams_json(self, client, routes, capsys):
+        routes["/api/cards/c1"] = CARD
+        run(client, "api", "cards", "c1")
+        assert capsys.readouterr().out == CARD.decode() + "\n"
+        run(client, "--format", "json-pretty", "api", "cards", "c1")
+        assert '  "zzz": 1' in capsys.readouterr().out
+
+    def test_api_path_is_not_a_template(self, client, routes, capsys):
+        routes["/api/boards/{x}"] = b"[]"
+        run(client, "api", "boards/{x}")
+        assert capsys.readouterr().out == "[]\n"
@@ -0,0 +1,114 @@
+"""
+Tests for RetryPolicy and WeKanClient retry handling.
+"""
+
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from wekan.client import RetryPolicy, WeKanClient
+from wekan.client.retry import _parse_retry_after
+
+
+def _response(status: int, body: bytes = b"[]", headers: dict | None = None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls: list[float] = []
+    monkeypatch.setattr("wekan.client.client.time.sleep", calls.append)
+    return calls
+
+
+def _client(responses, **policy) -> WeKanClient:
+    client = WeKanClient(
+        "http://localhost", token="t", retry=RetryPolicy(jitter=False, **policy)
+    )
+    queue = list(responses)
+
+    def fake_request(method, url, **kwargs):
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client.session.request = fake_request  # type: ignore[method-assign]
+    return client
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, jitter=False)
+        assert [policy.delay(a) for a in range(4)] == [0.5, 1.0, 2.0, 4.0]
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=3, jitter=False)
+        assert policy.delay(10) == 3
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_factor=1)
+        assert all(0 <= policy.delay(2) <= 4 for _ in range(50))
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy()
+        assert policy.delay(0, _response(429, headers={"Retry-After": "7"})) == 7
+
+    def test_retry_after_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=20)
+        delay = _parse_retry_after(format_datetime(when, usegmt=True))
+        assert delay is not None and 15 < delay <= 20
+
+    def test_post_not_retried_by_default(self):
+        policy = RetryPolicy()
+        assert not policy.is_retryable("POST", 0, _response(503))
+        assert policy.is_retryable("GET", 0, _response(503))
+
+    def test_post_opt_in(self):
+        policy = RetryPolicy(methods=frozenset({"GET", "POST"}))
+        assert policy.is_retryable("POST", 0, _response(503))
+
+
+class TestClientRetry:
+    def test_retries_then_succeeds(self, sleeps):
+        client = _client([_response(502), _response(503), _response(200)])
+        assert client.get_boards() == []
+        assert sleeps == [0.5, 1.0]
+        assert client.retry_stats.as_dict() == {
+            "retries": 2,
+            "exhausted": 0,
+            "reasons": {"502": 1, "503": 1},
+        }
+
+    def test_connection_error_retried(self, sleeps):
+        client = _client([requests.ConnectionError("reset"), _response(200)])
+        assert client.get_boards() == []
+        assert client.retry_stats.reasons == {"ConnectionError": 1}
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        client = _client([_response(503)] * 3, max_retries=2)
+        with pytest.raises(requests.HTTPError):
+            client.get_boards()
+        assert len(sleeps) == 2
+
+    def test_budget_is_shared_across_requests(self, sleeps):
+        client = _client([_response(503), _response(200), _response(503)], budget=1)
+        assert client.get_boards() == []
+        with pytest.raises(requests.HTTPError):
+            client.get_boards()
+        assert client.retry_stats.retries == 1
+        assert client.retry_stats.exhausted == 1
+
+    def test_post_fails_fast(self, sleeps):
+        client = _client([_response(503, b"{}")])
+        with pytest.raises(requests.HTTPError):
+            client.create_list("b1", "List")
+        assert sleeps == []
@@ -0,0 +1,111 @@
+"""
+Tests for WeKanClient request hooks, RequestStats and --stats.
+"""
+
+import contextvars
+
+import pytest
+
+from wekan.cli.cli import main
+from wekan.client import (
+    RequestEvent,
+    RequestStats,
+    ResponseEvent,
+    RetryPolicy,
+    WeKanAPIError,
+    WeKanClient,
+)
+from wekan.testing import FakeWeKanServer
+
+
+@pytest.fixture
+def server():
+    with FakeWeKanServer() as server:
+        yield server
+
+
+def _event(route: str, duration: float, status: int | None = 200) -> ResponseEvent:
+    return ResponseEvent("GET", route, "http://a" + route, 0, status, 10, duration)
+
+
+class TestRequestStats:
+    def test_percentiles(self):
+        stats = RequestStats()
+        for ms in range(1, 101):
+            stats(_event("/api/boards", ms / 1000))
+        stats(_event("/api/user", 0.5, status=None))
+        stats(_event("/api/user", 0.5, status=404))
+
+        boards, user = stats.as_dict().values()
+        assert boards["count"] == 100 and boards["errors"] == 0
+        assert boards["bytes"] == 1000
+        assert (boards["p50"], boards["p95"], boards["p99"]) == (0.05, 0.095, 0.099)
+        assert user["errors"] == 2
+
+    def test_summary(self):
+        stats = RequestStats()
+        assert stats.summary() == "No requests sent"
+        stats(_event("/api/boards", 0.0123))
+        header, row = stats.summary().splitlines()
+        assert header.split() == "endpoint count errors bytes p50 p95 p99".split()
+        assert row.split()[:4] == ["GET", "/api/boards", "1", "0"]
+        assert "12.3ms" in row
+
+
+class TestHooks:
+    def test_events(self, server):
+        before: list[RequestEvent] = []
+        after: list[ResponseEvent] = []
+        client = WeKanClient(
+            server.url,
+            token=server.login_token(),
+            before_request=[before.append],
+            after_response=[after.append],
+        )
+        board = server.store.add_board("B", server.admin["_id"])
+        client.get_board(board["_id"])
+
+        assert [(e.method, e.route, e.attempt) for e in before] == [
+            ("GET", "/api/boards/{board_id}", 0)
+        ]
+        (event,) = after
+        assert event.url == f"{server.url}/api/boards/{board['_id']}"
+        assert event.status == 200 and event.error is None
+        assert event.bytes > 0 and event.duration > 0
+
+    def test_every_attempt_is_reported(self, server):
+        server.set_behavior("GET /api/boards", error_rate=1, retry_after=0)
+        stats = RequestStats()
+        client = WeKanClient(
+            server.url,
+            token=server.login_token(),
+            retry=RetryPolicy(max_retries=2, jitter=False),
+            after_response=[stats],
+        )
+        with pytest.raises(WeKanAPIError):
+            client.get_boards()
+        endpoint = stats.as_dict()["GET /api/boards"]
+        assert (endpoint["count"], endpoint["errors"]) == (3, 3)
+
+    def test_gather_keeps_the_callers_context(self, server):
+        current = contextvars.ContextVar("current", default=None)
+        seen = []
+        client = WeKanClient(
+            server.url,
+            token=server.login_token(),
+            after_response=[lambda event: seen.append(current.get())],
+        )
+        current.set("caller")
+        client.gather([client.get_boards] * 4, max_workers=4)
+        assert seen == ["caller"] * 4
+
+
+def test_stats_flag(server, tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("WEKAN_CACHE_DIR", str(tmp_path))
+    url, token = server.url, server.login_token()
+    main(["--url", url, "--token", token, "--stats", "list", "boards"])
+    err = capsys.readouterr().err
+    assert err.splitlines()[1].split()[:3] == ["GET", "/api/boards", "1"]
+
+    main(["--url", url, "--token", token, "list", "boards"])
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,134 @@
+"""
+Tests for TokenCache and WeKanClient login reuse.
+"""
+
+import io
+import json
+import stat
+import threading
+import time
+
+import pytest
+import requests
+
+from wekan.client import LoginResponse, TokenCache, WeKanClient
+
+EXPIRES = "2099-01-01T00:00:00.000Z"
+
+
+def _response(status: int, data) -> requests.Response:
+    body = json.dumps(data).encode()
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _login(token: str, expires: str = EXPIRES) -> LoginResponse:
+    return LoginResponse(userId="u1", token=token, tokenExpires=expires)
+
+
+class FakeServer:
+    """Accepts only the token it issued most recently."""
+
+    def __init__(self, delay: float = 0):
+        self.logins = 0
+        self.token = "issued-0"
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def install(self, client: WeKanClient) -> WeKanClient:
+        def request(method, url, **kwargs):
+            if url.endswith("/users/login"):
+                time.sleep(self.delay)
+                with self.lock:
+                    self.logins += 1
+                    self.token = f"issued-{self.logins}"
+                return _response(
+                    200, {"id": "u1", "token": self.token, "tokenExpires": EXPIRES}
+                )
+            if client.session.headers.get("Authorization") != f"Bearer {self.token}":
+                return _response(401, {"statusCode": 401})
+            return _response(200, [])
+
+        client.session.request = request  # type: ignore[method-assign]
+        return client
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TokenCache(tmp_path / "tokens.json")
+
+
+class TestTokenCache:
+    def test_put_and_get(self, cache):
+        assert cache.get("http://a", "alice") is None
+        cache.put("http://a", "alice", _login("t1"))
+        assert cache.get("http://a", "alice") == _login("t1")
+        assert cache.get("http://a", "bob") is None
+        assert cache.get("http://b", "alice") is None
+
+    def test_file_is_private(self, cache):
+        cache.path.write_text("{}")
+        cache.path.chmod(0o644)
+        cache.put("http://a", "alice", _login("t1"))
+        assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+
+    def test_expiring_tokens_are_not_returned(self, tmp_path):
+        now = time.time()
+        cache = TokenCache(tmp_path / "t.json", margin=60, clock=lambda: now)
+        cache.put("http://a", "alice", _login("t1", "2000-01-01T00:00:00Z"))
+        assert cache.get("http://a", "alice") is None
+        soon = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now + 30))
+        cache.put("http://a", "alice", _login("t1", soon))
+        assert cache.get("http://a", "alice") is None
+
+    def test_discard_only_the_rejected_token(self, cache):
+        cache.put("http://a", "alice", _login("t2"))
+        cache.discard("http://a", "alice", "t1")
+        assert cache.get("http://a", "alice").token == "t2"
+        cache.discard("http://a", "alice", "t2")
+        assert cache.get("http://a", "alice") is None
+
+
+class TestClientLogin:
+    def test_authenticate_reuses_cached_login(self, cache):
+        server = FakeServer()
+        first = server.install(
+            WeKanClient("http://a", "alice", "pw", token_cache=cache)
+        )
+        first.authenticate()
+        second = server.install(
+            WeKanClient("http://a", "alice", "pw", token_cache=cache)
+        )
+        assert second.authenticate().token == "issued-1"
+        assert second.get_boards() == []
+        assert server.logins == 1
+
+    def test_rejected_token_is_replaced(self, cache):
+        server = FakeServer()
+        cache.put("http://a", "alice", _login("stale"))
+        client = server.install(
+            WeKanClient("http://a", "alice", "pw", token_cache=cache)
+        )
+        client.authenticate()
+        assert client.get_boards() == []
+        assert server.logins == 1
+        assert cache.get("http://a", "alice").token == client.token == "issued-1"
+
+    def test_concurrent_rejections_log_in_once(self, cache):
+        server = FakeServer(delay=0.05)
+        client = server.install(
+            WeKanClient("http://a", "alice", "pw", token="stale", token_cache=cache)
+        )
+        results = client.gather([client.get_boards] * 8, max_workers=8)
+        assert results == [[]] * 8
+        assert server.logins == 1
+
+    def test_token_only_client_does_not_log_in(self):
+        server = FakeServer()
+        client = server.install(WeKanClient("http://a", token="stale"))
+        with pytest.raises(requests.HTTPError):
+            client.get_boards()
+        assert server.logins == 0